@@ -15,7 +15,7 @@ export default function EventDetail() {
   const [copied, setCopied] = useState(false)
 
   useEffect(() => {
-    axios.get(`/api/events/${id}`)
+    axios.get(`/api/events/${id}/full`)
       .then(r => {
         setEvent(r.data)
         setLoading(false)
@@ -7,18 +7,19 @@ export default function EventList() {
   const [events, setEvents] = useState([])
   const [stats, setStats] = useState({ total_events: 0, total_attendees: 0, total_rsvps: 0 })
   const [loading, setLoading] = useState(true)
+  const [page, setPage] = useState(1)
+  const [hasMore, setHasMore] = useState(false)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [searchTerm, setSearchTerm] = useState('')
   const [filterType, setFilterType] = useState('all')
 
   useEffect(() => {
-    // Fetch events and stats in parallel
-    Promise.all([
-      axios.get('/api/events'),
-      axios.get('/api/stats')
-    ])
-      .then(([eventsRes, statsRes]) => {
-        setEvents(eventsRes.data)
-        setStats(statsRes.data)
+    // Events, stats and the user's RSVPs come from a single request
+    axios.get('/api/bootstrap')
+      .then(r => {
+        setEvents(r.data.events)
+        setStats(r.data.stats)
+        setHasMore(r.data.has_more)
         setLoading(false)
       })
       .catch(() => {
@@ -27,6 +28,18 @@ export default function EventList() {
       })
   }, [])
 
+  function loadMore() {
+    setLoadingMore(true)
+    axios.get('/api/bootstrap', { params: { page: page + 1 } })
+      .then(r => {
+        setEvents(prev => [...prev, ...r.data.events])
+        setStats(r.data.stats)
+        setHasMore(r.data.has_more)
+        setPage(page + 1)
+      })
+      .finally(() => setLoadingMore(false))
+  }
+
   const filteredEvents = events.filter(event => {
     const matchesSearch = event.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
                           event.venue?.toLowerCase().includes(searchTerm.toLowerCase()) ||
@@ -273,6 +286,14 @@ export default function EventList() {
             </div>
           )}
 
+          {!loading && hasMore && (
+            <div className="flex justify-center mt-12">
+              <button onClick={loadMore} disabled={loadingMore} className="btn-secondary">
+                {loadingMore ? 'Loading...' : 'Load more events'}
+              </button>
+            </div>
+          )}
+
           {/* Empty State */}
           {!loading && filteredEvents.length === 0 && (
             <div className="text-center py-20">
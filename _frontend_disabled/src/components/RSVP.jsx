@@ -30,9 +30,10 @@ export default function RSVP() {
   const [statusDropdownOpen, setStatusDropdownOpen] = useState(false)
 
   useEffect(() => {
-    axios.get(`/api/events/${id}`)
+    axios.get(`/api/events/${id}/full`)
       .then(r => {
         setEvent(r.data)
+        setSuccess(Boolean(r.data.my_rsvp))  // already registered
         setLoading(false)
       })
       .catch(() => {
@@ -1,16 +1,46 @@
 import os
+import re
 import uuid
 import base64
+import contextlib
+import functools
+import gzip
+import hashlib
+import hmac
+import struct
+import json
+import mimetypes
+import multiprocessing
+import time
+import queue
+import secrets
+import tempfile
+import threading
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dotenv import load_dotenv
 from datetime import datetime, timedelta, timezone
-from flask import Flask, render_template, redirect, url_for, request, flash, send_file, jsonify
+from flask import Flask, Response, render_template, redirect, url_for, request, flash, send_file, send_from_directory, jsonify, g, has_app_context, has_request_context, stream_with_context
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SecureCookieSessionInterface, SessionInterface
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session as RoutingBaseSession
+from sqlalchemy import create_engine, event as sa_event, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.orm import make_transient_to_detached, object_session, with_loader_criteria
 from flask_wtf import FlaskForm
 from wtforms import StringField, TextAreaField, DateTimeField, SelectField, FileField, SubmitField, PasswordField
 from wtforms.validators import DataRequired, Email, Optional
+from itsdangerous import BadSignature, Signer
+from markupsafe import escape
 from flask_login import LoginManager, login_user, logout_user, login_required, UserMixin, current_user
+from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.security import safe_join
 from werkzeug.utils import secure_filename
 import csv
+import click
 import io
 import smtplib
 from email.message import EmailMessage
@@ -25,12 +55,45 @@ try:
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import letter, A4
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
+    from reportlab.lib.units import inch, mm
     from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.pdfgen import canvas as pdf_canvas
     REPORTLAB_AVAILABLE = True
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
+# Optional: pypdf for merging badge sheet chunks rendered in parallel
+try:
+    from pypdf import PdfWriter
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+# Optional: rjsmin/rcssmin for tighter static asset minification
+try:
+    import rjsmin
+    import rcssmin
+    MINIFIERS_AVAILABLE = True
+except ImportError:
+    MINIFIERS_AVAILABLE = False
+
+# Optional: pyarrow for Parquet/Arrow attendance exports
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional: msgpack as a compact alternative to JSON for the SPA bootstrap API
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 # Optional: qrcode for QR generation
 try:
     import qrcode
@@ -53,6 +116,14 @@ basedir = os.path.abspath(os.path.dirname(__file__))
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'change-me')
 
+# Reverse proxies in front of the app. Vercel and Heroku route through one that
+# sets X-Forwarded-For; elsewhere set TRUSTED_PROXY_HOPS to the number of
+# proxies, or every client shares the proxy's address (and its rate limits).
+TRUSTED_PROXY_HOPS = int(os.environ.get('TRUSTED_PROXY_HOPS',
+                                        1 if os.environ.get('VERCEL') or os.environ.get('DYNO') else 0))
+if TRUSTED_PROXY_HOPS:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_HOPS, x_proto=TRUSTED_PROXY_HOPS)
+
 # Database configuration - Use PostgreSQL (Supabase) in production, SQLite locally
 database_url = os.environ.get('DATABASE_URL')
 if database_url:
@@ -136,25 +207,321 @@ def upload_to_supabase(file_data, filename):
         traceback.print_exc()
         return None
 
-db = SQLAlchemy(app)
+# Read replica
+# With DATABASE_REPLICA_URL set, views marked @reads_from_replica run their
+# SELECTs on the replica bind so analytics and exports stay off the primary.
+# Writes, raw SQL and every query after the session's first flush go to the
+# primary. A single query can opt in or out with
+# .execution_options(replica=True/False). After a request that wrote, the
+# client gets a short-lived fence cookie and reads from the primary until the
+# replica has had REPLICA_READ_YOUR_WRITES_SECONDS to catch up.
+replica_url = os.environ.get('DATABASE_REPLICA_URL')
+if replica_url:
+    if replica_url.startswith('postgres://'):
+        replica_url = replica_url.replace('postgres://', 'postgresql://', 1)
+    app.config['SQLALCHEMY_BINDS'] = {'replica': replica_url}
+REPLICA_READ_YOUR_WRITES_SECONDS = int(os.environ.get('REPLICA_READ_YOUR_WRITES_SECONDS', 5))
+REPLICA_FENCE_COOKIE = 'replica_fence'
+
+
+class ReplicaRoutingSession(RoutingBaseSession):
+    """Session that sends replica-eligible reads to the 'replica' bind."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, replica=None, **kwargs):
+        primary = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        engine = self._db.engines.get('replica')
+        if (engine is None or bind is not None or self._flushing or self.info.get('wrote_primary')
+                or isinstance(clause, (UpdateBase, TextClause))):
+            return primary
+        use_replica = replica
+        if use_replica is None:
+            use_replica = has_app_context() and g.get('db_replica', False)
+        return engine if use_replica else primary
+
+
+db = SQLAlchemy(app, session_options={'class_': ReplicaRoutingSession})
 CORS(app, supports_credentials=True)
-Compress(app)  # Enable gzip/brotli compression
+
+
+@sa_event.listens_for(db.session, 'after_flush')
+def _pin_to_primary(session, flush_context):
+    # Once this session has written, its later reads must see those writes
+    session.info['wrote_primary'] = True
+    if has_request_context():
+        g.db_wrote = True
+
+
+@sa_event.listens_for(db.session, 'do_orm_execute')
+def _route_by_execution_option(orm_execute_state):
+    # execution_options(replica=...) reaches get_bind as a bind argument
+    if 'replica' in orm_execute_state.execution_options:
+        orm_execute_state.bind_arguments['replica'] = orm_execute_state.execution_options['replica']
+
+
+def _replica_fenced():
+    try:
+        return float(request.cookies.get(REPLICA_FENCE_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def reads_from_replica(view):
+    """Run the view's queries on the read replica, unless the client just wrote."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_replica = 'replica' in db.engines and not _replica_fenced()
+        return view(*args, **kwargs)
+    return wrapper
+
+
+@contextlib.contextmanager
+def reads_from_primary():
+    """Run the block's queries (lazy loads included) on the primary inside a replica view."""
+    previous = g.get('db_replica', False)
+    g.db_replica = False
+    try:
+        yield
+    finally:
+        g.db_replica = previous
+
+
+@app.after_request
+def set_replica_fence(response):
+    if (g.get('db_wrote') and 'replica' in db.engines
+            and request.method not in ('GET', 'HEAD', 'OPTIONS')):
+        response.set_cookie(REPLICA_FENCE_COOKIE, str(int(time.time()) + REPLICA_READ_YOUR_WRITES_SECONDS),
+                            max_age=REPLICA_READ_YOUR_WRITES_SECONDS, httponly=True, samesite='Lax')
+    return response
+
+# Dynamic compression covers HTML, JSON, ICS and CSV. CSS, JS and SVG are
+# left out: they are static and ship precompressed (see precompress_static), so
+# the small generated /sw.js goes out uncompressed. Streamed responses (live
+# feed, exports) must not be buffered by a compressor.
+app.config['COMPRESS_MIMETYPES'] = [
+    'text/html', 'text/plain', 'text/xml', 'text/csv', 'text/calendar',
+    'application/json', 'application/manifest+json', 'application/msgpack', 'application/xml',
+]
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_STREAMS'] = False
+# Brotli 5 / gzip 6 get most of the size win on 10-30 KB pages for a fraction
+# of the CPU of the maximum levels, which are left to the build step
+app.config['COMPRESS_BR_LEVEL'] = int(os.environ.get('COMPRESS_BR_LEVEL', 5))
+app.config['COMPRESS_LEVEL'] = int(os.environ.get('COMPRESS_LEVEL', 6))
+Compress(app)
 login_manager = LoginManager(app)
 
 # Cache control for static files
 @app.after_request
 def add_cache_headers(response):
-    # Cache static assets for 1 year
     if request.path.startswith('/static/'):
-        if any(request.path.endswith(ext) for ext in ['.css', '.js', '.woff', '.woff2', '.ttf', '.eot']):
-            response.cache_control.max_age = 31536000  # 1 year
-            response.cache_control.public = True
+        max_age = None
+        if _FINGERPRINTED_ASSET_RE.search(request.path):
+            # Built by `flask build-assets`: the name changes whenever the content does
+            max_age = 31536000  # 1 year
+            response.cache_control.immutable = True
+        elif any(request.path.endswith(ext) for ext in ['.css', '.js']):
+            # Unhashed sources (debug, or no build yet) can change on any deploy
+            max_age = 3600
+        elif any(request.path.endswith(ext) for ext in ['.woff', '.woff2', '.ttf', '.eot']):
+            max_age = 31536000  # 1 year
         elif any(request.path.endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.ico']):
-            response.cache_control.max_age = 2592000  # 30 days
+            max_age = 2592000  # 30 days
+        if max_age:
+            # send_file marks responses no-cache when SEND_FILE_MAX_AGE_DEFAULT is unset
+            response.cache_control.no_cache = None
+            response.cache_control.max_age = max_age
             response.cache_control.public = True
     return response
 login_manager.login_view = 'user_login'
 
+# Static asset pipeline
+# Page CSS and JS live under static/css and static/js. `flask build-assets`
+# minifies them into static/dist/ under content-hashed names and writes a
+# manifest mapping each source path to its build. Templates link assets with
+# asset_url(), which emits the hashed URL when the manifest has one (so the
+# file can be cached as immutable) and the plain static URL otherwise, e.g. in
+# debug mode or before the first build.
+ASSET_SOURCE_DIRS = ('css', 'js')
+ASSET_DIST_DIR = 'dist'
+ASSET_MANIFEST_PATH = os.path.join(app.static_folder, ASSET_DIST_DIR, 'manifest.json')
+_FINGERPRINTED_ASSET_RE = re.compile(r'^/static/' + ASSET_DIST_DIR + r'/.+\.[0-9a-f]{12}\.\w+$')
+_asset_manifest = None
+
+
+def minify_css(source):
+    if MINIFIERS_AVAILABLE:
+        return rcssmin.cssmin(source)
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,])\s*', r'\1', source)
+    return source.replace(';}', '}').strip()
+
+
+def minify_js(source):
+    if MINIFIERS_AVAILABLE:
+        return rjsmin.jsmin(source)
+    # Without rjsmin ship the source as is: even indentation and lines that
+    # look like comments can be part of a template literal or string
+    return source
+
+
+def build_assets(clean=False):
+    """Minify and fingerprint every source asset; returns the new manifest."""
+    static_dir = app.static_folder
+    dist_dir = os.path.join(static_dir, ASSET_DIST_DIR)
+    minifiers = {'.css': minify_css, '.js': minify_js}
+    manifest = {}
+    for source_dir in ASSET_SOURCE_DIRS:
+        for dirpath, _, filenames in os.walk(os.path.join(static_dir, source_dir)):
+            for filename in sorted(filenames):
+                stem, ext = os.path.splitext(filename)
+                if ext not in minifiers:
+                    continue
+                path = os.path.join(dirpath, filename)
+                name = os.path.relpath(path, static_dir).replace(os.sep, '/')
+                with open(path, encoding='utf-8') as f:
+                    data = minifiers[ext](f.read()).encode('utf-8')
+                digest = hashlib.sha256(data).hexdigest()[:12]
+                built = f"{ASSET_DIST_DIR}/{os.path.dirname(name)}/{stem}.{digest}{ext}"
+                out_path = os.path.join(static_dir, built)
+                os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                with open(out_path, 'wb') as f:
+                    f.write(data)
+                manifest[name] = built
+    if clean:
+        # Older builds are kept by default so pages cached before a deploy
+        # can still load the assets they reference
+        keep = set(manifest.values())
+        for dirpath, _, filenames in os.walk(dist_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if os.path.relpath(path, static_dir).replace(os.sep, '/') not in keep:
+                    os.remove(path)
+    os.makedirs(dist_dir, exist_ok=True)
+    tmp_path = ASSET_MANIFEST_PATH + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, ASSET_MANIFEST_PATH)
+    global _asset_manifest
+    _asset_manifest = None
+    return manifest
+
+
+def get_asset_manifest():
+    global _asset_manifest
+    if _asset_manifest is None:
+        try:
+            with open(ASSET_MANIFEST_PATH) as f:
+                _asset_manifest = json.load(f)
+        except (OSError, ValueError):
+            _asset_manifest = {}
+    return _asset_manifest
+
+
+@app.template_global()
+def asset_url(filename):
+    """url_for('static', ...) that points at the fingerprinted build of filename."""
+    if not app.debug:
+        filename = get_asset_manifest().get(filename, filename)
+    return url_for('static', filename=filename)
+
+
+# Text assets get .br/.gz siblings at maximum compression, served in place of
+# the original when the client accepts them (see send_static_asset)
+PRECOMPRESS_EXTENSIONS = ('.css', '.js', '.svg', '.json', '.txt', '.xml')
+STATIC_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def precompress_static():
+    """Write .gz (and .br, with brotli installed) siblings for static text assets; returns the count."""
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+    upload_dir = os.path.abspath(app.config['UPLOAD_FOLDER'])
+    written = 0
+    for dirpath, dirnames, filenames in os.walk(app.static_folder):
+        dirnames[:] = [d for d in dirnames if os.path.abspath(os.path.join(dirpath, d)) != upload_dir]
+        for filename in filenames:
+            if not filename.endswith(PRECOMPRESS_EXTENSIONS):
+                continue
+            path = os.path.join(dirpath, filename)
+            if os.path.getsize(path) < app.config['COMPRESS_MIN_SIZE']:
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                variants['.br'] = brotli.compress(data, quality=11)
+            for suffix, compressed in variants.items():
+                if len(compressed) >= len(data):
+                    continue
+                with open(path + suffix, 'wb') as f:
+                    f.write(compressed)
+                written += 1
+    return written
+
+
+def send_static_asset(filename):
+    """The static view, serving a precompressed sibling when the client accepts it."""
+    for encoding, suffix in STATIC_ENCODINGS:
+        if not request.accept_encodings[encoding]:
+            continue
+        source = safe_join(app.static_folder, filename)
+        if source is None or not os.path.isfile(source + suffix):
+            continue
+        if os.path.getmtime(source + suffix) < os.path.getmtime(source):
+            continue  # stale: the source changed after the last build
+        response = send_from_directory(
+            app.static_folder, filename + suffix,
+            mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream',
+            max_age=app.get_send_file_max_age(filename),
+        )
+        response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        return response
+    return app.send_static_file(filename)
+
+
+app.view_functions['static'] = send_static_asset
+
+
+@app.cli.command('build-assets')
+@click.option('--clean', is_flag=True, help='Delete builds that are not in the new manifest.')
+def build_assets_command(clean):
+    """Minify and fingerprint static CSS/JS into static/dist, then precompress static text assets."""
+    manifest = build_assets(clean=clean)
+    static_dir = app.static_folder
+    source_bytes = sum(os.path.getsize(os.path.join(static_dir, name)) for name in manifest)
+    built_bytes = sum(os.path.getsize(os.path.join(static_dir, built)) for built in manifest.values())
+    if not MINIFIERS_AVAILABLE:
+        click.echo('rjsmin/rcssmin not installed - using basic whitespace minification')
+    click.echo(f"Built {len(manifest)} assets: {source_bytes / 1024:.1f} KiB -> {built_bytes / 1024:.1f} KiB")
+    click.echo(f"Wrote {precompress_static()} precompressed files")
+
+# Service worker
+# Served from the site root so its scope covers every page. It precaches the
+# current build from the asset manifest under a versioned cache name, so a new
+# build installs a new worker and the old precache is dropped on activation.
+SW_PRECACHE_STATIC = ('logoo.svg', 'app-icon-192.png', 'manifest.json')
+SW_RUNTIME_MAX_ENTRIES = 60
+
+
+@app.route('/sw.js')
+def service_worker():
+    manifest = get_asset_manifest()
+    version = hashlib.sha256(json.dumps(manifest, sort_keys=True).encode()).hexdigest()[:12]
+    precache_urls = [url_for('static', filename=built) for built in sorted(manifest.values())]
+    precache_urls += [url_for('static', filename=filename) for filename in SW_PRECACHE_STATIC]
+    body = render_template('sw.js', version=version, precache_urls=precache_urls,
+                           runtime_max_entries=SW_RUNTIME_MAX_ENTRIES)
+    response = Response(body, mimetype='application/javascript')
+    # Browsers must revalidate the worker script to pick up new builds
+    response.cache_control.no_cache = True
+    response.set_etag(hashlib.sha256(body.encode()).hexdigest()[:32])
+    return response.make_conditional(request)
+
+
 # Google OAuth Setup
 try:
     from authlib.integrations.flask_client import OAuth
@@ -239,11 +606,22 @@ class Event(db.Model):
     venue = db.Column(db.String(256))
     poster = db.Column(db.String(256))
     creator_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
-    passcode = db.Column(db.String(64), nullable=True)  # Dashboard access passcode
+    passcode_hash = db.Column(db.String(64), unique=True, index=True, nullable=True)  # Keyed hash of the dashboard passcode
+    passcode_cleared_at = db.Column(db.DateTime, nullable=True)  # Legacy passcode dropped as a duplicate; organizer must set a new one
+    deleted_at = db.Column(db.DateTime, nullable=True, index=True)  # Soft delete; purged in the background
 
     creator = db.relationship('User', back_populates='events')
     attendances = db.relationship('Attendance', back_populates='event')
 
+    def set_passcode(self, passcode):
+        passcode = (passcode or '').strip()
+        self.passcode_hash = hash_passcode(passcode) if passcode else None
+        if passcode:
+            self.passcode_cleared_at = None
+
+    def check_passcode(self, passcode):
+        return bool(self.passcode_hash) and hmac.compare_digest(self.passcode_hash, hash_passcode(passcode))
+
 class Attendance(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey('event.id'))
@@ -257,25 +635,462 @@ class Attendance(db.Model):
     attendee = db.relationship('Attendee', back_populates='attendances')
     
     def generate_token(self):
-        """Generate a unique check-in token."""
-        self.check_in_token = str(uuid.uuid4())
+        """Generate a signed check-in token.
+
+        Signing needs the row's id and event_id, so flush before calling; an
+        unflushed attendance falls back to a random legacy token.
+        """
+        if self.id is None or self.event_id is None:
+            self.check_in_token = str(uuid.uuid4())
+        else:
+            self.check_in_token = sign_check_in_token(self.id, self.event_id)
         return self.check_in_token
 
+class EventAnalyticsSnapshot(db.Model):
+    """Precomputed analytics for one event.
+
+    Kept up to date with deltas while the event is live and frozen (never
+    recomputed) once it has ended. Attendee.status is a shared profile field
+    that later RSVPs rewrite, so the status breakdown is counted on view while
+    the event is live and only stored when the snapshot freezes.
+    """
+    event_id = db.Column(db.Integer, db.ForeignKey('event.id'), primary_key=True)
+    total_rsvps = db.Column(db.Integer, default=0, nullable=False)
+    checked_in_count = db.Column(db.Integer, default=0, nullable=False)
+    status_counts = db.Column(db.JSON, default=dict)     # {status: count}, stored only once frozen
+    rsvps_by_day = db.Column(db.JSON, default=dict)      # {'YYYY-MM-DD': count}
+    checkins_by_hour = db.Column(db.JSON, default=dict)  # {'HH:00': count}
+    recent_rsvps = db.Column(db.JSON, nullable=True)     # Stored only once frozen
+    frozen = db.Column(db.Boolean, default=False, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ReminderCampaign(db.Model):
+    """Delivery progress of the reminder email for one event."""
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey('event.id'), unique=True, nullable=False)
+    status = db.Column(db.String(16), default='pending', nullable=False)  # pending, sending, done, cancelled
+    total = db.Column(db.Integer, default=0, nullable=False)
+    sent = db.Column(db.Integer, default=0, nullable=False)
+    failed = db.Column(db.Integer, default=0, nullable=False)
+    last_attendance_id = db.Column(db.Integer, default=0, nullable=False)  # Resume cursor
+    heartbeat_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+class EventDeletion(db.Model):
+    """Background purge of a soft-deleted event's attendances and poster."""
+    event_id = db.Column(db.Integer, primary_key=True)  # No FK: outlives the event row
+    event_name = db.Column(db.String(256))
+    requested_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
+    requested_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    purge_after = db.Column(db.DateTime, nullable=False)  # End of the undo window
+    status = db.Column(db.String(16), default='pending', nullable=False)  # pending, purging, done
+    total = db.Column(db.Integer, default=0, nullable=False)
+    removed = db.Column(db.Integer, default=0, nullable=False)
+    heartbeat_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+
+@sa_event.listens_for(db.session, 'do_orm_execute')
+def _hide_deleted_events(state):
+    """Filter soft-deleted events out of every ORM query unless include_deleted is set."""
+    if (state.is_select and not state.is_column_load and not state.is_relationship_load
+            and not state.execution_options.get('include_deleted', False)):
+        state.statement = state.statement.options(
+            with_loader_criteria(Event, lambda cls: cls.deleted_at.is_(None), include_aliases=True))
+
+
+def live_attendances(*columns):
+    """Query Attendance (or columns) for events that are not soft-deleted.
+
+    The deleted-event criteria only apply where Event is part of the statement,
+    so queries that aggregate over Attendance alone must join it in.
+    """
+    return db.session.query(*(columns or (Attendance,))).select_from(Attendance).join(
+        Event, Event.id == Attendance.event_id)
+
+# Signed check-in tokens
+# Tokens are base32(version, attendance id, event id, key id, truncated HMAC),
+# 32 characters from the QR alphanumeric alphabet. The MAC key is derived per
+# event, so a scanner given only its event's key can validate tickets offline
+# without being able to forge tickets for other events. Older random UUID
+# tokens are still accepted via a database lookup.
+CHECKIN_TOKEN_VERSION = 1
+CHECKIN_TOKEN_MAC_BYTES = 10
+_CHECKIN_PAYLOAD = struct.Struct('>BIIB')
+_CHECKIN_TOKEN_LENGTH = 32
+_CHECKIN_TOKEN_ALPHABET = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ234567')
+
+def _load_check_in_keys():
+    """Parse CHECKIN_TOKEN_KEYS ("kid:secret,kid:secret", first is active).
+
+    Key id 0 is derived from SECRET_KEY and stays valid for verification unless
+    kid 0 is listed explicitly. To rotate, put a new kid first and keep the old
+    one until its tickets are retired (see `flask resign-checkin-tokens`).
+    """
+    keys = []
+    for entry in filter(None, (e.strip() for e in os.environ.get('CHECKIN_TOKEN_KEYS', '').split(','))):
+        kid, _, secret = entry.partition(':')
+        keys.append((int(kid), secret.encode()))
+    default_key = hmac.new(app.config['SECRET_KEY'].encode(), b'attendeez-checkin-token', hashlib.sha256).digest()
+    active_kid = keys[0][0] if keys else 0
+    return active_kid, {0: default_key, **dict(keys)}
+
+CHECKIN_ACTIVE_KID, CHECKIN_TOKEN_KEYS = _load_check_in_keys()
+
+def check_in_event_key(event_id, kid):
+    """Per-event MAC key, also handed to that event's scanners for offline checks."""
+    return hmac.new(CHECKIN_TOKEN_KEYS[kid], b'event:%d' % event_id, hashlib.sha256).digest()
+
+def sign_check_in_token(attendance_id, event_id, kid=None):
+    kid = CHECKIN_ACTIVE_KID if kid is None else kid
+    payload = _CHECKIN_PAYLOAD.pack(CHECKIN_TOKEN_VERSION, attendance_id, event_id, kid)
+    mac = hmac.new(check_in_event_key(event_id, kid), payload, hashlib.sha256).digest()[:CHECKIN_TOKEN_MAC_BYTES]
+    return base64.b32encode(payload + mac).decode('ascii')
+
+def is_signed_check_in_token(token):
+    return len(token) == _CHECKIN_TOKEN_LENGTH and set(token) <= _CHECKIN_TOKEN_ALPHABET
+
+def verify_check_in_token(token):
+    """Return (attendance_id, event_id, kid) for a valid signed token, else None."""
+    if not is_signed_check_in_token(token):
+        return None
+    raw = base64.b32decode(token)
+    payload, mac = raw[:_CHECKIN_PAYLOAD.size], raw[_CHECKIN_PAYLOAD.size:]
+    version, attendance_id, event_id, kid = _CHECKIN_PAYLOAD.unpack(payload)
+    if version != CHECKIN_TOKEN_VERSION or kid not in CHECKIN_TOKEN_KEYS:
+        return None
+    expected = hmac.new(check_in_event_key(event_id, kid), payload, hashlib.sha256).digest()[:CHECKIN_TOKEN_MAC_BYTES]
+    if not hmac.compare_digest(mac, expected):
+        return None
+    return attendance_id, event_id, kid
+
+def find_attendance_by_token(token):
+    """Resolve a scanned token to its Attendance (signed or legacy UUID)."""
+    if is_signed_check_in_token(token):
+        claims = verify_check_in_token(token)
+        attendance = db.session.get(Attendance, claims[0]) if claims else None
+        # Attendance ids can be reused (SQLite does after a purge), so the signed event must match too
+        return attendance if attendance is not None and attendance.event_id == claims[1] else None
+    return Attendance.query.filter_by(check_in_token=token).first()
+
 # Admin Organizer user (simple static single user for admin access)
 class Organizer:
     id = 'admin'
     username = os.environ.get('ORG_USER', 'admin')
     password = os.environ.get('ORG_PASS', 'password')
 
+# Per-process identity cache for Flask-Login. Holds a snapshot of the User
+# row's columns so authenticated requests (e.g. scanner check-in POSTs) can
+# skip the primary-key SELECT. Entries expire after USER_CACHE_TTL seconds and
+# are dropped whenever the row is updated or deleted in this process.
+app.config['USER_CACHE_TTL'] = int(os.environ.get('USER_CACHE_TTL', 30))
+USER_CACHE_MAX_ENTRIES = 1024
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+
+def _user_snapshot(user):
+    return {col.key: getattr(user, col.key) for col in User.__table__.columns}
+
+def invalidate_user_cache(user_id=None):
+    """Drop one cached user (or all when user_id is None)."""
+    with _user_cache_lock:
+        if user_id is None:
+            _user_cache.clear()
+        else:
+            _user_cache.pop(user_id, None)
+
+@sa_event.listens_for(User, 'after_update')
+@sa_event.listens_for(User, 'after_delete')
+def _invalidate_cached_user(mapper, connection, target):
+    invalidate_user_cache(target.id)
+
 @login_manager.user_loader
 def load_user(user_id):
     try:
         if user_id is None:
             return None
-        return User.query.get(int(user_id))
+        user_id = int(user_id)
     except (ValueError, TypeError):
         return None
 
+    ttl = app.config['USER_CACHE_TTL']
+    if ttl <= 0:
+        return db.session.get(User, user_id)
+
+    now = time.monotonic()
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+    if cached and cached[0] > now:
+        # Rebuild a clean detached instance and attach it without a SELECT
+        user = User(**cached[1])
+        make_transient_to_detached(user)
+        return db.session.merge(user, load=False)
+
+    user = db.session.get(User, user_id)
+    if user is not None:
+        with _user_cache_lock:
+            if len(_user_cache) >= USER_CACHE_MAX_ENTRIES:
+                _user_cache.clear()
+            _user_cache[user_id] = (now + ttl, _user_snapshot(user))
+    return user
+
+# Server-side sessions
+# The session cookie carries only a signed random id; the data lives in the
+# server_session table. Dashboard passcode grants are kept in the session as a
+# compact {event_id: expiry} map, so organizers who join many dashboards no
+# longer grow a cookie that is re-signed and re-sent on every request. Static
+# files never load the session, and a row is only rewritten when the session
+# changes or its expiry is more than SESSION_REFRESH_SECONDS old.
+# SESSION_BACKEND=cookie restores Flask's signed-cookie sessions.
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'sql')
+SESSION_REFRESH_SECONDS = 3600
+DASHBOARD_GRANT_TTL = timedelta(hours=int(os.environ.get('DASHBOARD_GRANT_HOURS', 12)))
+
+
+class ServerSessionRecord(db.Model):
+    __tablename__ = 'server_session'
+    id = db.Column(db.String(64), primary_key=True)
+    data = db.Column(db.Text, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+
+class ServerSession(SecureCookieSession):
+    """Session dict bound to a server_session row."""
+
+    def __init__(self, initial=None, sid=None, expires_at=None):
+        super().__init__(initial)
+        self.new = sid is None
+        self.sid = sid or secrets.token_urlsafe(32)
+        self.expires_at = expires_at
+        self.replaced_sid = None
+
+    def regenerate(self):
+        """Move the data to a fresh id; the old row is deleted on save."""
+        if not self.new and self.replaced_sid is None:
+            self.replaced_sid = self.sid
+        self.sid = secrets.token_urlsafe(32)
+        self.new = True
+        self.modified = True
+
+
+_session_engine = None
+_session_engine_lock = threading.Lock()
+
+
+def get_session_engine():
+    """Engine with its own pool for session rows.
+
+    save_session runs while the request still holds its ORM connection, so
+    borrowing from that pool could deadlock once every thread is waiting for
+    a second connection.
+    """
+    global _session_engine
+    with _session_engine_lock:
+        if _session_engine is None:
+            _session_engine = create_engine(db.engine.url, pool_pre_ping=True)
+        return _session_engine
+
+
+class SqlSessionInterface(SessionInterface):
+    serializer = TaggedJSONSerializer()
+
+    def get_signer(self, app):
+        return Signer(app.secret_key, salt='attendeez-session-id')
+
+    def _load_legacy_cookie(self, app, value):
+        """Data from a pre-server-side signed cookie session, so nobody is logged out."""
+        try:
+            data = SecureCookieSessionInterface().get_signing_serializer(app).loads(
+                value, max_age=int(app.permanent_session_lifetime.total_seconds()))
+        except BadSignature:
+            return None
+        expires = time.time() + DASHBOARD_GRANT_TTL.total_seconds()
+        grants = {}
+        for key in [k for k in data if k.startswith('event_') and k.endswith('_access')]:
+            if data.pop(key):
+                grants[key[len('event_'):-len('_access')]] = expires
+        if grants:
+            data['dashboard_grants'] = grants
+        return data
+
+    def open_session(self, app, request):
+        if request.path.startswith(app.static_url_path + '/'):
+            return None  # null session: static responses never touch it
+        value = request.cookies.get(self.get_cookie_name(app))
+        if not value:
+            return ServerSession()
+        try:
+            sid = self.get_signer(app).unsign(value).decode()
+        except BadSignature:
+            legacy = self._load_legacy_cookie(app, value)
+            session = ServerSession(legacy)
+            session.modified = bool(legacy)
+            return session
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        record = ServerSessionRecord.__table__
+        with get_session_engine().connect() as conn:
+            row = conn.execute(db.select(record.c.data, record.c.expires_at).where(
+                record.c.id == sid, record.c.expires_at > now)).first()
+        if row is None:
+            return ServerSession()  # expired or unknown: start over with a fresh id
+        return ServerSession(self.serializer.loads(row.data), sid, row.expires_at)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+        if session.accessed:
+            response.vary.add('Cookie')
+        record = ServerSessionRecord.__table__
+        if session.replaced_sid:
+            with get_session_engine().begin() as conn:
+                conn.execute(record.delete().where(record.c.id == session.replaced_sid))
+
+        if not session:
+            if session.modified and (session.replaced_sid or not session.new):
+                if not session.new:
+                    with get_session_engine().begin() as conn:
+                        conn.execute(record.delete().where(record.c.id == session.sid))
+                response.delete_cookie(name, domain=domain, path=path, secure=secure,
+                                       samesite=samesite, httponly=httponly)
+                response.vary.add('Cookie')
+            return
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        expires_at = now + app.permanent_session_lifetime
+        stale = (session.expires_at is None
+                 or (expires_at - session.expires_at).total_seconds() > SESSION_REFRESH_SECONDS)
+        if not (session.modified or stale):
+            return
+        values = {'data': self.serializer.dumps(dict(session)), 'expires_at': expires_at}
+        with get_session_engine().begin() as conn:
+            updated = 0 if session.new else conn.execute(
+                record.update().where(record.c.id == session.sid).values(**values)).rowcount
+            if not updated:
+                conn.execute(record.insert().values(id=session.sid, **values))
+        if session.new or session.permanent:
+            response.set_cookie(name, self.get_signer(app).sign(session.sid).decode(),
+                                expires=self.get_expiration_time(app, session), httponly=httponly,
+                                domain=domain, path=path, secure=secure, samesite=samesite)
+            response.vary.add('Cookie')
+
+
+if SESSION_BACKEND == 'sql':
+    app.session_interface = SqlSessionInterface()
+
+
+def regenerate_session():
+    """Issue a new session id when privileges change, so a planted id is useless.
+
+    Signed-cookie sessions carry no id and are left alone.
+    """
+    from flask import session
+    if isinstance(session, ServerSession):
+        session.regenerate()
+
+
+def grant_dashboard_access(event_id):
+    """Remember that this session entered the passcode for event_id."""
+    from flask import session
+    regenerate_session()
+    grants = {k: v for k, v in session.get('dashboard_grants', {}).items() if v > time.time()}
+    grants[str(event_id)] = time.time() + DASHBOARD_GRANT_TTL.total_seconds()
+    session['dashboard_grants'] = grants
+
+
+def has_dashboard_grant(event_id):
+    from flask import session
+    expires = session.get('dashboard_grants', {}).get(str(event_id))
+    return expires is not None and expires > time.time()
+
+
+@app.cli.command('purge-sessions')
+def purge_sessions_command():
+    """Delete expired server-side sessions."""
+    record = ServerSessionRecord.__table__
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    with db.engine.begin() as conn:
+        removed = conn.execute(record.delete().where(record.c.expires_at <= now)).rowcount
+    click.echo(f"Removed {removed} expired sessions")
+
+
+# Dashboard passcodes
+# Passcodes are stored as an HMAC under a server-side key, so join-dashboard
+# is one probe of a unique index and a leaked table does not reveal them.
+# Failed attempts draw from in-memory token buckets per client IP and per
+# event, which bounds guessing without locking anyone out for long.
+PASSCODE_HASH_KEY = (os.environ.get('PASSCODE_HASH_KEY', '').encode()
+                     or hmac.new(app.config['SECRET_KEY'].encode(), b'attendeez-passcode', hashlib.sha256).digest())
+
+
+def hash_passcode(passcode):
+    return hmac.new(PASSCODE_HASH_KEY, passcode.strip().encode(), hashlib.sha256).hexdigest()
+
+
+class TokenBucketLimiter:
+    """Per-process token buckets: capacity attempts, refilled at per_minute."""
+
+    def __init__(self, capacity, per_minute, max_keys=50000):
+        self.capacity = capacity
+        self.rate = per_minute / 60.0
+        self.max_keys = max_keys
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _level(self, key, now):
+        tokens, updated = self._buckets.get(key, (self.capacity, now))
+        return min(self.capacity, tokens + (now - updated) * self.rate)
+
+    def allowed(self, key):
+        with self._lock:
+            return self._level(key, time.monotonic()) >= 1
+
+    def consume(self, key):
+        now = time.monotonic()
+        with self._lock:
+            self._buckets[key] = (self._level(key, now) - 1, now)
+            if len(self._buckets) > self.max_keys:
+                # Buckets that have refilled completely carry no state
+                for k in [k for k in self._buckets if self._level(k, now) >= self.capacity]:
+                    del self._buckets[k]
+
+
+passcode_ip_limiter = TokenBucketLimiter(capacity=10, per_minute=5)
+passcode_event_limiter = TokenBucketLimiter(capacity=30, per_minute=30)
+
+
+def passcode_attempt_allowed(event_id=None):
+    if not passcode_ip_limiter.allowed(request.remote_addr):
+        return False
+    return event_id is None or passcode_event_limiter.allowed(event_id)
+
+
+def record_failed_passcode(event_id=None):
+    passcode_ip_limiter.consume(request.remote_addr)
+    if event_id is not None:
+        passcode_event_limiter.consume(event_id)
+
+
+def passcode_in_use(passcode, exclude_event_id=None):
+    """Whether another event (soft-deleted ones included) already has this passcode.
+
+    A collision tells the caller that some event uses the passcode, so it draws
+    from the same per-IP bucket as a wrong join-dashboard guess; check
+    passcode_attempt_allowed() first.
+    """
+    stmt = db.select(Event.id).where(Event.passcode_hash == hash_passcode(passcode))
+    if exclude_event_id is not None:
+        stmt = stmt.where(Event.id != exclude_event_id)
+    in_use = db.session.execute(stmt.limit(1), execution_options={'include_deleted': True}).first() is not None
+    if in_use:
+        passcode_ip_limiter.consume(request.remote_addr)
+    return in_use
+
+
 # Forms
 class EventForm(FlaskForm):
     name = StringField('Event Name', validators=[DataRequired()])
@@ -287,6 +1102,9 @@ class EventForm(FlaskForm):
     passcode = StringField('Dashboard Passcode', validators=[DataRequired()])
     submit = SubmitField('Publish Event')
 
+class EditEventForm(EventForm):
+    passcode = StringField('Dashboard Passcode', validators=[Optional()])  # Blank keeps the current passcode
+
 class AttendeeForm(FlaskForm):
     name = StringField('Full Name', validators=[DataRequired()])
     email = StringField('Email Address', validators=[DataRequired(), Email()])
@@ -341,6 +1159,141 @@ class ChangePasswordForm(FlaskForm):
     confirm_password = PasswordField('Confirm New Password', validators=[DataRequired()])
     submit = SubmitField('Change Password')
 
+# CDN caching
+# Public pages and APIs are identical for every anonymous visitor, so shared
+# caches (Vercel, Fastly, Cloudflare) may keep them for CDN_S_MAXAGE seconds
+# and serve stale copies while they refetch. Responses carry surrogate keys
+# (e.g. "events event-12"), and committed Event/User changes purge those keys
+# through cdn_purger, so edits show up at the edge without waiting for expiry.
+# Requests with a session or remember cookie are never marked shareable, and
+# Flask's "Vary: Cookie" keeps cached anonymous pages from logged-in users.
+CDN_S_MAXAGE = int(os.environ.get('CDN_S_MAXAGE', 60))
+CDN_STALE_WHILE_REVALIDATE = int(os.environ.get('CDN_STALE_WHILE_REVALIDATE', 600))
+CDN_SURROGATE_KEY_HEADER = os.environ.get('CDN_SURROGATE_KEY_HEADER', 'Surrogate-Key')  # Cache-Tag on Cloudflare
+
+
+class CDNPurger:
+    """Default purger: nothing to purge, edge copies simply expire."""
+
+    def purge(self, keys):
+        pass
+
+
+class RecordingCDNPurger(CDNPurger):
+    """Logs and remembers purged keys instead of calling a CDN (local runs and tests)."""
+
+    def __init__(self):
+        self.purged = []
+
+    def purge(self, keys):
+        self.purged.append(list(keys))
+        app.logger.info('CDN purge: %s', ' '.join(keys))
+
+
+class FastlyCDNPurger(CDNPurger):
+    """Purges surrogate keys with Fastly's batch purge API, off the request thread."""
+
+    def __init__(self, service_id, api_token):
+        self.url = f'https://api.fastly.com/service/{service_id}/purge'
+        self.api_token = api_token
+
+    def purge(self, keys):
+        threading.Thread(target=self._send, args=(list(keys),), daemon=True).start()
+
+    def _send(self, keys):
+        req = urllib.request.Request(self.url, method='POST', headers={
+            'Fastly-Key': self.api_token,
+            'Surrogate-Key': ' '.join(keys),
+            'Accept': 'application/json',
+        })
+        try:
+            urllib.request.urlopen(req, timeout=10).close()
+        except Exception as e:
+            print(f"CDN purge failed for {keys}: {e}")
+
+
+if os.environ.get('CDN_PURGE_BACKEND') == 'fastly':
+    cdn_purger = FastlyCDNPurger(os.environ['FASTLY_SERVICE_ID'], os.environ['FASTLY_API_TOKEN'])
+elif os.environ.get('CDN_PURGE_BACKEND') == 'log':
+    cdn_purger = RecordingCDNPurger()
+else:
+    cdn_purger = CDNPurger()
+
+
+def _is_shareable(response):
+    from flask import session
+    if request.method not in ('GET', 'HEAD') or response.status_code != 200:
+        return False
+    if (app.config['SESSION_COOKIE_NAME'] in request.cookies
+            or app.config.get('REMEMBER_COOKIE_NAME', 'remember_token') in request.cookies):
+        return False
+    # A modified session would come back with Set-Cookie, which must never be shared
+    return not session.modified and 'Set-Cookie' not in response.headers
+
+
+def edge_cached(*key_templates):
+    """Let shared caches keep the view's anonymous responses, tagged with surrogate keys.
+
+    Key templates are formatted with the view arguments, e.g. 'event-{event_id}'.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            response = app.make_response(view(*args, **kwargs))
+            if _is_shareable(response):
+                response.cache_control.public = True
+                response.cache_control.max_age = 0  # browsers revalidate; the edge holds the copy
+                response.cache_control.s_maxage = CDN_S_MAXAGE
+                response.cache_control.stale_while_revalidate = CDN_STALE_WHILE_REVALIDATE
+                response.headers[CDN_SURROGATE_KEY_HEADER] = ' '.join(
+                    key.format(**kwargs) for key in key_templates)
+            return response
+        return wrapper
+    return decorator
+
+
+def queue_cdn_purge(session, *keys):
+    """Purge keys once the session's transaction commits (dropped on rollback)."""
+    if session is not None:
+        session.info.setdefault('cdn_purge_keys', set()).update(keys)
+
+
+@sa_event.listens_for(Event, 'after_insert')
+@sa_event.listens_for(Event, 'after_update')
+@sa_event.listens_for(Event, 'after_delete')
+def _purge_event_pages(mapper, connection, target):
+    keys = ['events', f'event-{target.id}']
+    if target.creator_id is not None:
+        keys.append(f'user-{target.creator_id}')
+    queue_cdn_purge(object_session(target), *keys)
+
+
+@sa_event.listens_for(User, 'after_update')
+@sa_event.listens_for(User, 'after_delete')
+def _purge_user_pages(mapper, connection, target):
+    queue_cdn_purge(object_session(target), f'user-{target.id}')
+
+
+@sa_event.listens_for(Attendance, 'after_insert')
+@sa_event.listens_for(Attendance, 'after_delete')
+def _purge_attendee_counts(mapper, connection, target):
+    # Event pages and the bootstrap payload carry attendee counts and platform stats.
+    # Core bulk inserts/deletes skip this and queue the same keys themselves.
+    queue_cdn_purge(object_session(target), 'events', f'event-{target.event_id}')
+
+
+@sa_event.listens_for(db.session, 'after_commit')
+def _send_cdn_purges(session):
+    keys = session.info.pop('cdn_purge_keys', None)
+    if keys:
+        cdn_purger.purge(sorted(keys))
+
+
+@sa_event.listens_for(db.session, 'after_rollback')
+def _drop_cdn_purges(session):
+    session.info.pop('cdn_purge_keys', None)
+
+
 # Routes
 @app.route('/debug/supabase')
 def debug_supabase():
@@ -389,8 +1342,9 @@ def debug_rsvp_test(event_id):
         
         # Test creating attendance
         attendance = Attendance(event_id=event_id, attendee_id=attendee.id)
-        attendance.generate_token()
         db.session.add(attendance)
+        db.session.flush()
+        attendance.generate_token()
         db.session.commit()
         
         return jsonify({
@@ -448,6 +1402,7 @@ def signup():
         db.session.add(user)
         db.session.commit()
         
+        regenerate_session()
         login_user(user)
         flash('Account created successfully! Welcome to Attendeez.', 'success')
         
@@ -470,6 +1425,7 @@ def user_login():
             if not user.check_password(form.password.data):
                 flash('Incorrect password. Please try again or reset your password.', 'danger')
                 return render_template('user_login.html', form=form, google_oauth_available=GOOGLE_OAUTH_AVAILABLE)
+            regenerate_session()
             login_user(user)
             flash('Welcome back!', 'success')
             next_page = request.args.get('next')
@@ -525,6 +1481,7 @@ def google_callback():
             db.session.commit()
             flash('Account created with Google! Welcome to Attendeez.', 'success')
         
+        regenerate_session()
         login_user(user)
         flash('Welcome back!', 'success')
         
@@ -551,36 +1508,8 @@ def send_password_reset_email(user, token):
         reset_url = url_for('reset_password', token=token, _external=True)
         
         subject = "Reset Your Attendeez Password"
-        html_body = f"""
-        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="text-align: center; margin-bottom: 30px;">
-                <h1 style="color: #06b6d4; margin: 0;">ATTENDEEZ</h1>
-            </div>
-            <div style="background: #1a1a2e; border-radius: 12px; padding: 30px; color: #ffffff;">
-                <h2 style="color: #ffffff; margin-top: 0;">Password Reset Request</h2>
-                <p style="color: #9ca3af;">Hi {user.name},</p>
-                <p style="color: #9ca3af;">We received a request to reset your password. Click the button below to create a new password:</p>
-                <div style="text-align: center; margin: 30px 0;">
-                    <a href="{reset_url}" style="background: linear-gradient(135deg, #06b6d4 0%, #22d3ee 100%); color: #000; padding: 14px 28px; border-radius: 8px; text-decoration: none; font-weight: 600; display: inline-block;">Reset Password</a>
-                </div>
-                <p style="color: #6b7280; font-size: 14px;">This link will expire in 1 hour.</p>
-                <p style="color: #6b7280; font-size: 14px;">If you didn't request a password reset, you can safely ignore this email.</p>
-                <hr style="border: none; border-top: 1px solid #374151; margin: 20px 0;">
-                <p style="color: #6b7280; font-size: 12px;">If the button doesn't work, copy and paste this link into your browser:</p>
-                <p style="color: #06b6d4; font-size: 12px; word-break: break-all;">{reset_url}</p>
-            </div>
-        </div>
-        """
-        plain_body = f"""Hi {user.name},
-
-We received a request to reset your Attendeez password.
-
-Click this link to reset your password: {reset_url}
-
-This link will expire in 1 hour.
-
-If you didn't request a password reset, you can safely ignore this email.
-"""
+        html_body = render_template('emails/password_reset.html', user=user, reset_url=reset_url)
+        plain_body = render_template('emails/password_reset.txt', user=user, reset_url=reset_url)
         
         msg = MIMEMultipart('alternative')
         msg['Subject'] = subject
@@ -655,49 +1584,271 @@ def reset_password(token):
             flash('An error occurred. Please try again.', 'danger')
     return render_template('reset_password.html', form=form, token=token)
 
+# My Events and My RSVPs split upcoming from past events in SQL (events with no
+# date count as upcoming) and page through the past section, which is the part
+# that keeps growing. The section totals come from one aggregate query, so the
+# summary never loads rows.
+MY_PAST_PER_PAGE = 12
+
+
+def _is_upcoming(now):
+    return db.or_(Event.datetime.is_(None), Event.datetime >= now)
+
+
+def _past_page():
+    page = max(request.args.get('page', 1, type=int), 1)
+    return page, (page - 1) * MY_PAST_PER_PAGE
+
+
+def _my_search():
+    """The q param and criteria matching it on event name or venue, across every page."""
+    search = request.args.get('q', '').strip()
+    if not search:
+        return search, []
+    pattern = f'%{search.lower()}%'
+    return search, [db.or_(db.func.lower(Event.name).like(pattern), db.func.lower(Event.venue).like(pattern))]
+
+
+def user_rsvps_query(user_id, *columns):
+    """Query columns over the user's attendances joined to their events.
+
+    Covers every attendee profile linked to the user; the join on Event also
+    drops RSVPs for deleted events.
+    """
+    return db.session.query(*columns).select_from(Attendance).join(
+        Event, Event.id == Attendance.event_id).join(
+        Attendee, Attendee.id == Attendance.attendee_id).filter(Attendee.user_id == user_id)
+
+
 @app.route('/my-events')
 @login_required
 def my_events():
     """Show events created by the current user."""
     now = datetime.now(timezone.utc).replace(tzinfo=None)  # Naive UTC for DB comparison
-    all_events = current_user.events.all()
+    page, offset = _past_page()
+    search, matches = _my_search()
+    mine = Event.creator_id == current_user.id
+    upcoming = _is_upcoming(now)
+    
+    summary = db.session.query(
+        db.func.count(Event.id).label('total'),
+        db.func.coalesce(db.func.sum(db.case((upcoming, 1), else_=0)), 0).label('upcoming'),
+    ).filter(mine, *matches).one()
+    past_total = summary.total - summary.upcoming
+    
+    # Current soonest first, past most recent first
+    current_events = event_rows_with_counts(mine, upcoming, *matches).order_by(
+        Event.datetime.is_(None), Event.datetime.asc(), Event.id).all()
+    past_events = event_rows_with_counts(mine, db.not_(upcoming), *matches).order_by(
+        Event.datetime.desc(), Event.id.desc()).limit(MY_PAST_PER_PAGE).offset(offset).all()
     
-    # Separate current and past events
-    current_events = [e for e in all_events if e.datetime is None or e.datetime >= now]
-    past_events = [e for e in all_events if e.datetime is not None and e.datetime < now]
+    cleared_passcodes = db.session.query(Event.id, Event.name).filter(
+        mine, Event.passcode_cleared_at.isnot(None)).order_by(Event.id).all()
     
-    # Sort: current by date ascending, past by date descending
-    current_events.sort(key=lambda e: e.datetime or datetime.max)
-    past_events.sort(key=lambda e: e.datetime, reverse=True)
+    deleted_events = EventDeletion.query.filter(
+        EventDeletion.requested_by == current_user.id,
+        EventDeletion.status != 'done',
+        EventDeletion.purge_after > now
+    ).order_by(EventDeletion.requested_at.desc()).all()
     
-    return render_template('my_events.html', current_events=current_events, past_events=past_events)
+    return render_template('my_events.html', current_events=current_events, past_events=past_events,
+                           deleted_events=deleted_events, cleared_passcodes=cleared_passcodes,
+                           summary=summary, past_total=past_total, search=search,
+                           page=page, pages=max((past_total + MY_PAST_PER_PAGE - 1) // MY_PAST_PER_PAGE, 1),
+                           calendar_url=calendar_feed_url('organizer', current_user.id))
 
 @app.route('/my-rsvps')
 @login_required
 def my_rsvps():
     """Show events the user has RSVP'd to."""
     now = datetime.now(timezone.utc).replace(tzinfo=None)  # Naive UTC for DB comparison
-    # Find attendee profile linked to user
-    attendee = Attendee.query.filter_by(user_id=current_user.id).first()
-    current_rsvps = []
-    past_rsvps = []
-    
-    if attendee:
-        # Filter out attendances where event might be deleted
-        all_rsvps = [a for a in attendee.attendances if a.event is not None]
-        
-        # Separate current and past RSVPs based on event datetime
-        for rsvp in all_rsvps:
-            if rsvp.event.datetime is None or rsvp.event.datetime >= now:
-                current_rsvps.append(rsvp)
-            else:
-                past_rsvps.append(rsvp)
-        
-        # Sort: current by date ascending, past by date descending
-        current_rsvps.sort(key=lambda r: r.event.datetime or datetime.max)
-        past_rsvps.sort(key=lambda r: r.event.datetime, reverse=True)
+    page, offset = _past_page()
+    search, matches = _my_search()
+    upcoming = _is_upcoming(now)
+    
+    def rsvps(*columns):
+        return user_rsvps_query(current_user.id, *columns).filter(*matches)
     
-    return render_template('my_rsvps.html', current_rsvps=current_rsvps, past_rsvps=past_rsvps)
+    summary = rsvps(
+        db.func.count(Attendance.id).label('total'),
+        db.func.coalesce(db.func.sum(db.case((upcoming, 1), else_=0)), 0).label('upcoming'),
+        db.func.coalesce(db.func.sum(db.case((db.and_(db.not_(upcoming), Attendance.checked_in), 1), else_=0)),
+                         0).label('attended'),
+    ).one()
+    past_total = summary.total - summary.upcoming
+    
+    columns = (Attendance.id, Attendance.checked_in, Event.id.label('event_id'), Event.name,
+               Event.datetime, Event.end_datetime, Event.venue)
+    current_rsvps = rsvps(*columns).filter(upcoming).order_by(
+        Event.datetime.is_(None), Event.datetime.asc(), Attendance.id).all()
+    past_rsvps = rsvps(*columns).filter(db.not_(upcoming)).order_by(
+        Event.datetime.desc(), Attendance.id.desc()).limit(MY_PAST_PER_PAGE).offset(offset).all()
+    
+    return render_template('my_rsvps.html', current_rsvps=current_rsvps, past_rsvps=past_rsvps,
+                           summary=summary, past_total=past_total, search=search, page=page,
+                           pages=max((past_total + MY_PAST_PER_PAGE - 1) // MY_PAST_PER_PAGE, 1),
+                           calendar_url=calendar_feed_url('rsvps', current_user.id))
+
+# Calendar feeds
+# Calendar clients poll subscribed feeds every few minutes without a session,
+# so personal feeds are addressed by an HMAC of the owner's id. Each feed is
+# built from one query and cached per process until an RSVP or event change
+# invalidates it (or ICS_CACHE_TTL passes, which bounds staleness across
+# workers). The ETag is a digest of the feed's rows, so unchanged feeds answer
+# 304 even after a rebuild.
+ICS_CACHE_TTL = int(os.environ.get('ICS_CACHE_TTL', 300))
+ICS_CACHE_MAX_ENTRIES = 4096
+ICS_DEFAULT_DURATION = timedelta(hours=1)  # Used when an event has no end time
+_ics_cache = {}  # (kind, owner_id) -> (expires_at, etag, body, event_ids)
+_ics_cache_lock = threading.Lock()
+_ics_feed_columns = (Event.id, Event.name, Event.description, Event.datetime, Event.end_datetime, Event.venue)
+
+
+def calendar_feed_token(kind, owner_id):
+    """Secret path component for a personal feed ('rsvps' or 'organizer')."""
+    message = f'attendeez-ics:{kind}:{owner_id}'.encode()
+    return hmac.new(app.config['SECRET_KEY'].encode(), message, hashlib.sha256).hexdigest()[:32]
+
+
+def calendar_feed_url(kind, owner_id):
+    """Absolute webcal:// URL for a personal feed."""
+    url = url_for('calendar_feed', kind=kind, owner_id=owner_id,
+                  token=calendar_feed_token(kind, owner_id), _external=True)
+    return 'webcal://' + url.split('://', 1)[1]
+
+
+def invalidate_calendar_feeds(kind=None, owner_id=None, event_id=None):
+    """Drop cached feeds by key, by kind, or that contain event_id. No arguments clears everything."""
+    with _ics_cache_lock:
+        for key, entry in list(_ics_cache.items()):
+            if ((kind is None or key[0] == kind) and (owner_id is None or key[1] == owner_id)
+                    and (event_id is None or event_id in entry[3])):
+                del _ics_cache[key]
+
+
+@sa_event.listens_for(Event, 'after_insert')
+@sa_event.listens_for(Event, 'after_update')
+@sa_event.listens_for(Event, 'after_delete')
+def _invalidate_event_feeds(mapper, connection, target):
+    invalidate_calendar_feeds(event_id=target.id)
+    if target.creator_id is not None:
+        invalidate_calendar_feeds('organizer', target.creator_id)
+
+
+@sa_event.listens_for(Attendance, 'after_insert')
+@sa_event.listens_for(Attendance, 'after_delete')
+def _invalidate_rsvp_feed(mapper, connection, target):
+    user_id = connection.execute(
+        db.select(Attendee.user_id).where(Attendee.id == target.attendee_id)).scalar()
+    if user_id is not None:
+        invalidate_calendar_feeds('rsvps', user_id)
+
+
+def _ics_escape(value):
+    return (value or '').replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace(
+        '\r\n', '\\n').replace('\n', '\\n')
+
+
+def _ics_fold(line):
+    """Fold a content line to 75 octets as RFC 5545 requires."""
+    raw = line.encode('utf-8')
+    if len(raw) <= 75:
+        return line
+    parts, limit = [], 75
+    while raw:
+        cut = min(limit, len(raw))
+        while cut < len(raw) and (raw[cut] & 0xC0) == 0x80:  # Don't split a UTF-8 sequence
+            cut -= 1
+        parts.append(raw[:cut].decode('utf-8'))
+        raw, limit = raw[cut:], 74
+    return '\r\n '.join(parts)
+
+
+def _ics_time(value):
+    return value.strftime('%Y%m%dT%H%M%SZ')
+
+
+def render_calendar(name, rows):
+    """Serialize event rows (id, name, description, start, end, venue) as VCALENDAR text."""
+    stamp = _ics_time(datetime.now(timezone.utc).replace(tzinfo=None))
+    host = request.host.split(':')[0]
+    lines = ['BEGIN:VCALENDAR', 'VERSION:2.0', 'PRODID:-//Attendeez//Events//EN',
+             'CALSCALE:GREGORIAN', 'METHOD:PUBLISH', f'X-WR-CALNAME:{_ics_escape(name)}']
+    for event_id, event_name, description, start, end, venue in rows:
+        lines += [
+            'BEGIN:VEVENT',
+            f'UID:event-{event_id}@{host}',
+            f'DTSTAMP:{stamp}',
+            f'DTSTART:{_ics_time(start)}',
+            f'DTEND:{_ics_time(end if end and end > start else start + ICS_DEFAULT_DURATION)}',
+            f'SUMMARY:{_ics_escape(event_name)}',
+            f"URL:{url_for('event_detail', event_id=event_id, _external=True)}",
+        ]
+        if venue:
+            lines.append(f'LOCATION:{_ics_escape(venue)}')
+        if description:
+            lines.append(f'DESCRIPTION:{_ics_escape(description)}')
+        lines.append('END:VEVENT')
+    lines.append('END:VCALENDAR')
+    return '\r\n'.join(_ics_fold(line) for line in lines) + '\r\n'
+
+
+def _calendar_rows(kind, owner_id):
+    """Return (calendar name, rows) for a feed using a single query, or None."""
+    query = db.session.query(*_ics_feed_columns).filter(Event.datetime.isnot(None))
+    if kind == 'event':
+        rows = query.filter(Event.id == owner_id).all()
+        return (rows[0].name, rows) if rows else None
+    if kind == 'organizer':
+        rows = query.filter(Event.creator_id == owner_id).order_by(Event.datetime).all()
+        return 'My Attendeez events', rows
+    if kind == 'rsvps':
+        rows = query.join(Attendance, Attendance.event_id == Event.id).join(
+            Attendee, Attendee.id == Attendance.attendee_id).filter(
+            Attendee.user_id == owner_id).distinct().order_by(Event.datetime).all()
+        return 'My Attendeez RSVPs', rows
+    return None
+
+
+def _calendar_response(kind, owner_id, cache_control):
+    key = (kind, owner_id)
+    now = time.monotonic()
+    with _ics_cache_lock:
+        entry = _ics_cache.get(key)
+    if entry is None or entry[0] < now:
+        result = _calendar_rows(kind, owner_id)
+        if result is None:
+            return jsonify({'error': 'Calendar not found'}), 404
+        name, rows = result
+        etag = hashlib.sha1(repr((name, [tuple(row) for row in rows])).encode()).hexdigest()
+        if entry is not None and entry[1] == etag:
+            body = entry[2]  # Rows unchanged, keep the rendered feed
+        else:
+            body = render_calendar(name, rows)
+        entry = (now + ICS_CACHE_TTL, etag, body, frozenset(row.id for row in rows))
+        with _ics_cache_lock:
+            if len(_ics_cache) >= ICS_CACHE_MAX_ENTRIES:
+                _ics_cache.clear()
+            _ics_cache[key] = entry
+
+    response = Response(entry[2], mimetype='text/calendar')
+    response.set_etag(entry[1])
+    response.headers['Cache-Control'] = cache_control
+    return response.make_conditional(request)
+
+
+@app.route('/calendar/<kind>/<int:owner_id>/<token>.ics')
+def calendar_feed(kind, owner_id, token):
+    """Subscribable feed of a user's RSVPs or the events they organize."""
+    if kind not in ('rsvps', 'organizer') or not hmac.compare_digest(token, calendar_feed_token(kind, owner_id)):
+        return jsonify({'error': 'Calendar not found'}), 404
+    return _calendar_response(kind, owner_id, f'private, max-age={ICS_CACHE_TTL}')
+
+
+@app.route('/event/<int:event_id>/calendar.ics')
+def event_calendar(event_id):
+    """Single-event calendar file for "add to calendar"."""
+    return _calendar_response('event', event_id, f'public, max-age={ICS_CACHE_TTL}')
 
 @app.route('/profile', methods=['GET', 'POST'])
 @login_required
@@ -751,18 +1902,51 @@ def profile():
     
     return render_template('profile.html', form=form, password_form=password_form)
 
+PEOPLE_PER_PAGE = 24
+
+def people_directory_query(search=None):
+    """Users with their event and upcoming-event counts as aggregate columns.
+
+    Returns a query of rows (id, name, username, bio, profile_picture,
+    event_count, upcoming_count) ordered by most events first, then name.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)  # Naive UTC for DB comparison
+    event_count = db.func.count(Event.id).label('event_count')
+    upcoming_count = db.func.coalesce(
+        db.func.sum(db.case((Event.datetime >= now, 1), else_=0)), 0
+    ).label('upcoming_count')
+    query = db.session.query(
+        User.id, User.name, User.username, User.bio, User.profile_picture,
+        event_count, upcoming_count
+    ).outerjoin(Event, Event.creator_id == User.id)
+    query = _people_search_filter(query, search)
+    return query.group_by(User.id).order_by(event_count.desc(), User.name.asc())
+
+def _people_search_filter(query, search):
+    if search:
+        pattern = f'%{search.lower()}%'
+        query = query.filter(db.or_(
+            db.func.lower(User.name).like(pattern),
+            db.func.lower(User.username).like(pattern),
+            db.func.lower(User.bio).like(pattern),
+        ))
+    return query
+
 @app.route('/people')
 def people():
     """Browse all users/organizers"""
-    # Order by those with most events first, then by name
-    users = User.query.outerjoin(Event).group_by(User.id).order_by(
-        db.func.count(Event.id).desc(),
-        User.name.asc()
-    ).all()
+    search = request.args.get('q', '').strip()
+    page = max(request.args.get('page', 1, type=int), 1)
     
-    return render_template('people.html', users=users)
+    # Two queries regardless of directory size: one count, one aggregated page
+    total = _people_search_filter(db.session.query(db.func.count(User.id)), search).scalar()
+    users = people_directory_query(search).limit(PEOPLE_PER_PAGE).offset((page - 1) * PEOPLE_PER_PAGE).all()
+    pages = max((total + PEOPLE_PER_PAGE - 1) // PEOPLE_PER_PAGE, 1)
+    
+    return render_template('people.html', users=users, search=search, page=page, pages=pages, total=total)
 
 @app.route('/user/<int:user_id>')
+@edge_cached('user-{user_id}')
 def public_profile(user_id):
     """View a user's public profile"""
     user = User.query.get_or_404(user_id)
@@ -787,20 +1971,38 @@ def public_profile(user_id):
 def google_verification():
     return render_template('googleaa6733e924144d84.html')
 
+# Read-only list views select just the columns they render and get back Row
+# tuples (attribute access, no identity map or change tracking), which is far
+# cheaper than loading full Event/Attendance objects and their relationships.
+EVENT_CARD_COLUMNS = (Event.id, Event.name, Event.description, Event.datetime, Event.end_datetime,
+                      Event.venue, Event.poster)
+
+
+def event_rows_with_counts(*criteria):
+    """Query of event card rows plus has_passcode and attendee_count for events matching criteria."""
+    attendee_count = db.func.count(Attendance.id).label('attendee_count')
+    has_passcode = Event.passcode_hash.isnot(None).label('has_passcode')
+    return db.session.query(*EVENT_CARD_COLUMNS, has_passcode, attendee_count).outerjoin(
+        Attendance, Attendance.event_id == Event.id
+    ).filter(*criteria).group_by(Event.id)
+
+
 @app.route('/')
+@edge_cached('events')
+@reads_from_replica
 def index():
     now = datetime.now(timezone.utc).replace(tzinfo=None)  # Naive UTC for DB comparison
-    # Only show upcoming events on homepage (soonest first)
-    events = Event.query.filter(
-        Event.datetime != None,
-        Event.datetime >= now
-    ).order_by(Event.datetime.asc()).all()
-    # Also include events with no datetime set
-    no_date_events = Event.query.filter(Event.datetime == None).all()
-    events = events + no_date_events
+    # Only show upcoming events on homepage (soonest first), then events with no datetime set
+    events = db.session.query(
+        *EVENT_CARD_COLUMNS,
+        User.name.label('organizer_name'), User.username.label('organizer_username')
+    ).outerjoin(User, User.id == Event.creator_id).filter(
+        db.or_(Event.datetime >= now, Event.datetime.is_(None))
+    ).order_by(Event.datetime.is_(None), Event.datetime.asc()).all()
     return render_template('index.html', events=events)
 
 @app.route('/event/<int:event_id>')
+@edge_cached('event-{event_id}')
 def event_detail(event_id):
     event = Event.query.get_or_404(event_id)
     return render_template('event.html', event=event)
@@ -864,9 +2066,12 @@ def rsvp(event_id):
                 
                 # Create attendance record
                 attendance = Attendance(event_id=event_id, attendee_id=attendee.id)
-                attendance.generate_token()  # Generate unique QR token
                 db.session.add(attendance)
+                db.session.flush()
+                attendance.generate_token()  # Signed QR token, needs the new id
+                record_analytics_delta(event_id, 'rsvp', when=attendance.timestamp)
                 db.session.commit()
+                publish_live_update(event_id, 'rsvp', attendance)
                 
                 # Send email confirmation with QR code (non-blocking)
                 try:
@@ -903,6 +2108,7 @@ def organizer_login():
         if form.username.data == Organizer.username and form.password.data == Organizer.password:
             # Store admin session flag
             from flask import session
+            regenerate_session()
             session['is_admin'] = True
             flash('Admin login successful', 'success')
             return redirect(url_for('admin_dashboard'))
@@ -940,6 +2146,12 @@ def organizer_logout():
 def create_event():
     form = EventForm()
     if form.validate_on_submit():
+        if not passcode_attempt_allowed():
+            flash('Too many passcode attempts. Please wait a minute and try again.', 'danger')
+            return render_template('create_event.html', form=form), 429
+        if passcode_in_use(form.passcode.data):
+            flash('That passcode is already used by another event. Please choose a different one.', 'danger')
+            return render_template('create_event.html', form=form)
         poster_value = None
         if form.poster.data:
             f = form.poster.data
@@ -959,10 +2171,15 @@ def create_event():
                       end_datetime=form.end_datetime.data,
                       venue=form.venue.data,
                       poster=poster_value,
-                      creator_id=current_user.id,
-                      passcode=form.passcode.data)
+                      creator_id=current_user.id)
+        event.set_passcode(form.passcode.data)
         db.session.add(event)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            flash('That passcode is already used by another event. Please choose a different one.', 'danger')
+            return render_template('create_event.html', form=form)
         flash(f'Event created successfully! Your dashboard passcode is: {form.passcode.data}', 'success')
         return redirect(url_for('my_events'))
     return render_template('create_event.html', form=form)
@@ -981,7 +2198,6 @@ def event_dashboard(event_id):
     
     # Check if user has dashboard access via session
     from flask import session
-    session_key = f'event_{event_id}_access'
     
     # Admin has access to everything
     if session.get('is_admin'):
@@ -992,16 +2208,20 @@ def event_dashboard(event_id):
         return render_template('event_dashboard.html', event=event)
     
     # Check session for passcode access
-    if session.get(session_key):
+    if has_dashboard_grant(event_id):
         return render_template('event_dashboard.html', event=event)
     
     # Handle passcode form submission
     if form.validate_on_submit():
-        if event.passcode and form.passcode.data == event.passcode:
-            session[session_key] = True
+        if not passcode_attempt_allowed(event_id):
+            flash('Too many passcode attempts. Please wait a minute and try again.', 'danger')
+            return render_template('event_passcode.html', event=event, form=form), 429
+        if event.check_passcode(form.passcode.data):
+            grant_dashboard_access(event_id)
             flash('Dashboard access granted!', 'success')
             return render_template('event_dashboard.html', event=event)
         else:
+            record_failed_passcode(event_id)
             flash('Invalid passcode', 'danger')
     
     return render_template('event_passcode.html', event=event, form=form)
@@ -1013,17 +2233,18 @@ def join_dashboard():
     form = JoinDashboardForm()
     
     if form.validate_on_submit():
-        passcode = form.passcode.data.strip()
-        # Find event with matching passcode
-        event = Event.query.filter_by(passcode=passcode).first()
+        if not passcode_attempt_allowed():
+            flash('Too many passcode attempts. Please wait a minute and try again.', 'danger')
+            return render_template('join_dashboard.html', form=form), 429
+        # Find event with matching passcode (one probe of the unique index)
+        event = Event.query.filter_by(passcode_hash=hash_passcode(form.passcode.data)).first()
         
         if event:
-            from flask import session
-            session_key = f'event_{event.id}_access'
-            session[session_key] = True
+            grant_dashboard_access(event.id)
             flash(f'Access granted to "{event.name}" dashboard!', 'success')
             return redirect(url_for('event_dashboard', event_id=event.id))
         else:
+            record_failed_passcode()
             flash('No event found with that passcode. Please check and try again.', 'danger')
     
     return render_template('join_dashboard.html', form=form)
@@ -1039,14 +2260,22 @@ def edit_event(event_id):
         flash('You do not have permission to edit this event.', 'danger')
         return redirect(url_for('event_detail', event_id=event_id))
     
-    form = EventForm(obj=event)
+    form = EditEventForm(obj=event)
     if form.validate_on_submit():
+        if form.passcode.data and not passcode_attempt_allowed():
+            flash('Too many passcode attempts. Please wait a minute and try again.', 'danger')
+            return render_template('edit_event.html', form=form, event=event), 429
+        if form.passcode.data and passcode_in_use(form.passcode.data, exclude_event_id=event.id):
+            flash('That passcode is already used by another event. Please choose a different one.', 'danger')
+            return render_template('edit_event.html', form=form, event=event)
         event.name = form.name.data
         event.description = form.description.data
         event.datetime = form.datetime.data
         event.end_datetime = form.end_datetime.data
         event.venue = form.venue.data
-        event.passcode = form.passcode.data
+        if form.passcode.data:
+            event.set_passcode(form.passcode.data)
+        invalidate_analytics_snapshot(event.id)
         if form.poster.data:
             f = form.poster.data
             # Try Supabase Storage first (for production)
@@ -1071,6 +2300,120 @@ def edit_event_legacy(event_id):
     return redirect(url_for('edit_event', event_id=event_id))
 
 
+# Event deletion
+# Deleting an event only sets deleted_at, which hides it from every ORM query
+# (see _hide_deleted_events). Once EVENT_DELETE_GRACE has passed without an
+# undo, `flask purge-deleted-events` removes its attendances in bounded chunks,
+# committing between chunks so locks stay short, then the poster and the row.
+EVENT_DELETE_GRACE_MINUTES = int(os.environ.get('EVENT_DELETE_GRACE_MINUTES', 10))
+EVENT_DELETE_GRACE = timedelta(minutes=EVENT_DELETE_GRACE_MINUTES)
+EVENT_PURGE_CHUNK = 1000
+EVENT_PURGE_STALE_AFTER = timedelta(minutes=10)
+
+
+def get_deleted_event(event_id):
+    """Return (event, deletion) for a soft-deleted event, or (None, None)."""
+    event = db.session.execute(
+        db.select(Event).where(Event.id == event_id, Event.deleted_at.isnot(None)),
+        execution_options={'include_deleted': True}).scalar()
+    if event is None:
+        return None, None
+    return event, db.session.get(EventDeletion, event_id)
+
+
+def _remove_poster(poster):
+    """Delete a poster file or storage object unless another event still uses it."""
+    if not poster:
+        return
+    in_use = db.session.execute(db.select(db.func.count(Event.id)).where(Event.poster == poster),
+                                execution_options={'include_deleted': True}).scalar()
+    if in_use > 1:
+        return
+    try:
+        if poster.startswith('http'):
+            if supabase_client:
+                supabase_client.storage.from_(SUPABASE_BUCKET).remove([poster.rsplit('/', 1)[-1].split('?')[0]])
+        else:
+            path = os.path.join(app.config['UPLOAD_FOLDER'], secure_filename(poster))
+            if os.path.exists(path):
+                os.remove(path)
+    except Exception as e:
+        app.logger.warning(f"Could not remove poster {poster}: {e}")
+
+
+def purge_deleted_event(deletion):
+    """Remove a soft-deleted event's data in chunks, recording progress on `deletion`."""
+    event_id = deletion.event_id
+    attendance = Attendance.__table__
+    if not deletion.total:
+        deletion.total = db.session.execute(
+            db.select(db.func.count()).select_from(attendance).where(attendance.c.event_id == event_id)).scalar()
+        db.session.commit()
+    while True:
+        chunk = db.select(attendance.c.id).where(attendance.c.event_id == event_id).limit(EVENT_PURGE_CHUNK)
+        removed = db.session.execute(attendance.delete().where(attendance.c.id.in_(chunk.scalar_subquery()))).rowcount
+        if removed:
+            queue_cdn_purge(db.session(), 'events', f'event-{event_id}')
+        deletion.removed += removed
+        deletion.heartbeat_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        db.session.commit()
+        if removed < EVENT_PURGE_CHUNK:
+            break
+
+    ReminderCampaign.query.filter_by(event_id=event_id).delete()
+    EventAnalyticsSnapshot.query.filter_by(event_id=event_id).delete()
+    event = db.session.execute(db.select(Event).where(Event.id == event_id),
+                               execution_options={'include_deleted': True}).scalar()
+    if event is not None:
+        _remove_poster(event.poster)
+        db.session.delete(event)
+    deletion.status = 'done'
+    deletion.finished_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    db.session.commit()
+    return deletion
+
+
+def purge_deleted_events(now=None):
+    """Purge every deleted event whose undo window has passed. Returns the finished deletions."""
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    table = EventDeletion.__table__
+    due = [event_id for (event_id,) in db.session.query(EventDeletion.event_id).filter(
+        EventDeletion.status != 'done', EventDeletion.purge_after <= now)]
+    finished = []
+    for event_id in due:
+        # Claim it, so concurrent runs don't purge the same event (stalled claims are retaken)
+        claimed = db.session.execute(table.update().where(
+            table.c.event_id == event_id,
+            db.or_(table.c.status == 'pending',
+                   db.and_(table.c.status == 'purging', table.c.heartbeat_at < now - EVENT_PURGE_STALE_AFTER))
+        ).values(status='purging', heartbeat_at=now)).rowcount
+        db.session.commit()
+        if not claimed:
+            continue
+        deletion = db.session.get(EventDeletion, event_id)
+        try:
+            finished.append(purge_deleted_event(deletion))
+        except Exception as e:
+            # Chunks already removed stay removed; the next run continues
+            db.session.rollback()
+            app.logger.error(f"Purging event {event_id} failed: {e}")
+            deletion.status = 'pending'
+            db.session.commit()
+    return finished
+
+
+@app.cli.command('purge-deleted-events')
+@click.option('--interval', type=int, default=0, help='Keep running and check every INTERVAL seconds.')
+def purge_deleted_events_command(interval):
+    """Permanently remove events deleted more than EVENT_DELETE_GRACE_MINUTES ago."""
+    while True:
+        for deletion in purge_deleted_events():
+            click.echo(f'event {deletion.event_id}: removed {deletion.removed} attendances')
+        if not interval:
+            break
+        time.sleep(interval)
+
+
 @app.route('/event/<int:event_id>/delete', methods=['POST'])
 @login_required
 def delete_event(event_id):
@@ -1082,13 +2425,56 @@ def delete_event(event_id):
         flash('You do not have permission to delete this event.', 'danger')
         return redirect(url_for('event_detail', event_id=event_id))
     
-    # Delete all attendances for this event
-    Attendance.query.filter_by(event_id=event_id).delete()
-    db.session.delete(event)
+    # Hide the event now; attendances are purged in the background after the undo window
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    event.deleted_at = now
+    db.session.merge(EventDeletion(event_id=event.id, event_name=event.name, requested_by=current_user.id,
+                                   requested_at=now, purge_after=now + EVENT_DELETE_GRACE,
+                                   status='pending', total=0, removed=0))
+    invalidate_analytics_snapshot(event_id)
+    db.session.commit()
+    flash(f'Event deleted. You can restore it from My Events for the next {EVENT_DELETE_GRACE_MINUTES} minutes.')
+    return redirect(url_for('my_events'))
+
+
+@app.route('/event/<int:event_id>/restore', methods=['POST'])
+@login_required
+def restore_event(event_id):
+    """Undo a delete while the event is still inside its grace window."""
+    event, deletion = get_deleted_event(event_id)
+    from flask import session
+    if event is None or not (session.get('is_admin') or event.creator_id == current_user.id):
+        flash('That event cannot be restored.', 'danger')
+        return redirect(url_for('my_events'))
+    if deletion is not None and (deletion.status != 'pending' or deletion.removed):
+        flash('That event has already been removed and can no longer be restored.', 'warning')
+        return redirect(url_for('my_events'))
+    event.deleted_at = None
+    if deletion is not None:
+        db.session.delete(deletion)
+    ReminderCampaign.query.filter_by(event_id=event_id, status='cancelled').delete()
     db.session.commit()
-    flash('Event deleted successfully')
+    flash(f'"{event.name}" has been restored.', 'success')
     return redirect(url_for('my_events'))
 
+
+@app.route('/event/<int:event_id>/deletion')
+@login_required
+def event_deletion_status(event_id):
+    """Progress of a deleted event's background purge."""
+    deletion = db.session.get(EventDeletion, event_id)
+    from flask import session
+    if deletion is None or not (session.get('is_admin') or deletion.requested_by == current_user.id):
+        return jsonify({'error': 'Not found'}), 404
+    return jsonify({
+        'event_id': deletion.event_id,
+        'status': deletion.status,
+        'total': deletion.total,
+        'removed': deletion.removed,
+        'restorable': deletion.status == 'pending',
+        'purge_after': deletion.purge_after.isoformat(),
+    })
+
 # Legacy redirect
 @app.route('/organizer/event/<int:event_id>/delete', methods=['POST'])
 @login_required
@@ -1097,6 +2483,7 @@ def delete_event_legacy(event_id):
 
 
 @app.route('/organizer/analytics')
+@reads_from_replica
 def analytics_dashboard():
     # Admin only
     from flask import session
@@ -1107,12 +2494,14 @@ def analytics_dashboard():
     # Basic stats
     total_events = Event.query.count()
     total_attendees = Attendee.query.count()
-    total_rsvps = Attendance.query.count()
-    total_checked_in = Attendance.query.filter_by(checked_in=True).count()
+    total_rsvps = live_attendances().count()
+    total_checked_in = live_attendances().filter(Attendance.checked_in.is_(True)).count()
     
     # Events with most attendees
-    events = Event.query.all()
-    top_events = sorted(events, key=lambda e: len(e.attendances), reverse=True)[:5]
+    rsvp_count = db.func.count(Attendance.id).label('rsvp_count')
+    top_events = db.session.query(Event.id, Event.name, Event.datetime, rsvp_count).outerjoin(
+        Attendance, Attendance.event_id == Event.id
+    ).group_by(Event.id).order_by(rsvp_count.desc()).limit(5).all()
     
     # Attendees by status
     status_counts = db.session.query(
@@ -1120,23 +2509,23 @@ def analytics_dashboard():
     ).group_by(Attendee.status).all()
     
     # Recent registrations (last 10)
-    recent_attendances = Attendance.query.order_by(
-        Attendance.timestamp.desc()
-    ).limit(10).all()
+    recent_attendances = db.session.query(
+        Attendance.timestamp, Attendee.name.label('attendee_name'), Event.name.label('event_name')
+    ).join(Attendee, Attendee.id == Attendance.attendee_id).join(
+        Event, Event.id == Attendance.event_id
+    ).order_by(Attendance.timestamp.desc()).limit(10).all()
     
     # Events by month (process in Python for DB compatibility)
-    all_events = Event.query.filter(Event.datetime.isnot(None)).all()
     events_month_dict = {}
-    for e in all_events:
-        month = e.datetime.strftime('%Y-%m')
+    for (event_datetime,) in db.session.query(Event.datetime).filter(Event.datetime.isnot(None)):
+        month = event_datetime.strftime('%Y-%m')
         events_month_dict[month] = events_month_dict.get(month, 0) + 1
     events_by_month = sorted(events_month_dict.items())
     
     # RSVPs by month (process in Python for DB compatibility)
-    all_attendances = Attendance.query.filter(Attendance.timestamp.isnot(None)).all()
     rsvps_month_dict = {}
-    for a in all_attendances:
-        month = a.timestamp.strftime('%Y-%m')
+    for (timestamp,) in live_attendances(Attendance.timestamp).filter(Attendance.timestamp.isnot(None)):
+        month = timestamp.strftime('%Y-%m')
         rsvps_month_dict[month] = rsvps_month_dict.get(month, 0) + 1
     rsvps_by_month = sorted(rsvps_month_dict.items())
     
@@ -1149,7 +2538,8 @@ def analytics_dashboard():
         status_counts=status_counts,
         recent_attendances=recent_attendances,
         events_by_month=events_by_month,
-        rsvps_by_month=rsvps_by_month
+        rsvps_by_month=rsvps_by_month,
+        export_available=PYARROW_AVAILABLE
     )
 
 
@@ -1167,66 +2557,362 @@ def check_event_dashboard_access(event_id):
         return True, event
     
     # Passcode session access
-    session_key = f'event_{event_id}_access'
-    if session.get(session_key):
+    if has_dashboard_grant(event_id):
         return True, event
     
     return False, event
 
 
-@app.route('/event/<int:event_id>/analytics')
-def event_analytics(event_id):
-    """Analytics dashboard for a specific event."""
-    has_access, event = check_event_dashboard_access(event_id)
-    if not has_access:
-        flash('Please enter the event passcode to access the dashboard.', 'warning')
-        return redirect(url_for('event_dashboard', event_id=event_id))
-    
-    # Basic stats for this event
-    total_rsvps = len(event.attendances)
-    checked_in_count = sum(1 for a in event.attendances if a.checked_in)
-    check_in_rate = round((checked_in_count / total_rsvps * 100), 1) if total_rsvps > 0 else 0
-    
-    # Attendees by status for this event
-    status_counts = {}
-    for a in event.attendances:
-        status = a.attendee.status or 'Other'
-        status_counts[status] = status_counts.get(status, 0) + 1
-    status_list = [(k, v) for k, v in status_counts.items()]
-    
-    # Registrations over time (by day) - process in Python for DB compatibility
-    event_attendances = Attendance.query.filter_by(event_id=event_id).filter(Attendance.timestamp.isnot(None)).all()
-    rsvps_day_dict = {}
-    for a in event_attendances:
-        day = a.timestamp.strftime('%Y-%m-%d')
-        rsvps_day_dict[day] = rsvps_day_dict.get(day, 0) + 1
-    rsvps_by_day = sorted(rsvps_day_dict.items())
-    
-    # Check-ins over time (by hour) - process in Python for DB compatibility
-    checked_in_attendances = Attendance.query.filter_by(event_id=event_id, checked_in=True).filter(Attendance.check_in_time.isnot(None)).all()
-    checkins_hour_dict = {}
-    for a in checked_in_attendances:
-        hour = a.check_in_time.strftime('%H:00')
-        checkins_hour_dict[hour] = checkins_hour_dict.get(hour, 0) + 1
-    checkins_by_hour = sorted(checkins_hour_dict.items())
-    
-    # Recent activity for this event
-    recent_rsvps = Attendance.query.filter_by(event_id=event_id).order_by(
-        Attendance.timestamp.desc()
-    ).limit(5).all()
-    
-    return render_template('event_analytics.html',
-        event=event,
-        total_rsvps=total_rsvps,
-        checked_in_count=checked_in_count,
-        check_in_rate=check_in_rate,
-        status_counts=status_list,
-        rsvps_by_day=rsvps_by_day,
-        checkins_by_hour=checkins_by_hour,
-        recent_rsvps=recent_rsvps
-    )
+# Live check-in feed (Server-Sent Events)
+# Dashboards subscribe to /event/<id>/live and receive check-in, check-out and
+# RSVP deltas as they are committed. The default broker fans out in-process;
+# set LIVE_FEED_BACKEND=postgres to relay through LISTEN/NOTIFY so every worker
+# process sees every update.
+LIVE_FEED_CHANNEL = 'attendeez_live'
+LIVE_FEED_KEEPALIVE = 15  # seconds between comment pings
+LIVE_FEED_MAX_SECONDS = int(os.environ.get('LIVE_FEED_MAX_SECONDS', 300))  # EventSource reconnects after this
+
+class LiveFeedBroker:
+    """In-process pub/sub: one bounded queue per connected dashboard."""
+
+    def __init__(self, queue_size=256):
+        self.queue_size = queue_size
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_id):
+        q = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(event_id, set()).add(q)
+        return q
+
+    def unsubscribe(self, event_id, q):
+        with self._lock:
+            subscribers = self._subscribers.get(event_id)
+            if subscribers:
+                subscribers.discard(q)
+                if not subscribers:
+                    del self._subscribers[event_id]
+
+    def publish(self, event_id, message):
+        self.dispatch(event_id, message)
+
+    def dispatch(self, event_id, message):
+        with self._lock:
+            subscribers = list(self._subscribers.get(event_id, ()))
+        for q in subscribers:
+            try:
+                q.put_nowait(message)
+            except queue.Full:
+                pass  # Slow client; it resyncs from the snapshot on reconnect
 
-# Legacy redirect
+
+class PostgresLiveFeedBroker(LiveFeedBroker):
+    """Relays messages through Postgres NOTIFY so all processes receive them."""
+
+    def __init__(self, dsn, queue_size=256):
+        super().__init__(queue_size)
+        self.dsn = dsn
+        self._listener = None
+
+    def subscribe(self, event_id):
+        self._ensure_listener()
+        return super().subscribe(event_id)
+
+    def publish(self, event_id, message):
+        payload = json.dumps({'event_id': event_id, 'message': message})
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(text('SELECT pg_notify(:channel, :payload)'),
+                             {'channel': LIVE_FEED_CHANNEL, 'payload': payload})
+        except Exception as e:
+            app.logger.warning(f"Live feed NOTIFY failed, delivering locally: {e}")
+            self.dispatch(event_id, message)
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener and self._listener.is_alive():
+                return
+            self._listener = threading.Thread(target=self._listen, name='live-feed-listener', daemon=True)
+            self._listener.start()
+
+    def _listen(self):
+        import select
+        import psycopg2
+        while True:
+            try:
+                conn = psycopg2.connect(self.dsn)
+                conn.set_session(autocommit=True)
+                with conn.cursor() as cur:
+                    cur.execute(f'LISTEN {LIVE_FEED_CHANNEL}')
+                while True:
+                    if select.select([conn], [], [], LIVE_FEED_KEEPALIVE) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        data = json.loads(notify.payload)
+                        self.dispatch(data['event_id'], data['message'])
+            except Exception as e:
+                print(f"Live feed listener error, reconnecting: {e}")
+                time.sleep(5)
+
+
+if (os.environ.get('LIVE_FEED_BACKEND') == 'postgres'
+        and app.config['SQLALCHEMY_DATABASE_URI'].startswith('postgresql')):
+    live_feed = PostgresLiveFeedBroker(app.config['SQLALCHEMY_DATABASE_URI'])
+else:
+    live_feed = LiveFeedBroker()
+
+
+def attendance_live_payload(attendance):
+    """Serialize an attendance row for live dashboard updates."""
+    return {
+        'attendance_id': attendance.id,
+        'name': attendance.attendee.name,
+        'email': attendance.attendee.email,
+        'contact': attendance.attendee.contact,
+        'status': attendance.attendee.status,
+        'checked_in': bool(attendance.checked_in),
+        'check_in_time': attendance.check_in_time.isoformat() if attendance.check_in_time else None,
+        'timestamp': attendance.timestamp.isoformat() if attendance.timestamp else None,
+    }
+
+
+def publish_live_update(event_id, kind, attendance):
+    """Push a committed check-in/check-out/RSVP to dashboards watching the event."""
+    try:
+        live_feed.publish(event_id, {'type': kind, 'data': attendance_live_payload(attendance)})
+    except Exception as e:
+        app.logger.warning(f"Live feed publish failed: {e}")
+
+
+def live_feed_counts(event_id):
+    total, checked_in = db.session.query(
+        db.func.count(Attendance.id),
+        db.func.sum(db.case((Attendance.checked_in == True, 1), else_=0))
+    ).filter(Attendance.event_id == event_id).one()
+    return {'total': total, 'checked_in': checked_in or 0}
+
+
+def publish_live_snapshot(event_id):
+    """Push fresh totals after a bulk change, instead of one message per row."""
+    try:
+        live_feed.publish(event_id, {'type': 'snapshot', 'data': live_feed_counts(event_id)})
+    except Exception as e:
+        app.logger.warning(f"Live feed publish failed: {e}")
+
+
+def _sse(kind, data):
+    return f"event: {kind}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.route('/event/<int:event_id>/live')
+def event_live_feed(event_id):
+    """Server-Sent Events stream of check-in activity for an event dashboard."""
+    has_access, event = check_event_dashboard_access(event_id)
+    if not has_access:
+        return jsonify({'error': 'Access denied'}), 403
+
+    snapshot = live_feed_counts(event_id)
+    # Don't pin a pooled connection for the lifetime of the stream
+    db.session.remove()
+
+    subscription = live_feed.subscribe(event_id)
+
+    def stream():
+        try:
+            yield f"retry: 3000\n{_sse('snapshot', snapshot)}"
+            deadline = time.monotonic() + LIVE_FEED_MAX_SECONDS
+            while time.monotonic() < deadline:
+                try:
+                    message = subscription.get(timeout=LIVE_FEED_KEEPALIVE)
+                except queue.Empty:
+                    yield ': keepalive\n\n'
+                    continue
+                yield _sse(message['type'], message['data'])
+        finally:
+            live_feed.unsubscribe(event_id, subscription)
+
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+
+
+# Events without an end time are treated as running this long after they start,
+# so check-ins on the day are not left out of a frozen snapshot
+OPEN_ENDED_EVENT_DURATION = timedelta(hours=int(os.environ.get('OPEN_ENDED_EVENT_HOURS', 24)))
+
+
+def event_has_ended(event, now=None):
+    """True once the event's end (or start plus OPEN_ENDED_EVENT_DURATION) is in the past."""
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    if event.end_datetime is not None:
+        return event.end_datetime < now
+    return event.datetime is not None and event.datetime + OPEN_ENDED_EVENT_DURATION < now
+
+
+def _recent_rsvps_query(event_id, limit=5):
+    return Attendance.query.options(db.joinedload(Attendance.attendee)).filter_by(
+        event_id=event_id).order_by(Attendance.timestamp.desc()).limit(limit)
+
+
+def build_analytics_snapshot(event):
+    """Recompute an event's analytics from raw rows and store them.
+
+    The snapshot is frozen when the event has already ended, so later views
+    read it back without touching the attendance table.
+    """
+    # A lagging replica would freeze a snapshot that misses committed RSVPs
+    with reads_from_primary():
+        return _build_analytics_snapshot(event)
+
+
+def _build_analytics_snapshot(event):
+    event_id = event.id
+    if db.session.get(EventAnalyticsSnapshot, event_id) is None:
+        # Commit the row before counting, so RSVPs from here on lock it and
+        # apply their delta after the count instead of being missed by both
+        db.session.add(EventAnalyticsSnapshot(event_id=event_id))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()  # A concurrent first view created it
+    snapshot = db.session.query(EventAnalyticsSnapshot).filter_by(
+        event_id=event_id).with_for_update().populate_existing().one()
+
+    rows = db.session.query(
+        Attendance.timestamp, Attendance.checked_in, Attendance.check_in_time, Attendee.status
+    ).join(Attendee).filter(Attendance.event_id == event_id).all()
+
+    # Group in Python for DB compatibility
+    status_counts, rsvps_by_day, checkins_by_hour = {}, {}, {}
+    checked_in_count = 0
+    for timestamp, checked_in, check_in_time, status in rows:
+        status = status or 'Other'
+        status_counts[status] = status_counts.get(status, 0) + 1
+        if timestamp:
+            day = timestamp.strftime('%Y-%m-%d')
+            rsvps_by_day[day] = rsvps_by_day.get(day, 0) + 1
+        if checked_in:
+            checked_in_count += 1
+            if check_in_time:
+                hour = check_in_time.strftime('%H:00')
+                checkins_by_hour[hour] = checkins_by_hour.get(hour, 0) + 1
+
+    snapshot.total_rsvps = len(rows)
+    snapshot.checked_in_count = checked_in_count
+    snapshot.rsvps_by_day = rsvps_by_day
+    snapshot.checkins_by_hour = checkins_by_hour
+    snapshot.frozen = event_has_ended(event)
+    snapshot.status_counts = status_counts if snapshot.frozen else None
+    snapshot.recent_rsvps = [{
+        'attendee': {'name': a.attendee.name, 'email': a.attendee.email},
+        'checked_in': bool(a.checked_in),
+    } for a in _recent_rsvps_query(event_id)] if snapshot.frozen else None
+    db.session.commit()
+    return snapshot
+
+
+def _status_counts(event_id):
+    """Current attendee status breakdown for an event, as {status: count}."""
+    counts = {}
+    for status, count in db.session.query(Attendee.status, db.func.count(Attendance.id)).join(Attendee).filter(
+            Attendance.event_id == event_id).group_by(Attendee.status):
+        counts[status or 'Other'] = counts.get(status or 'Other', 0) + count
+    return counts
+
+
+def record_analytics_delta(event_id, kind, when=None):
+    """Apply one RSVP/check-in/check-out to a live event's snapshot.
+
+    Call before committing the mutation so both land in the same transaction.
+    A frozen snapshot is discarded instead, since late changes to a finished
+    event are rare and it is cheaper to rebuild it on the next view.
+    """
+    snapshot = db.session.query(EventAnalyticsSnapshot).filter_by(event_id=event_id).with_for_update().first()
+    if snapshot is None:
+        return
+    if snapshot.frozen:
+        db.session.delete(snapshot)
+        return
+
+    def bump(counts, key, step):
+        counts = dict(counts or {})
+        counts[key] = counts.get(key, 0) + step
+        if counts[key] <= 0:
+            del counts[key]
+        return counts
+
+    if kind == 'rsvp':
+        snapshot.total_rsvps += 1
+        if when:
+            snapshot.rsvps_by_day = bump(snapshot.rsvps_by_day, when.strftime('%Y-%m-%d'), 1)
+    elif kind in ('check_in', 'check_out'):
+        step = 1 if kind == 'check_in' else -1
+        snapshot.checked_in_count = max(0, snapshot.checked_in_count + step)
+        if when:
+            snapshot.checkins_by_hour = bump(snapshot.checkins_by_hour, when.strftime('%H:00'), step)
+
+
+def invalidate_analytics_snapshot(event_id):
+    """Drop an event's snapshot after a bulk change; it is rebuilt on the next view."""
+    EventAnalyticsSnapshot.query.filter_by(event_id=event_id).delete()
+
+
+@app.cli.command('backfill-analytics')
+@click.option('--rebuild', is_flag=True, help='Recompute snapshots that are already frozen.')
+def backfill_analytics_command(rebuild):
+    """Build frozen analytics snapshots for events that have already ended."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    query = Event.query.filter(db.or_(
+        Event.end_datetime < now,
+        db.and_(Event.end_datetime.is_(None), Event.datetime < now - OPEN_ENDED_EVENT_DURATION)))
+    if not rebuild:
+        frozen_ids = db.session.query(EventAnalyticsSnapshot.event_id).filter_by(frozen=True)
+        query = query.filter(Event.id.notin_(frozen_ids))
+    count = 0
+    for event_id in [e.id for e in query.with_entities(Event.id)]:
+        build_analytics_snapshot(db.session.get(Event, event_id))
+        db.session.expunge_all()
+        count += 1
+    click.echo(f'Built {count} analytics snapshots')
+
+
+@app.route('/event/<int:event_id>/analytics')
+@reads_from_replica
+def event_analytics(event_id):
+    """Analytics dashboard for a specific event."""
+    has_access, event = check_event_dashboard_access(event_id)
+    if not has_access:
+        flash('Please enter the event passcode to access the dashboard.', 'warning')
+        return redirect(url_for('event_dashboard', event_id=event_id))
+    
+    snapshot = db.session.get(EventAnalyticsSnapshot, event_id)
+    if snapshot is None or (not snapshot.frozen and event_has_ended(event)):
+        snapshot = build_analytics_snapshot(event)
+    
+    total_rsvps = snapshot.total_rsvps
+    checked_in_count = snapshot.checked_in_count
+    check_in_rate = round((checked_in_count / total_rsvps * 100), 1) if total_rsvps > 0 else 0
+    
+    # Finished events carry their recent activity and status breakdown in the snapshot
+    recent_rsvps = snapshot.recent_rsvps if snapshot.frozen else _recent_rsvps_query(event_id).all()
+    status_counts = snapshot.status_counts if snapshot.frozen else _status_counts(event_id)
+    
+    return render_template('event_analytics.html',
+        event=event,
+        total_rsvps=total_rsvps,
+        checked_in_count=checked_in_count,
+        check_in_rate=check_in_rate,
+        status_counts=list((status_counts or {}).items()),
+        rsvps_by_day=sorted((snapshot.rsvps_by_day or {}).items()),
+        checkins_by_hour=sorted((snapshot.checkins_by_hour or {}).items()),
+        recent_rsvps=recent_rsvps
+    )
+
+# Legacy redirect
 @app.route('/organizer/event/<int:event_id>/analytics')
 def event_analytics_legacy(event_id):
     return redirect(url_for('event_analytics', event_id=event_id))
@@ -1242,9 +2928,14 @@ def check_in_attendee(event_id, attendance_id):
     if attendance.event_id != event_id:
         return jsonify({'error': 'Invalid attendance'}), 400
     
+    was_checked_in = attendance.checked_in
     attendance.checked_in = True
     attendance.check_in_time = datetime.now(timezone.utc).replace(tzinfo=None)
+    if not was_checked_in:
+        record_analytics_delta(event_id, 'check_in', when=attendance.check_in_time)
     db.session.commit()
+    if not was_checked_in:
+        publish_live_update(event_id, 'check_in', attendance)
     
     if request.headers.get('Accept') == 'application/json':
         return jsonify({'success': True, 'checked_in': True, 'check_in_time': attendance.check_in_time.isoformat()})
@@ -1268,9 +2959,14 @@ def check_out_attendee(event_id, attendance_id):
     if attendance.event_id != event_id:
         return jsonify({'error': 'Invalid attendance'}), 400
     
+    was_checked_in = attendance.checked_in
+    if was_checked_in:
+        record_analytics_delta(event_id, 'check_out', when=attendance.check_in_time)
     attendance.checked_in = False
     attendance.check_in_time = None
     db.session.commit()
+    if was_checked_in:
+        publish_live_update(event_id, 'check_out', attendance)
     
     if request.headers.get('Accept') == 'application/json':
         return jsonify({'success': True, 'checked_in': False})
@@ -1284,6 +2980,107 @@ def check_out_attendee_legacy(event_id, attendance_id):
     return redirect(url_for('check_out_attendee', event_id=event_id, attendance_id=attendance_id), code=307)
 
 
+def attendance_search_filter(query, status=None, search=None):
+    """Apply the attendee-list status/search filters to a query joined on Attendee."""
+    if status:
+        query = query.filter(Attendee.status == status)
+    if search:
+        pattern = f'%{search.lower()}%'
+        query = query.filter(db.or_(
+            db.func.lower(Attendee.name).like(pattern),
+            db.func.lower(Attendee.email).like(pattern),
+            db.func.lower(Attendee.contact).like(pattern),
+        ))
+    return query
+
+
+@app.route('/event/<int:event_id>/attendances/bulk', methods=['POST'])
+def bulk_check_in(event_id):
+    """Check in or check out many attendances in one transaction.
+
+    Accepts JSON {"action": "check_in"|"check_out", "ids": [...]} or, instead
+    of ids, {"filter": {"status": ..., "q": ...}} to target every matching
+    attendance. Returns a per-row result list.
+    """
+    has_access, event = check_event_dashboard_access(event_id)
+    if not has_access:
+        return jsonify({'error': 'Access denied'}), 403
+
+    data = request.get_json(silent=True) or {}
+    action = data.get('action')
+    if action not in ('check_in', 'check_out'):
+        return jsonify({'error': 'action must be check_in or check_out'}), 400
+
+    selection = db.session.query(Attendance.id).join(Attendee).filter(Attendance.event_id == event_id)
+    requested_ids = None
+    if data.get('ids') is not None:
+        try:
+            requested_ids = list(dict.fromkeys(int(i) for i in data['ids']))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'ids must be a list of integers'}), 400
+        if not requested_ids:
+            return jsonify({'success': True, 'updated': 0, 'results': []})
+        selection = selection.filter(Attendance.id.in_(requested_ids))
+    elif isinstance(data.get('filter'), dict):
+        criteria = data['filter']
+        selection = attendance_search_filter(selection, criteria.get('status'), (criteria.get('q') or '').strip())
+    else:
+        return jsonify({'error': 'Provide ids or filter'}), 400
+
+    rows = db.session.query(
+        Attendance.id, Attendance.checked_in, Attendance.check_in_time, Attendance.timestamp,
+        Attendee.name, Attendee.email, Attendee.contact, Attendee.status
+    ).join(Attendee).filter(Attendance.id.in_(selection.scalar_subquery())).all()
+
+    target = action == 'check_in'
+    now = datetime.now(timezone.utc).replace(tzinfo=None) if target else None
+    to_change = [row.id for row in rows if bool(row.checked_in) != target]
+    changed, current = set(), {}
+    if to_change:
+        # Re-check the state in the UPDATE: a single check-in may have landed
+        # since the read, and its check_in_time must not be overwritten
+        changed = set(db.session.execute(
+            db.update(Attendance).where(
+                Attendance.event_id == event_id,
+                Attendance.id.in_(to_change),
+                db.func.coalesce(Attendance.checked_in, False) != target
+            ).values(checked_in=target, check_in_time=now).returning(Attendance.id),
+            execution_options={'synchronize_session': False}).scalars())
+        raced = set(to_change) - changed
+        if raced:
+            current = {row.id: row for row in db.session.query(
+                Attendance.id, Attendance.checked_in, Attendance.check_in_time).filter(Attendance.id.in_(raced))}
+        if changed:
+            invalidate_analytics_snapshot(event_id)
+    db.session.commit()
+
+    results = []
+    for row in rows:
+        updated = row.id in changed
+        state = current.get(row.id, row)
+        payload = {
+            'attendance_id': row.id,
+            'name': row.name,
+            'email': row.email,
+            'contact': row.contact,
+            'status': row.status,
+            'checked_in': target if updated else bool(state.checked_in),
+            'check_in_time': (now if updated else state.check_in_time),
+            'timestamp': row.timestamp.isoformat() if row.timestamp else None,
+        }
+        if payload['check_in_time']:
+            payload['check_in_time'] = payload['check_in_time'].isoformat()
+        results.append({'result': 'updated' if updated else 'unchanged', **payload})
+    if changed:
+        publish_live_snapshot(event_id)
+
+    if requested_ids is not None:
+        found = {row.id for row in rows}
+        results.extend({'attendance_id': i, 'result': 'not_found'} for i in requested_ids if i not in found)
+
+    return jsonify({'success': True, 'updated': len(changed), 'results': results})
+
+
 @app.route('/event/<int:event_id>/scanner')
 def qr_scanner(event_id):
     """QR code scanner page for quick check-ins."""
@@ -1293,6 +3090,52 @@ def qr_scanner(event_id):
         return redirect(url_for('event_dashboard', event_id=event_id))
     return render_template('scanner.html', events=[event], single_event=event)
 
+@app.route('/event/<int:event_id>/scanner/keys')
+def scanner_keys(event_id):
+    """Per-event token keys so the scanner can validate tickets offline."""
+    has_access, event = check_event_dashboard_access(event_id)
+    if not has_access:
+        return jsonify({'error': 'Access denied'}), 403
+    response = jsonify({
+        'event_id': event_id,
+        'mac_bytes': CHECKIN_TOKEN_MAC_BYTES,
+        'keys': {str(kid): check_in_event_key(event_id, kid).hex() for kid in CHECKIN_TOKEN_KEYS},
+    })
+    response.headers['Cache-Control'] = 'private, no-store'
+    return response
+
+
+@app.cli.command('resign-checkin-tokens')
+@click.option('--event-id', type=int, help='Only re-sign tickets for this event.')
+def resign_checkin_tokens_command(event_id):
+    """Re-issue stored tokens with the active key (run before retiring an old key).
+
+    Legacy UUID tokens are upgraded as well. Previously issued QR codes stop
+    working once their key is removed from CHECKIN_TOKEN_KEYS.
+    """
+    query = db.session.query(Attendance.id, Attendance.event_id, Attendance.check_in_token).filter(
+        Attendance.event_id.isnot(None))
+    if event_id:
+        query = query.filter(Attendance.event_id == event_id)
+    table = Attendance.__table__
+    statement = table.update().where(table.c.id == db.bindparam('b_id')).values(check_in_token=db.bindparam('b_token'))
+    count, last_id = 0, 0
+    while True:
+        rows = query.filter(Attendance.id > last_id).order_by(Attendance.id).limit(IMPORT_BATCH_SIZE).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        updates = []
+        for attendance_id, att_event_id, token in rows:
+            claims = verify_check_in_token(token or '')
+            if claims is None or claims[2] != CHECKIN_ACTIVE_KID:
+                updates.append({'b_id': attendance_id, 'b_token': sign_check_in_token(attendance_id, att_event_id)})
+        if updates:
+            db.session.execute(statement, updates)
+            db.session.commit()
+            count += len(updates)
+    click.echo(f'Re-signed {count} check-in tokens with key {CHECKIN_ACTIVE_KID}')
+
 # Legacy redirect
 @app.route('/organizer/scanner')
 def qr_scanner_legacy():
@@ -1314,11 +3157,25 @@ def qr_checkin():
     if not token:
         return jsonify({'success': False, 'error': 'No QR code token provided'}), 400
     
-    # Find attendance by token
-    attendance = Attendance.query.filter_by(check_in_token=token).first()
+    # Signed tokens are checked cryptographically, so forged or wrong-event
+    # tickets are rejected before any database access
+    if is_signed_check_in_token(token):
+        claims = verify_check_in_token(token)
+        if claims is None:
+            return jsonify({'success': False, 'error': 'Invalid QR code - ticket not found'}), 404
+        if event_id and claims[1] != int(event_id):
+            return jsonify({'success': False, 'error': 'This ticket is for a different event'}), 400
+        attendance = db.session.get(Attendance, claims[0])
+        if attendance is not None and attendance.event_id != claims[1]:
+            attendance = None  # Signed for another event's RSVP that once had this id
+    else:
+        attendance = Attendance.query.filter_by(check_in_token=token).first()
     
     if not attendance:
         return jsonify({'success': False, 'error': 'Invalid QR code - ticket not found'}), 404
+    # Deleted events are hidden from loads, so their tickets come back without one
+    if attendance.event is None:
+        return jsonify({'success': False, 'error': 'This event has been deleted'}), 404
     
     # If event_id provided, check access for that event
     if event_id:
@@ -1348,7 +3205,9 @@ def qr_checkin():
     # Check in the attendee
     attendance.checked_in = True
     attendance.check_in_time = datetime.now(timezone.utc).replace(tzinfo=None)
+    record_analytics_delta(attendance.event_id, 'check_in', when=attendance.check_in_time)
     db.session.commit()
+    publish_live_update(attendance.event_id, 'check_in', attendance)
     
     return jsonify({
         'success': True,
@@ -1367,28 +3226,15 @@ def qr_checkin():
 @app.route('/api/attendance/<token>/qr')
 def get_qr_code(token):
     """Generate QR code image for an attendance token."""
-    attendance = Attendance.query.filter_by(check_in_token=token).first()
+    attendance = find_attendance_by_token(token)
     if not attendance:
         return jsonify({'error': 'Invalid token'}), 404
     
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(token)
-    qr.make(fit=True)
-    
-    img = qr.make_image(fill_color="#06b6d4", back_color="white")
-    buffer = io.BytesIO()
-    img.save(buffer, format='PNG')
-    buffer.seek(0)
-    
-    return send_file(buffer, mimetype='image/png')
+    return send_file(io.BytesIO(generate_qr_code_png(token)), mimetype='image/png')
 
 
 @app.route('/api/analytics')
+@reads_from_replica
 def api_analytics():
     """Return analytics data for charts."""
     # Events by month - process in Python for DB compatibility
@@ -1400,7 +3246,7 @@ def api_analytics():
     events_by_month = sorted(events_month_dict.items())
     
     # RSVPs by month - process in Python for DB compatibility
-    all_attendances = Attendance.query.filter(Attendance.timestamp.isnot(None)).all()
+    all_attendances = live_attendances().filter(Attendance.timestamp.isnot(None)).all()
     rsvps_month_dict = {}
     for a in all_attendances:
         month = a.timestamp.strftime('%Y-%m')
@@ -1413,8 +3259,8 @@ def api_analytics():
     ).group_by(Attendee.status).all()
     
     # Check-in stats
-    total_rsvps = Attendance.query.count()
-    checked_in = Attendance.query.filter_by(checked_in=True).count()
+    total_rsvps = live_attendances().count()
+    checked_in = live_attendances().filter(Attendance.checked_in.is_(True)).count()
     
     return jsonify({
         'events_by_month': [{'month': m, 'count': c} for m, c in events_by_month],
@@ -1433,28 +3279,19 @@ def event_attendees(event_id):
     status_filter = request.args.get('status')
     type_filter = request.args.get('type')
     search_query = request.args.get('q', '').strip().lower()
-    attendances = list(event.attendances)
-    # apply search filter
-    if search_query:
-        attendances = [a for a in attendances if 
-            search_query in a.attendee.name.lower() or 
-            search_query in a.attendee.email.lower() or 
-            (a.attendee.contact and search_query in a.attendee.contact.lower())]
+    query = db.session.query(
+        Attendance.id, Attendance.timestamp, Attendance.checked_in,
+        Attendee.name, Attendee.email, Attendee.contact, Attendee.status
+    ).join(Attendee, Attendee.id == Attendance.attendee_id).filter(Attendance.event_id == event_id)
+    query = attendance_search_filter(query, status_filter, search_query)
     # apply new/returning filter if requested
     if type_filter in ['new','returning']:
-        filtered = []
-        for a in attendances:
-            # determine if attendee has previous attendance before this one
-            prior = Attendance.query.filter(
-                Attendance.attendee_id == a.attendee_id,
-                Attendance.timestamp < a.timestamp
-            ).count()
-            is_returning = prior > 0
-            if (type_filter == 'new' and not is_returning) or (type_filter == 'returning' and is_returning):
-                filtered.append(a)
-        attendances = filtered
-    if status_filter:
-        attendances = [a for a in attendances if a.attendee.status == status_filter]
+        # returning = attendee has a previous attendance before this one
+        prior = db.aliased(Attendance)
+        has_prior = db.exists().where(prior.attendee_id == Attendance.attendee_id,
+                                      prior.timestamp < Attendance.timestamp)
+        query = query.filter(has_prior if type_filter == 'returning' else ~has_prior)
+    attendances = query.order_by(Attendance.id).all()
     return render_template('attendees.html', event=event, attendances=attendances)
 
 # Legacy redirect
@@ -1464,6 +3301,7 @@ def event_attendees_legacy(event_id):
 
 
 @app.route('/event/<int:event_id>/attendees/export')
+@reads_from_replica
 def export_attendees(event_id):
     has_access, event = check_event_dashboard_access(event_id)
     if not has_access:
@@ -1484,6 +3322,7 @@ def export_attendees_legacy(event_id):
 
 
 @app.route('/event/<int:event_id>/attendees/export-pdf')
+@reads_from_replica
 def export_attendees_pdf(event_id):
     """Export attendees list as a styled PDF document."""
     has_access, event = check_event_dashboard_access(event_id)
@@ -1596,8 +3435,563 @@ def export_attendees_pdf_legacy(event_id):
     return redirect(url_for('export_attendees_pdf', event_id=event_id))
 
 
-def generate_qr_code_base64(data):
-    """Generate a QR code and return as base64 string."""
+# Attendance data export
+# Admins (and `flask export-attendance`) can pull the joined Event x Attendance
+# x Attendee table as Parquet or an Arrow IPC stream. Rows come through a
+# server-side cursor (yield_per) and are written one Parquet row group / Arrow
+# record batch at a time, so memory is bounded by ATTENDANCE_EXPORT_BATCH_ROWS
+# however large the table is. Every export reports the highest attendance id it
+# covers (X-Export-Cursor); nightly pulls pass it back as after_id to fetch only
+# newer RSVPs, and since= also picks up older RSVPs checked in after that time.
+# Ids are handed out before commit, so a slow transaction can land below an id
+# that is already visible; the cursor only covers RSVPs older than
+# ATTENDANCE_EXPORT_SETTLE_SECONDS so those are not skipped by the next pull.
+ATTENDANCE_EXPORT_BATCH_ROWS = int(os.environ.get('ATTENDANCE_EXPORT_BATCH_ROWS', 50000))
+ATTENDANCE_EXPORT_SETTLE_SECONDS = int(os.environ.get('ATTENDANCE_EXPORT_SETTLE_SECONDS', 60))
+ATTENDANCE_EXPORT_MIMETYPES = {
+    'parquet': 'application/vnd.apache.parquet',
+    'arrow': 'application/vnd.apache.arrow.stream',
+}
+ATTENDANCE_EXPORT_COLUMNS = (
+    Attendance.id.label('attendance_id'), Attendance.timestamp.label('rsvp_at'),
+    Attendance.checked_in, Attendance.check_in_time,
+    Event.id.label('event_id'), Event.name.label('event_name'), Event.datetime.label('event_start'),
+    Event.end_datetime.label('event_end'), Event.venue, Event.creator_id.label('organizer_id'),
+    Attendee.id.label('attendee_id'), Attendee.name.label('attendee_name'),
+    Attendee.email.label('attendee_email'), Attendee.status.label('attendee_status'),
+    Attendee.user_id,
+)
+
+
+def attendance_export_schema():
+    timestamp = pa.timestamp('us')
+    return pa.schema([
+        ('attendance_id', pa.int64()), ('rsvp_at', timestamp),
+        ('checked_in', pa.bool_()), ('check_in_time', timestamp),
+        ('event_id', pa.int64()), ('event_name', pa.string()), ('event_start', timestamp),
+        ('event_end', timestamp), ('venue', pa.string()), ('organizer_id', pa.int64()),
+        ('attendee_id', pa.int64()), ('attendee_name', pa.string()),
+        ('attendee_email', pa.string()), ('attendee_status', pa.string()),
+        ('user_id', pa.int64()),
+    ])
+
+
+def attendance_export_criteria(start=None, end=None, organizer_id=None, after_id=None, since=None):
+    """Filters for an export: event date range, organizer and the incremental keys."""
+    criteria = []
+    if start:
+        criteria.append(Event.datetime >= start)
+    if end:
+        criteria.append(Event.datetime < end)
+    if organizer_id:
+        criteria.append(Event.creator_id == organizer_id)
+    if after_id and since:
+        criteria.append(db.or_(Attendance.id > after_id, Attendance.check_in_time >= since))
+    elif after_id:
+        criteria.append(Attendance.id > after_id)
+    elif since:
+        criteria.append(db.or_(Attendance.timestamp >= since, Attendance.check_in_time >= since))
+    return criteria
+
+
+def _attendance_export_select(*columns):
+    return db.select(*columns).select_from(Attendance).join(
+        Event, Event.id == Attendance.event_id).join(Attendee, Attendee.id == Attendance.attendee_id)
+
+
+def attendance_export_cursor(criteria, after_id=None):
+    """Highest settled attendance id matching criteria, which bounds the export and keys the next pull.
+
+    Falls back to after_id (or 0) when nothing has settled yet, so unsettled rows wait for the next pull.
+    """
+    settled = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=ATTENDANCE_EXPORT_SETTLE_SECONDS)
+    cursor = db.session.execute(_attendance_export_select(db.func.max(Attendance.id)).where(
+        *criteria, Attendance.timestamp <= settled)).scalar()
+    return cursor if cursor is not None else after_id or 0
+
+
+def iter_attendance_batches(criteria, batch_rows=None):
+    """Yield Arrow record batches of export rows, streamed from a server-side cursor."""
+    schema = attendance_export_schema()
+    stmt = _attendance_export_select(*ATTENDANCE_EXPORT_COLUMNS).where(*criteria).order_by(
+        Attendance.id).execution_options(yield_per=batch_rows or ATTENDANCE_EXPORT_BATCH_ROWS)
+    for rows in db.session.execute(stmt).partitions():
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)], schema=schema)
+
+
+class _ExportBuffer:
+    """Write-only file that hands back whatever was written since the last drain()."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def encode_attendance_export(fmt, batches):
+    """Yield the encoded file chunk by chunk: one row group (Parquet) or batch (Arrow) at a time."""
+    sink = _ExportBuffer()
+    schema = attendance_export_schema()
+    writer = pq.ParquetWriter(sink, schema) if fmt == 'parquet' else pa.ipc.new_stream(sink, schema)
+    for batch in batches:
+        writer.write_batch(batch)
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    writer.close()
+    yield sink.drain()
+
+
+@app.route('/admin/export/attendance.<any(parquet, arrow):fmt>')
+@reads_from_replica
+def export_attendance_data(fmt):
+    """Stream the attendance dataset for analysts.
+
+    Query params: from, to (ISO dates, on the event start), organizer (user id),
+    after_id (attendance id from a previous X-Export-Cursor), since (ISO time).
+    """
+    from flask import session
+    if not session.get('is_admin'):
+        flash('Admin access required.', 'danger')
+        return redirect(url_for('organizer_login'))
+    if not PYARROW_AVAILABLE:
+        flash('Parquet/Arrow export is not available on this server.', 'error')
+        return redirect(url_for('analytics_dashboard'))
+    try:
+        start = datetime.fromisoformat(request.args['from']) if request.args.get('from') else None
+        end = datetime.fromisoformat(request.args['to']) if request.args.get('to') else None
+        since = datetime.fromisoformat(request.args['since']) if request.args.get('since') else None
+    except ValueError:
+        return jsonify({'error': 'from/to/since must be ISO dates'}), 400
+    after_id = request.args.get('after_id', type=int)
+
+    criteria = attendance_export_criteria(start, end, request.args.get('organizer', type=int), after_id, since)
+    # Rows committed while streaming, or too recently to have settled, are left for the next pull
+    cursor = attendance_export_cursor(criteria, after_id)
+    criteria.append(Attendance.id <= cursor)
+    response = Response(stream_with_context(encode_attendance_export(fmt, iter_attendance_batches(criteria))),
+                        mimetype=ATTENDANCE_EXPORT_MIMETYPES[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename=attendance.{fmt}'
+    response.headers['X-Export-Cursor'] = str(cursor)
+    response.cache_control.no_store = True
+    return response
+
+
+@app.cli.command('export-attendance')
+@click.argument('out_file', type=click.Path(dir_okay=False, writable=True))
+@click.option('--format', 'fmt', type=click.Choice(sorted(ATTENDANCE_EXPORT_MIMETYPES)), default=None,
+              help='Defaults to the file extension (.arrow, otherwise parquet).')
+@click.option('--from', 'start', type=click.DateTime(), default=None, help='Events starting at or after this date.')
+@click.option('--to', 'end', type=click.DateTime(), default=None, help='Events starting before this date.')
+@click.option('--organizer', type=int, default=None, help='Only events created by this user id.')
+@click.option('--after-id', type=int, default=None, help='Only attendances after this id (the last run\'s cursor).')
+@click.option('--since', type=click.DateTime(), default=None, help='Attendances created or checked in since this time.')
+def export_attendance_command(out_file, fmt, start, end, organizer, after_id, since):
+    """Write the Event x Attendance x Attendee dataset to a Parquet or Arrow file."""
+    if not PYARROW_AVAILABLE:
+        raise click.ClickException('pyarrow is not installed')
+    fmt = fmt or ('arrow' if out_file.endswith('.arrow') else 'parquet')
+    criteria = attendance_export_criteria(start, end, organizer, after_id, since)
+    cursor = attendance_export_cursor(criteria, after_id)
+    criteria.append(Attendance.id <= cursor)
+    rows = 0
+
+    def counted(batches):
+        nonlocal rows
+        for batch in batches:
+            rows += batch.num_rows
+            yield batch
+
+    with open(out_file, 'wb') as f:
+        for chunk in encode_attendance_export(fmt, counted(iter_attendance_batches(criteria))):
+            f.write(chunk)
+    click.echo(f'Wrote {rows} attendances to {out_file}; next run: --after-id {cursor}')
+
+
+# Printable badge sheets
+# QR rendering and page layout are CPU bound, so badges are split into page
+# chunks rendered on a process pool and merged into one PDF. Jobs run on a
+# background thread; their status lives in a JSON file next to the output so
+# any worker process on the host can report progress and serve the download.
+BADGE_COLUMNS, BADGE_ROWS = 2, 4
+BADGE_PAGES_PER_CHUNK = 25
+BADGE_JOB_DIR = os.path.join(tempfile.gettempdir(), 'attendeez-badges')
+BADGE_JOB_TTL = 3600  # seconds a finished sheet is kept for download
+# Each gunicorn worker has its own pool, so gunicorn.conf.py splits the cores
+# between them; outside gunicorn one process renders per core
+BADGE_WORKERS = int(os.environ.get('BADGE_WORKERS', 0)) or os.cpu_count() or 1
+_badge_pool = None
+_badge_pool_lock = threading.Lock()
+
+def _badge_qr_image(token):
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M, box_size=6, border=1)
+    qr.add_data(token)
+    qr.make(fit=True)
+    return ImageReader(qr.make_image(fill_color='black', back_color='white').get_image())
+
+def _fit_text(text, font, size, width):
+    text = text or ''
+    while text and stringWidth(text, font, size) > width:
+        text = text[:-2] + '…' if len(text) > 1 else ''
+    return text
+
+def render_badge_chunk(event_name, event_line, badges):
+    """Render one chunk of badges (name, status, token) to PDF bytes.
+
+    Runs in a worker process, so it only takes plain data.
+    """
+    buffer = io.BytesIO()
+    page_width, page_height = A4
+    c = pdf_canvas.Canvas(buffer, pagesize=A4)
+    margin = 12 * mm
+    badge_w = (page_width - 2 * margin) / BADGE_COLUMNS
+    badge_h = (page_height - 2 * margin) / BADGE_ROWS
+    qr_size = min(badge_h - 16 * mm, 34 * mm)
+    per_page = BADGE_COLUMNS * BADGE_ROWS
+
+    for index, (name, status, token) in enumerate(badges):
+        slot = index % per_page
+        if index and slot == 0:
+            c.showPage()
+        col, row = slot % BADGE_COLUMNS, slot // BADGE_COLUMNS
+        x = margin + col * badge_w
+        y = page_height - margin - (row + 1) * badge_h
+
+        c.setStrokeColor(colors.HexColor('#e5e7eb'))
+        c.roundRect(x + 2 * mm, y + 2 * mm, badge_w - 4 * mm, badge_h - 4 * mm, 4 * mm)
+        text_w = badge_w - qr_size - 14 * mm
+        c.setFillColor(colors.HexColor('#06b6d4'))
+        c.setFont('Helvetica-Bold', 9)
+        c.drawString(x + 6 * mm, y + badge_h - 12 * mm, _fit_text(event_name, 'Helvetica-Bold', 9, text_w))
+        c.setFillColor(colors.HexColor('#111827'))
+        c.setFont('Helvetica-Bold', 14)
+        c.drawString(x + 6 * mm, y + badge_h / 2, _fit_text(name, 'Helvetica-Bold', 14, text_w))
+        c.setFillColor(colors.HexColor('#6b7280'))
+        c.setFont('Helvetica', 9)
+        c.drawString(x + 6 * mm, y + badge_h / 2 - 6 * mm, _fit_text(status or '', 'Helvetica', 9, text_w))
+        c.drawString(x + 6 * mm, y + 8 * mm, _fit_text(event_line, 'Helvetica', 8, text_w))
+        c.drawImage(_badge_qr_image(token), x + badge_w - qr_size - 6 * mm, y + 8 * mm, qr_size, qr_size)
+
+    c.save()
+    return buffer.getvalue()
+
+def _get_badge_pool():
+    global _badge_pool
+    with _badge_pool_lock:
+        if _badge_pool is None:
+            # Renderers start from a clean server process rather than forking
+            # this one while its request and live-feed threads hold locks
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _badge_pool = ProcessPoolExecutor(max_workers=BADGE_WORKERS,
+                                              mp_context=multiprocessing.get_context(method))
+        return _badge_pool
+
+def render_badges_pdf(event_name, event_line, badges, out_path, executor=None, progress=None):
+    """Render all badges in page chunks on a process pool and merge into out_path."""
+    chunk_size = BADGE_COLUMNS * BADGE_ROWS * BADGE_PAGES_PER_CHUNK
+    chunks = [badges[i:i + chunk_size] for i in range(0, len(badges), chunk_size)] or [[]]
+    executor = executor or _get_badge_pool()
+    futures = {executor.submit(render_badge_chunk, event_name, event_line, chunk): i
+               for i, chunk in enumerate(chunks)}
+    parts = [None] * len(chunks)
+    for done, future in enumerate(as_completed(futures), 1):
+        parts[futures[future]] = future.result()
+        if progress:
+            progress(done, len(chunks))
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(io.BytesIO(part))
+    with open(out_path, 'wb') as f:
+        writer.write(f)
+
+def _badge_job_path(job_id, ext):
+    return os.path.join(BADGE_JOB_DIR, f'{job_id}.{ext}')
+
+def _write_badge_job(job_id, **status):
+    tmp = _badge_job_path(job_id, 'json.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(status, f)
+    os.replace(tmp, _badge_job_path(job_id, 'json'))
+
+def _read_badge_job(job_id):
+    if not job_id.isalnum():
+        return None
+    try:
+        with open(_badge_job_path(job_id, 'json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _prune_badge_jobs():
+    cutoff = time.time() - BADGE_JOB_TTL
+    for entry in os.scandir(BADGE_JOB_DIR):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+def _run_badge_job(job_id, event_id, event_name, event_line, badges):
+    base = {'event_id': event_id, 'total': len(badges)}
+    try:
+        def progress(done, total):
+            _write_badge_job(job_id, status='running', chunks_done=done, chunks_total=total, **base)
+        render_badges_pdf(event_name, event_line, badges, _badge_job_path(job_id, 'pdf'), progress=progress)
+        _write_badge_job(job_id, status='done', **base)
+    except Exception as e:
+        app.logger.error(f"Badge job {job_id} failed: {e}")
+        _write_badge_job(job_id, status='failed', error=str(e), **base)
+
+
+@app.route('/event/<int:event_id>/badges', methods=['POST'])
+def start_badge_export(event_id):
+    """Start a background badge-sheet export and return its job id."""
+    has_access, event = check_event_dashboard_access(event_id)
+    if not has_access:
+        return jsonify({'error': 'Access denied'}), 403
+    if not (REPORTLAB_AVAILABLE and QRCODE_AVAILABLE and PYPDF_AVAILABLE):
+        return jsonify({'error': 'Badge export is not available on this server.'}), 503
+
+    rows = db.session.query(Attendance.id, Attendance.check_in_token, Attendee.name, Attendee.status).join(
+        Attendee).filter(Attendance.event_id == event_id).order_by(Attendee.name).all()
+    badges = [(name, status, token or sign_check_in_token(attendance_id, event_id))
+              for attendance_id, token, name, status in rows]
+    event_date = event.datetime.strftime('%B %d, %Y') if event.datetime else 'Date TBA'
+    event_line = f"{event_date} · {event.venue}" if event.venue else event_date
+
+    os.makedirs(BADGE_JOB_DIR, exist_ok=True)
+    _prune_badge_jobs()
+    job_id = uuid.uuid4().hex
+    _write_badge_job(job_id, status='queued', event_id=event_id, total=len(badges), chunks_done=0)
+    threading.Thread(target=_run_badge_job, args=(job_id, event_id, event.name, event_line, badges),
+                     name=f'badges-{job_id}', daemon=True).start()
+    return jsonify({
+        'job_id': job_id,
+        'status_url': url_for('badge_job_status', job_id=job_id),
+    }), 202
+
+
+@app.route('/badges/jobs/<job_id>')
+def badge_job_status(job_id):
+    """Progress of a badge export job."""
+    job = _read_badge_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    has_access, _ = check_event_dashboard_access(job['event_id'])
+    if not has_access:
+        return jsonify({'error': 'Access denied'}), 403
+    if job['status'] == 'done':
+        job['download_url'] = url_for('badge_job_download', job_id=job_id)
+    return jsonify(job)
+
+
+@app.route('/badges/jobs/<job_id>/download')
+def badge_job_download(job_id):
+    """Stream a finished badge sheet."""
+    job = _read_badge_job(job_id)
+    if job is None or job['status'] != 'done':
+        return jsonify({'error': 'Job not found or not finished'}), 404
+    has_access, _ = check_event_dashboard_access(job['event_id'])
+    if not has_access:
+        return jsonify({'error': 'Access denied'}), 403
+    return send_file(_badge_job_path(job_id, 'pdf'), mimetype='application/pdf',
+                     download_name=f"event_{job['event_id']}_badges.pdf")
+
+
+IMPORT_BATCH_SIZE = 1000
+
+def _import_rows(reader):
+    """Yield normalized (name, email, contact, status) rows from a CSV DictReader."""
+    for raw in reader:
+        row = {(k or '').strip().lower(): (v or '').strip() for k, v in raw.items()}
+        email = row.get('email', '').lower()
+        if '@' not in email:
+            yield None
+            continue
+        yield {
+            'name': row.get('name') or email.split('@')[0],
+            'email': email,
+            'contact': row.get('contact') or row.get('phone') or '',
+            'status': row.get('status') if row.get('status') in ('Student', 'Working', 'Other') else 'Other',
+        }
+
+
+def _import_batch(event_id, batch, summary):
+    """Insert one batch of rows: match attendees by email, then add missing RSVPs."""
+    # Deduplicate within the batch, first row wins
+    by_email = {}
+    for row in batch:
+        by_email.setdefault(row['email'], row)
+    emails = list(by_email)
+
+    existing = {}
+    for attendee_id, email in db.session.query(Attendee.id, Attendee.email).filter(
+            Attendee.email.in_(emails)).order_by(Attendee.id.desc()):
+        existing[email] = attendee_id  # Lowest id wins, matching .first()
+
+    new_attendees = [by_email[email] for email in emails if email not in existing]
+    summary['matched_attendees'] += len(existing)
+    if new_attendees:
+        db.session.execute(Attendee.__table__.insert(), new_attendees)
+        for attendee_id, email in db.session.query(Attendee.id, Attendee.email).filter(
+                Attendee.email.in_([a['email'] for a in new_attendees])).order_by(Attendee.id.desc()):
+            existing.setdefault(email, attendee_id)
+        summary['created_attendees'] += len(new_attendees)
+
+    attendee_ids = list(existing.values())
+    registered = {attendee_id for (attendee_id,) in db.session.query(Attendance.attendee_id).filter(
+        Attendance.event_id == event_id, Attendance.attendee_id.in_(attendee_ids))}
+    new_attendances = [
+        {'event_id': event_id, 'attendee_id': attendee_id}
+        for attendee_id in attendee_ids if attendee_id not in registered
+    ]
+    summary['skipped_duplicates'] += len(batch) - len(new_attendances)
+    new_ids = []
+    if new_attendances:
+        db.session.execute(Attendance.__table__.insert(), new_attendances)
+        # Signed tokens embed the row id, so fill them in once ids exist
+        new_ids = [attendance_id for (attendance_id,) in db.session.query(Attendance.id).filter(
+            Attendance.event_id == event_id,
+            Attendance.attendee_id.in_([a['attendee_id'] for a in new_attendances]),
+            Attendance.check_in_token.is_(None))]
+        table = Attendance.__table__
+        db.session.execute(
+            table.update().where(table.c.id == db.bindparam('b_id')).values(check_in_token=db.bindparam('b_token')),
+            [{'b_id': attendance_id, 'b_token': sign_check_in_token(attendance_id, event_id)} for attendance_id in new_ids]
+        )
+        invalidate_analytics_snapshot(event_id)
+        invalidate_calendar_feeds('rsvps')
+        queue_cdn_purge(db.session(), 'events', f'event-{event_id}')
+        summary['created_rsvps'] += len(new_attendances)
+    db.session.commit()
+    return new_ids
+
+
+def import_attendees_csv(event, fileobj, send_emails=False, background=True):
+    """Stream a CSV of attendees (name, email, contact, status) into an event.
+
+    Rows are processed in batches of IMPORT_BATCH_SIZE with one IN lookup per
+    batch and executemany inserts. Re-importing the same file is a no-op since
+    existing RSVPs are skipped. Returns a summary dict of counts.
+    """
+    summary = {'rows': 0, 'invalid': 0, 'matched_attendees': 0, 'created_attendees': 0,
+               'created_rsvps': 0, 'skipped_duplicates': 0}
+    new_ids = []
+    batch = []
+    for row in _import_rows(csv.DictReader(fileobj)):
+        summary['rows'] += 1
+        if row is None:
+            summary['invalid'] += 1
+            continue
+        batch.append(row)
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            new_ids.extend(_import_batch(event.id, batch, summary))
+            batch = []
+    if batch:
+        new_ids.extend(_import_batch(event.id, batch, summary))
+
+    if send_emails and new_ids:
+        if background:
+            threading.Thread(target=send_import_confirmations, args=(event.id, new_ids),
+                             name=f'import-emails-{event.id}', daemon=True).start()
+        else:
+            send_import_confirmations(event.id, new_ids)
+    return summary
+
+
+def send_import_confirmations(event_id, attendance_ids):
+    """Send confirmation emails for imported RSVPs, loading them in chunks."""
+    with app.app_context():
+        event = db.session.get(Event, event_id)
+        # One SMTP connection for the whole import, throttled like reminders
+        sender = SMTPBatchSender(_smtp_settings(), REMINDER_RATE)
+        try:
+            for start in range(0, len(attendance_ids), IMPORT_BATCH_SIZE):
+                chunk = attendance_ids[start:start + IMPORT_BATCH_SIZE]
+                attendances = Attendance.query.options(db.joinedload(Attendance.attendee)).filter(
+                    Attendance.id.in_(chunk)).all()
+                for attendance in attendances:
+                    send_confirmation_email(attendance.attendee, event, attendance, sender=sender)
+                db.session.expunge_all()
+        finally:
+            sender.close()
+
+
+@app.route('/event/<int:event_id>/attendees/import', methods=['POST'])
+def import_attendees(event_id):
+    """Bulk import attendees from an uploaded CSV file."""
+    has_access, event = check_event_dashboard_access(event_id)
+    wants_json = request.headers.get('Accept') == 'application/json'
+    if not has_access:
+        if wants_json:
+            return jsonify({'error': 'Access denied'}), 403
+        return redirect(url_for('event_dashboard', event_id=event_id))
+
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        if wants_json:
+            return jsonify({'error': 'No CSV file uploaded'}), 400
+        flash('Please choose a CSV file to import.', 'warning')
+        return redirect(url_for('event_attendees', event_id=event_id))
+
+    try:
+        stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+        summary = import_attendees_csv(event, stream, send_emails=bool(request.form.get('send_emails')))
+    except (UnicodeDecodeError, csv.Error) as e:
+        db.session.rollback()
+        if wants_json:
+            return jsonify({'error': f'Could not read CSV: {e}'}), 400
+        flash('Could not read that file. Please upload a UTF-8 CSV.', 'danger')
+        return redirect(url_for('event_attendees', event_id=event_id))
+
+    if wants_json:
+        return jsonify({'success': True, **summary})
+    flash(f"Imported {summary['created_rsvps']} attendees "
+          f"({summary['skipped_duplicates']} already registered, {summary['invalid']} invalid rows).", 'success')
+    return redirect(url_for('event_attendees', event_id=event_id))
+
+
+@app.cli.command('import-attendees')
+@click.argument('event_id', type=int)
+@click.argument('csv_file', type=click.File('r', encoding='utf-8-sig'))
+@click.option('--send-emails', is_flag=True, help='Send confirmation emails to newly registered attendees.')
+def import_attendees_command(event_id, csv_file, send_emails):
+    """Bulk import attendees for EVENT_ID from CSV_FILE."""
+    event = db.session.get(Event, event_id)
+    if event is None:
+        raise click.ClickException(f'Event {event_id} not found')
+    start = time.perf_counter()
+    # The CLI process exits when done, so send any emails before returning
+    summary = import_attendees_csv(event, csv_file, send_emails=send_emails, background=False)
+    for key, value in summary.items():
+        click.echo(f'{key}: {value}')
+    click.echo(f'took {time.perf_counter() - start:.2f}s')
+
+
+def generate_qr_code_png(data):
+    """Generate a QR code and return the PNG bytes."""
     if not QRCODE_AVAILABLE:
         return None
     qr = qrcode.QRCode(
@@ -1612,22 +4006,23 @@ def generate_qr_code_base64(data):
     img = qr.make_image(fill_color="#06b6d4", back_color="white")
     buffer = io.BytesIO()
     img.save(buffer, format='PNG')
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return buffer.getvalue()
 
 
-def send_confirmation_email(attendee, event, attendance=None):
-    """Send a styled confirmation email with QR code if SMTP is configured.
-    Falls back to console log when not configured.
+@functools.lru_cache(maxsize=256)
+def _confirmation_email_parts(event_name, event_date, time_display, venue, with_qr):
+    """Render the event part of the confirmation email once per event.
+
+    Keyed on the displayed event fields, so editing an event renders afresh.
     """
-    smtp_host = os.environ.get('SMTP_HOST')
-    smtp_port = int(os.environ.get('SMTP_PORT', 0) or 0)
-    smtp_user = os.environ.get('SMTP_USER')
-    smtp_pass = os.environ.get('SMTP_PASS')
-    
-    # Debug logging
-    app.logger.info(f"Email config - HOST: {bool(smtp_host)}, PORT: {smtp_port}, USER: {bool(smtp_user)}, PASS: {bool(smtp_pass)}")
-    
+    context = {'event_name': event_name, 'event_date': event_date,
+               'time_display': time_display, 'venue': venue, 'with_qr': with_qr}
+    return (tuple(render_email_parts('emails/confirmation.html', **context)),
+            tuple(render_email_parts('emails/confirmation.txt', **context)))
+
+
+def render_confirmation_email(attendee, event, attendance=None):
+    """Return (subject, plain_body, html_body, qr_png) for one attendee."""
     subject = f"🎉 You're confirmed for {event.name}!"
     
     # Format event datetime nicely
@@ -1635,247 +4030,305 @@ def send_confirmation_email(attendee, event, attendance=None):
     event_time = event.datetime.strftime('%I:%M %p') if event.datetime else 'TBA'
     end_time = event.end_datetime.strftime('%I:%M %p') if event.end_datetime else None
     time_display = f"{event_time} - {end_time}" if end_time else event_time
-    
-    # Plain text version
-    plain_body = f"""Hi {attendee.name},
-
-You're all set! Your RSVP for "{event.name}" has been confirmed.
-
-EVENT DETAILS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📅 Date: {event_date}
-⏰ Time: {time_display}
-📍 Venue: {event.venue or 'TBA'}
-
-We're excited to see you there!
-
-— The ATTENDEEZ Team
-"""
-
-    # HTML version with styling (email-compatible)
-    html_body = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="margin: 0; padding: 0; background-color: #f4f4f5; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;">
-    <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="background-color: #f4f4f5;">
-        <tr>
-            <td align="center" style="padding: 40px 20px;">
-                <table role="presentation" width="100%" style="max-width: 600px; background-color: #ffffff; border-radius: 16px; overflow: hidden; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-                    <!-- Header with cyan accent -->
-                    <tr>
-                        <td style="background-color: #06b6d4; padding: 30px 40px; text-align: center;">
-                            <h1 style="margin: 0; font-size: 28px; font-weight: 700; color: #ffffff; letter-spacing: 1px;">ATTENDEEZ</h1>
-                        </td>
-                    </tr>
-                    
-                    <!-- Success Icon & Message -->
-                    <tr>
-                        <td style="padding: 40px 40px 20px; text-align: center;">
-                            <table role="presentation" align="center" cellspacing="0" cellpadding="0">
-                                <tr>
-                                    <td style="width: 70px; height: 70px; background-color: #dcfce7; border-radius: 50%; text-align: center; vertical-align: middle;">
-                                        <span style="font-size: 32px; line-height: 70px; color: #22c55e;">✓</span>
-                                    </td>
-                                </tr>
-                            </table>
-                            <h2 style="margin: 20px 0 8px; font-size: 24px; font-weight: 600; color: #111827;">You're All Set, {attendee.name}!</h2>
-                            <p style="margin: 0; font-size: 16px; color: #6b7280;">Your RSVP has been confirmed</p>
-                        </td>
-                    </tr>
-                    
-                    <!-- Event Card -->
-                    <tr>
-                        <td style="padding: 0 40px 30px;">
-                            <table role="presentation" width="100%" style="background-color: #f9fafb; border-radius: 12px; border: 1px solid #e5e7eb;">
-                                <tr>
-                                    <td style="padding: 24px;">
-                                        <h3 style="margin: 0 0 20px; font-size: 20px; font-weight: 600; color: #06b6d4;">{event.name}</h3>
-                                        
-                                        <table role="presentation" width="100%" cellspacing="0" cellpadding="0">
-                                            <tr>
-                                                <td style="padding: 10px 0;">
-                                                    <table role="presentation" cellspacing="0" cellpadding="0">
-                                                        <tr>
-                                                            <td style="width: 40px; height: 40px; background-color: #e0f2fe; border-radius: 8px; text-align: center; vertical-align: middle;">
-                                                                <span style="font-size: 18px; line-height: 40px;">📅</span>
-                                                            </td>
-                                                            <td style="padding-left: 14px;">
-                                                                <p style="margin: 0; font-size: 12px; color: #6b7280;">Date</p>
-                                                                <p style="margin: 2px 0 0; font-size: 15px; font-weight: 500; color: #111827;">{event_date}</p>
-                                                            </td>
-                                                        </tr>
-                                                    </table>
-                                                </td>
-                                            </tr>
-                                            <tr>
-                                                <td style="padding: 10px 0;">
-                                                    <table role="presentation" cellspacing="0" cellpadding="0">
-                                                        <tr>
-                                                            <td style="width: 40px; height: 40px; background-color: #e0f2fe; border-radius: 8px; text-align: center; vertical-align: middle;">
-                                                                <span style="font-size: 18px; line-height: 40px;">⏰</span>
-                                                            </td>
-                                                            <td style="padding-left: 14px;">
-                                                                <p style="margin: 0; font-size: 12px; color: #6b7280;">Time</p>
-                                                                <p style="margin: 2px 0 0; font-size: 15px; font-weight: 500; color: #111827;">{time_display}</p>
-                                                            </td>
-                                                        </tr>
-                                                    </table>
-                                                </td>
-                                            </tr>
-                                            <tr>
-                                                <td style="padding: 10px 0;">
-                                                    <table role="presentation" cellspacing="0" cellpadding="0">
-                                                        <tr>
-                                                            <td style="width: 40px; height: 40px; background-color: #e0f2fe; border-radius: 8px; text-align: center; vertical-align: middle;">
-                                                                <span style="font-size: 18px; line-height: 40px;">📍</span>
-                                                            </td>
-                                                            <td style="padding-left: 14px;">
-                                                                <p style="margin: 0; font-size: 12px; color: #6b7280;">Venue</p>
-                                                                <p style="margin: 2px 0 0; font-size: 15px; font-weight: 500; color: #111827;">{event.venue or 'To be announced'}</p>
-                                                            </td>
-                                                        </tr>
-                                                    </table>
-                                                </td>
-                                            </tr>
-                                        </table>
-                                    </td>
-                                </tr>
-                            </table>
-                        </td>
-                    </tr>
-"""
 
     # Add QR code section if attendance has a token
-    qr_section = ""
-    qr_image_data = None
+    qr_png = None
     if attendance and attendance.check_in_token:
-        qr_image_data = generate_qr_code_base64(attendance.check_in_token)
-        qr_section = """
-                    <!-- QR Code Section -->
-                    <tr>
-                        <td style="padding: 0 40px 30px;">
-                            <table role="presentation" width="100%" style="background-color: #f0fdfa; border-radius: 12px; border: 2px dashed #06b6d4;">
-                                <tr>
-                                    <td style="padding: 24px; text-align: center;">
-                                        <p style="margin: 0 0 16px; font-size: 14px; font-weight: 600; color: #0891b2;">🎟️ YOUR CHECK-IN QR CODE</p>
-                                        <img src="cid:qrcode" alt="Check-in QR Code" width="180" height="180" style="width: 180px; height: 180px; border-radius: 8px; border: 1px solid #e5e7eb;">
-                                        <p style="margin: 16px 0 0; font-size: 13px; color: #6b7280;">Present this QR code at the event for quick check-in</p>
-                                    </td>
-                                </tr>
-                            </table>
-                        </td>
-                    </tr>
-"""
-
-    html_body += qr_section
-    html_body += """
-                    <!-- Footer -->
-                    <tr>
-                        <td style="padding: 24px 40px; background-color: #f9fafb; border-top: 1px solid #e5e7eb; text-align: center;">
-                            <p style="margin: 0 0 8px; font-size: 14px; color: #374151;">We're excited to see you there! 🎉</p>
-                            <p style="margin: 0; font-size: 12px; color: #6b7280;">— The ATTENDEEZ Team</p>
-                        </td>
-                    </tr>
-                </table>
-                
-                <!-- Legal Footer -->
-                <table role="presentation" width="100%" style="max-width: 600px; margin-top: 24px;">
-                    <tr>
-                        <td style="text-align: center;">
-                            <p style="margin: 0; font-size: 11px; color: #9ca3af;">
-                                You received this email because you registered for an event on ATTENDEEZ.
-                            </p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>
-"""
-
-    if smtp_host and smtp_port and smtp_user and smtp_pass:
+        qr_png = generate_qr_code_png(attendance.check_in_token)
+
+    html_parts, text_parts = _confirmation_email_parts(event.name, event_date, time_display,
+                                                       event.venue, qr_png is not None)
+    plain_body = attendee.name.join(text_parts)
+    html_body = str(escape(attendee.name)).join(html_parts)
+    return subject, plain_body, html_body, qr_png
+
+
+def build_confirmation_message(attendee, event, attendance=None, sender_address='ATTENDEEZ'):
+    """Build the confirmation email as a MIME message with the QR code inline."""
+    subject, plain_body, html_body, qr_png = render_confirmation_email(attendee, event, attendance)
+
+    # Use multipart/related to embed images with CID
+    msg = MIMEMultipart('related')
+    msg['Subject'] = subject
+    msg['From'] = sender_address
+    msg['To'] = attendee.email
+    
+    # Create alternative part for plain text and HTML
+    msg_alternative = MIMEMultipart('alternative')
+    msg.attach(msg_alternative)
+    msg_alternative.attach(MIMEText(plain_body, 'plain'))
+    msg_alternative.attach(MIMEText(html_body, 'html'))
+    
+    # Attach QR code image if available
+    if qr_png:
+        qr_image = MIMEImage(qr_png, _subtype='png', name='qrcode.png')
+        qr_image.add_header('Content-ID', '<qrcode>')
+        qr_image.add_header('Content-Disposition', 'inline', filename='qrcode.png')
+        msg.attach(qr_image)
+    return msg
+
+
+def send_confirmation_email(attendee, event, attendance=None, sender=None):
+    """Send a styled confirmation email with QR code if SMTP is configured.
+    Falls back to console log when not configured. Pass an SMTPBatchSender
+    to reuse its connection when sending many.
+    """
+    settings = sender.settings if sender else _smtp_settings()
+    if settings is None:
+        # not configured — print to console for development
+        subject, plain_body, _, _ = render_confirmation_email(attendee, event, attendance)
+        print(f"[EMAIL] To: {attendee.email}\nSubject: {subject}\n\n{plain_body}")
+        return
+
+    try:
+        msg = build_confirmation_message(attendee, event, attendance, f"ATTENDEEZ <{settings[2]}>")
+        if sender:
+            sender.send(msg)
+        else:
+            smtp_host, smtp_port, smtp_user, smtp_pass = settings
+            with smtplib.SMTP(smtp_host, smtp_port, timeout=10) as smtp:
+                smtp.starttls()
+                smtp.login(smtp_user, smtp_pass)
+                smtp.send_message(msg)
+        app.logger.info(f"Confirmation email sent to {attendee.email}")
+    except Exception as e:
+        app.logger.warning(f"Failed to send email: {e}")
+
+
+def notify_cleared_passcodes(event_ids):
+    """Email the organizers of events whose duplicate legacy passcode was cleared.
+
+    Runs at startup without a request context, so the message is plain text.
+    Falls back to console log when SMTP is not configured.
+    """
+    rows = db.session.query(Event.name, User.email).join(User, User.id == Event.creator_id).filter(
+        Event.id.in_(event_ids)).all()
+    settings = _smtp_settings()
+    for event_name, email in rows:
+        subject = f'Set a new dashboard passcode for "{event_name}"'
+        body = (f'The dashboard passcode for "{event_name}" was also used by another event, so it has been '
+                'cleared. Anyone you shared it with can no longer open the dashboard.\n\n'
+                'Open My Events and edit the event to set a new passcode.\n')
+        if settings is None:
+            print(f"[EMAIL] To: {email}\nSubject: {subject}\n\n{body}")
+            continue
         try:
-            # Use multipart/related to embed images with CID
-            msg = MIMEMultipart('related')
+            msg = EmailMessage()
             msg['Subject'] = subject
-            msg['From'] = f"ATTENDEEZ <{smtp_user}>"
-            msg['To'] = attendee.email
-            
-            # Create alternative part for plain text and HTML
-            msg_alternative = MIMEMultipart('alternative')
-            msg.attach(msg_alternative)
-            
-            # Attach both plain text and HTML versions
-            part1 = MIMEText(plain_body, 'plain')
-            part2 = MIMEText(html_body, 'html')
-            msg_alternative.attach(part1)
-            msg_alternative.attach(part2)
-            
-            # Attach QR code image if available
-            if qr_image_data:
-                qr_image = MIMEImage(base64.b64decode(qr_image_data), name='qrcode.png')
-                qr_image.add_header('Content-ID', '<qrcode>')
-                qr_image.add_header('Content-Disposition', 'inline', filename='qrcode.png')
-                msg.attach(qr_image)
-
+            msg['From'] = f"ATTENDEEZ <{settings[2]}>"
+            msg['To'] = email
+            msg.set_content(body)
+            smtp_host, smtp_port, smtp_user, smtp_pass = settings
             with smtplib.SMTP(smtp_host, smtp_port, timeout=10) as smtp:
                 smtp.starttls()
                 smtp.login(smtp_user, smtp_pass)
-                smtp.sendmail(smtp_user, attendee.email, msg.as_string())
-            app.logger.info(f"Confirmation email sent to {attendee.email}")
+                smtp.send_message(msg)
         except Exception as e:
-            app.logger.warning(f"Failed to send email: {e}")
-    else:
-        # not configured — print to console for development
-        print(f"[EMAIL] To: {attendee.email}\nSubject: {subject}\n\n{plain_body}")
+            app.logger.warning(f"Failed to send passcode notice to {email}: {e}")
 
 
-@app.route('/api/events')
-def api_events():
-    events = Event.query.order_by(Event.datetime.asc()).all()
-    data = []
-    for e in events:
-        # Handle both Supabase URLs and local file paths
-        poster_url = None
-        if e.poster:
-            if e.poster.startswith('http'):
-                poster_url = e.poster
-            else:
-                poster_url = url_for('static', filename='uploads/' + e.poster)
-        data.append({
-            'id': e.id,
-            'name': e.name,
-            'description': e.description,
-            'datetime': e.datetime.isoformat() if e.datetime else None,
-            'end_datetime': e.end_datetime.isoformat() if e.end_datetime else None,
-            'venue': e.venue,
-            'poster': poster_url
-        })
-    return jsonify(data)
+# Event reminders
+# Events starting within REMINDER_LEAD_HOURS get a ReminderCampaign. The email
+# is rendered once per campaign and only the recipient's name is filled in per
+# attendee. Attendances are sent in id order over one SMTP connection and the
+# cursor is committed after every batch, so an interrupted run picks up where
+# it stopped on the next tick.
+REMINDER_LEAD_HOURS = int(os.environ.get('REMINDER_LEAD_HOURS', 24))
+REMINDER_RATE = float(os.environ.get('REMINDER_RATE', 50))  # Messages per second, 0 = unthrottled
+REMINDER_BATCH_SIZE = 500
+REMINDER_STALE_AFTER = timedelta(minutes=10)  # A sending campaign without a heartbeat this long is resumed
+EMAIL_RECIPIENT_SLOT = '\x00recipient\x00'
 
 
-@app.route('/api/stats')
-def api_stats():
-    """Return platform statistics - total events and attendees."""
-    total_events = Event.query.count()
-    total_attendees = Attendee.query.count()
-    total_rsvps = Attendance.query.count()
-    return jsonify({
-        'total_events': total_events,
-        'total_attendees': total_attendees,
-        'total_rsvps': total_rsvps
-    })
+def _smtp_settings():
+    """Return (host, port, user, password) or None when SMTP is not configured."""
+    settings = (os.environ.get('SMTP_HOST'), int(os.environ.get('SMTP_PORT', 0) or 0),
+                os.environ.get('SMTP_USER'), os.environ.get('SMTP_PASS'))
+    return settings if all(settings) else None
 
 
-@app.route('/api/events/<int:event_id>')
-def api_event_detail(event_id):
-    e = Event.query.get_or_404(event_id)
+def render_email_parts(template_name, **context):
+    """Render an email template once, split around the recipient's name.
+
+    Join the parts with the recipient's name (escaped for HTML) to personalize.
+    """
+    return render_template(template_name, recipient_name=EMAIL_RECIPIENT_SLOT, **context).split(EMAIL_RECIPIENT_SLOT)
+
+
+class SMTPBatchSender:
+    """Send many messages over one SMTP connection, at most `rate` per second."""
+
+    def __init__(self, settings, rate=0):
+        self.settings = settings
+        self.interval = 1.0 / rate if rate > 0 else 0
+        self._smtp = None
+        self._next_send = time.monotonic()
+
+    def _connect(self):
+        host, port, user, password = self.settings
+        self._smtp = smtplib.SMTP(host, port, timeout=30)
+        self._smtp.starttls()
+        self._smtp.login(user, password)
+
+    def send(self, msg):
+        wait = self._next_send - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._next_send = max(self._next_send, time.monotonic()) + self.interval
+
+        if self.settings is None:
+            # not configured — log instead of sending
+            print(f"[EMAIL] To: {msg['To']} Subject: {msg['Subject']}")
+            return
+        if self._smtp is None:
+            self._connect()
+        try:
+            self._smtp.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Providers drop long-lived connections; reconnect once and retry
+            self._connect()
+            self._smtp.send_message(msg)
+
+    def close(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
+
+
+def schedule_reminder_campaigns(now):
+    """Create campaigns for events starting within the reminder window."""
+    due = db.session.query(Event.id).outerjoin(ReminderCampaign, ReminderCampaign.event_id == Event.id).filter(
+        Event.datetime > now,
+        Event.datetime <= now + timedelta(hours=REMINDER_LEAD_HOURS),
+        ReminderCampaign.id.is_(None)).all()
+    for (event_id,) in due:
+        db.session.add(ReminderCampaign(event_id=event_id))
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Another scheduler created them first
+        db.session.rollback()
+        return 0
+    return len(due)
+
+
+def claim_reminder_campaign(campaign_id, now):
+    """Atomically mark a pending (or stalled) campaign as ours to send."""
+    table = ReminderCampaign.__table__
+    result = db.session.execute(table.update().where(
+        table.c.id == campaign_id,
+        db.or_(table.c.status == 'pending',
+               db.and_(table.c.status == 'sending', table.c.heartbeat_at < now - REMINDER_STALE_AFTER))
+    ).values(status='sending', heartbeat_at=now))
+    db.session.commit()
+    return result.rowcount == 1
+
+
+def deliver_reminder_campaign(campaign, sender):
+    """Send the campaign's remaining reminders, checkpointing after each batch."""
+    event = db.session.get(Event, campaign.event_id)
+    if event is None or event.deleted_at is not None:
+        # Deleted since it was scheduled (an event already in the session still
+        # loads); restoring the event schedules a new campaign
+        app.logger.info(f"Reminder campaign {campaign.id} cancelled: event {campaign.event_id} was deleted")
+        campaign.status = 'cancelled'
+        campaign.finished_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        db.session.commit()
+        return campaign
+    if not campaign.total:
+        campaign.total = Attendance.query.filter_by(event_id=event.id).count()
+
+    event_date = event.datetime.strftime('%A, %B %d, %Y')
+    event_time = event.datetime.strftime('%I:%M %p')
+    end_time = event.end_datetime.strftime('%I:%M %p') if event.end_datetime else None
+    context = {
+        'event': event,
+        'event_date': event_date,
+        'time_display': f"{event_time} - {end_time}" if end_time else event_time,
+    }
+    html_parts = render_email_parts('emails/event_reminder.html', **context)
+    text_parts = render_email_parts('emails/event_reminder.txt', **context)
+    subject = f"Reminder: {event.name} is on {event_date}"
+    sender_address = f"ATTENDEEZ <{sender.settings[2]}>" if sender.settings else 'ATTENDEEZ'
+
+    while True:
+        rows = db.session.query(Attendance.id, Attendee.name, Attendee.email).join(Attendee).filter(
+            Attendance.event_id == event.id,
+            Attendance.id > campaign.last_attendance_id
+        ).order_by(Attendance.id).limit(REMINDER_BATCH_SIZE).all()
+        if not rows:
+            break
+        for attendance_id, name, email in rows:
+            msg = EmailMessage()
+            msg['Subject'] = subject
+            msg['From'] = sender_address
+            msg['To'] = email
+            msg.set_content(name.join(text_parts))
+            msg.add_alternative(str(escape(name)).join(html_parts), subtype='html')
+            try:
+                sender.send(msg)
+                campaign.sent += 1
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException) as e:
+                app.logger.warning(f"Reminder to {email} failed: {e}")
+                campaign.failed += 1
+        campaign.last_attendance_id = rows[-1].id
+        campaign.heartbeat_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        db.session.commit()
+
+    campaign.status = 'done'
+    campaign.finished_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    db.session.commit()
+    return campaign
+
+
+def run_reminder_tick(rate=None, now=None):
+    """Schedule due reminder campaigns and deliver any that are unfinished.
+
+    Returns the campaigns delivered during this tick.
+    """
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    schedule_reminder_campaigns(now)
+    campaign_ids = [campaign_id for (campaign_id,) in
+                    db.session.query(ReminderCampaign.id).filter(
+                        ReminderCampaign.status.notin_(('done', 'cancelled')))]
+    sender = SMTPBatchSender(_smtp_settings(), REMINDER_RATE if rate is None else rate)
+    delivered = []
+    try:
+        for campaign_id in campaign_ids:
+            if not claim_reminder_campaign(campaign_id, now):
+                continue
+            campaign = db.session.get(ReminderCampaign, campaign_id)
+            try:
+                delivered.append(deliver_reminder_campaign(campaign, sender))
+            except Exception as e:
+                # Progress up to the last batch is kept; retry on the next tick
+                db.session.rollback()
+                app.logger.error(f"Reminder campaign {campaign_id} interrupted: {e}")
+                campaign.status = 'pending'
+                db.session.commit()
+    finally:
+        sender.close()
+    return delivered
+
+
+@app.cli.command('send-reminders')
+@click.option('--rate', type=float, default=None, help='Messages per second (defaults to REMINDER_RATE).')
+@click.option('--interval', type=int, default=0, help='Keep running and tick every INTERVAL seconds.')
+def send_reminders_command(rate, interval):
+    """Send reminder emails for events starting within REMINDER_LEAD_HOURS."""
+    while True:
+        for campaign in run_reminder_tick(rate=rate):
+            click.echo(f'event {campaign.event_id}: sent {campaign.sent}/{campaign.total}, failed {campaign.failed}')
+        if not interval:
+            break
+        time.sleep(interval)
+
+
+def event_api_dict(e):
+    """Serialize an event (or a row with the same columns) for the JSON API."""
     # Handle both Supabase URLs and local file paths
     poster_url = None
     if e.poster:
@@ -1883,7 +4336,7 @@ def api_event_detail(event_id):
             poster_url = e.poster
         else:
             poster_url = url_for('static', filename='uploads/' + e.poster)
-    data = {
+    return {
         'id': e.id,
         'name': e.name,
         'description': e.description,
@@ -1892,7 +4345,300 @@ def api_event_detail(event_id):
         'venue': e.venue,
         'poster': poster_url
     }
-    return jsonify(data)
+
+
+@app.route('/api/events')
+@edge_cached('events')
+@reads_from_replica
+def api_events():
+    events = db.session.query(*EVENT_CARD_COLUMNS).order_by(Event.datetime.asc()).all()
+    return jsonify([event_api_dict(e) for e in events])
+
+
+def platform_stats():
+    """Event, attendee and RSVP totals, fetched in one round trip."""
+    row = db.session.execute(db.select(
+        db.select(db.func.count(Event.id)).scalar_subquery().label('total_events'),
+        db.select(db.func.count(Attendee.id)).scalar_subquery().label('total_attendees'),
+        db.select(db.func.count(Attendance.id)).join(
+            Event, Event.id == Attendance.event_id).scalar_subquery().label('total_rsvps'),
+    )).one()
+    return row._asdict()
+
+
+@app.route('/api/stats')
+@reads_from_replica
+def api_stats():
+    """Return platform statistics - total events and attendees."""
+    return jsonify(platform_stats())
+
+
+@app.route('/api/events/<int:event_id>')
+@edge_cached('event-{event_id}')
+def api_event_detail(event_id):
+    e = Event.query.get_or_404(event_id)
+    return jsonify(event_api_dict(e))
+
+
+# SPA bootstrap
+# The React app renders a screen from one request: /api/bootstrap returns a
+# page of events with attendee counts and the caller's RSVP for each, platform
+# stats and the signed-in user; /api/events/<id>/full does the same for one
+# event. Each is built from a fixed number of queries however many events are
+# listed. Responses carry an ETag over the encoded body so unchanged payloads
+# revalidate with a 304, and clients sending Accept: application/msgpack get
+# MessagePack instead of JSON.
+BOOTSTRAP_PER_PAGE = 24
+BOOTSTRAP_MAX_PER_PAGE = 100
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+def current_user_api_dict():
+    if not current_user.is_authenticated:
+        return None
+    return {'id': current_user.id, 'name': current_user.name, 'username': current_user.username}
+
+
+def user_rsvp_status(user_id, event_ids):
+    """The user's RSVP and check-in state for each of event_ids, keyed by event id."""
+    if not event_ids:
+        return {}
+    rows = db.session.query(
+        Attendance.event_id, Attendance.id, Attendance.timestamp, Attendance.checked_in, Attendance.check_in_time
+    ).join(Attendee, Attendee.id == Attendance.attendee_id).filter(
+        Attendee.user_id == user_id, Attendance.event_id.in_(event_ids)
+    ).all()
+    return {row.event_id: {
+        'attendance_id': row.id,
+        'rsvp_at': _iso(row.timestamp),
+        'checked_in': bool(row.checked_in),
+        'check_in_time': _iso(row.check_in_time),
+    } for row in rows}
+
+
+def api_payload_response(payload):
+    """Encode payload as JSON or MessagePack (by Accept) with an ETag over the body."""
+    if (MSGPACK_AVAILABLE and request.accept_mimetypes.best_match(
+            ['application/json', MSGPACK_MIMETYPE]) == MSGPACK_MIMETYPE):
+        response = Response(msgpack.packb(payload), mimetype=MSGPACK_MIMETYPE)
+    else:
+        response = Response(app.json.dumps(payload), mimetype='application/json')
+    response.vary.add('Accept')
+    response.set_etag(hashlib.sha1(response.get_data()).hexdigest())
+    if current_user.is_authenticated:
+        # Per-user RSVP state must only be cached by the user's own browser
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+@app.route('/api/bootstrap')
+@edge_cached('events')
+@reads_from_replica
+def api_bootstrap():
+    """Everything the SPA's event list needs. Query params: page, per_page."""
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', BOOTSTRAP_PER_PAGE, type=int), 1), BOOTSTRAP_MAX_PER_PAGE)
+    attendee_count = db.func.count(Attendance.id).label('attendee_count')
+    rows = db.session.query(*EVENT_CARD_COLUMNS, attendee_count).outerjoin(
+        Attendance, Attendance.event_id == Event.id
+    ).group_by(Event.id).order_by(
+        Event.datetime.is_(None), Event.datetime.asc(), Event.id
+    ).offset((page - 1) * per_page).limit(per_page + 1).all()
+    events = rows[:per_page]
+    rsvps = user_rsvp_status(current_user.id, [e.id for e in events]) if current_user.is_authenticated else {}
+    return api_payload_response({
+        'events': [dict(event_api_dict(e), attendee_count=e.attendee_count, my_rsvp=rsvps.get(e.id))
+                   for e in events],
+        'page': page,
+        'per_page': per_page,
+        'has_more': len(rows) > per_page,
+        'stats': platform_stats(),
+        'user': current_user_api_dict(),
+    })
+
+
+@app.route('/api/events/<int:event_id>/full')
+@edge_cached('event-{event_id}')
+@reads_from_replica
+def api_event_full(event_id):
+    """An event with its organizer, attendee count and the caller's RSVP state."""
+    attendee_count = db.func.count(Attendance.id).label('attendee_count')
+    event = db.session.query(
+        *EVENT_CARD_COLUMNS, Event.creator_id, User.name.label('organizer_name'),
+        User.username.label('organizer_username'), attendee_count
+    ).outerjoin(User, User.id == Event.creator_id).outerjoin(
+        Attendance, Attendance.event_id == Event.id
+    ).filter(Event.id == event_id).group_by(Event.id, User.id).first()
+    if event is None:
+        return jsonify({'error': 'Event not found'}), 404
+    rsvps = user_rsvp_status(current_user.id, [event.id]) if current_user.is_authenticated else {}
+    organizer = None
+    if event.creator_id is not None:
+        organizer = {'id': event.creator_id, 'name': event.organizer_name, 'username': event.organizer_username}
+    return api_payload_response(dict(
+        event_api_dict(event),
+        organizer=organizer,
+        attendee_count=event.attendee_count,
+        my_rsvp=rsvps.get(event.id),
+        user=current_user_api_dict(),
+    ))
+
+
+# Event search
+# Full-text search over name, venue and description. SQLite uses an FTS5 table
+# (event_fts, rowid = event id) kept in sync by mapper events; Postgres uses a
+# generated tsvector column with a GIN index, which the database maintains
+# itself. Other databases fall back to LIKE matching.
+SEARCH_PER_PAGE = 20
+SEARCH_MAX_PER_PAGE = 50
+SEARCH_MAX_TERMS = 8
+EVENT_SEARCH_BACKEND = 'like'  # Set by ensure_event_search_index()
+_event_fts = db.table('event_fts', db.column('rowid'))
+_PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(venue, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+def ensure_event_search_index():
+    """Create the search index for the current database and backfill it if empty."""
+    global EVENT_SEARCH_BACKEND
+    dialect = db.engine.dialect.name
+    if dialect == 'sqlite':
+        try:
+            db.session.execute(text(
+                'CREATE VIRTUAL TABLE IF NOT EXISTS event_fts USING fts5('
+                "name, description, venue, tokenize='porter unicode61', prefix='2 3')"))
+        except Exception as e:
+            db.session.rollback()
+            print(f"FTS5 not available, using LIKE search: {e}")
+            return
+        EVENT_SEARCH_BACKEND = 'fts5'
+        if db.session.execute(text('SELECT count(*) FROM event_fts')).scalar() == 0:
+            rebuild_event_search_index()
+    elif dialect == 'postgresql':
+        columns = [col['name'] for col in db.inspect(db.engine).get_columns('event')]
+        if 'search_vector' not in columns:
+            db.session.execute(text(
+                f'ALTER TABLE event ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({_PG_SEARCH_VECTOR}) STORED'))
+            print('Added search_vector column to event')
+        db.session.execute(text(
+            'CREATE INDEX IF NOT EXISTS ix_event_search_vector ON event USING GIN (search_vector)'))
+        EVENT_SEARCH_BACKEND = 'postgres'
+    db.session.execute(text('CREATE INDEX IF NOT EXISTS ix_event_datetime ON event (datetime)'))
+    db.session.commit()
+
+
+def rebuild_event_search_index():
+    """Repopulate the FTS5 table from the event table (SQLite only)."""
+    db.session.execute(text('DELETE FROM event_fts'))
+    db.session.execute(text(
+        "INSERT INTO event_fts (rowid, name, description, venue) "
+        "SELECT id, coalesce(name, ''), coalesce(description, ''), coalesce(venue, '') FROM event"))
+
+
+def _sync_event_fts(connection, target, delete=False):
+    connection.execute(text('DELETE FROM event_fts WHERE rowid = :id'), {'id': target.id})
+    if not delete:
+        connection.execute(text(
+            'INSERT INTO event_fts (rowid, name, description, venue) VALUES (:id, :name, :description, :venue)'),
+            {'id': target.id, 'name': target.name or '', 'description': target.description or '',
+             'venue': target.venue or ''})
+
+
+@sa_event.listens_for(Event, 'after_insert')
+def _index_new_event(mapper, connection, target):
+    if EVENT_SEARCH_BACKEND == 'fts5':
+        _sync_event_fts(connection, target)
+
+
+@sa_event.listens_for(Event, 'after_update')
+def _reindex_event(mapper, connection, target):
+    if EVENT_SEARCH_BACKEND == 'fts5':
+        state = db.inspect(target)
+        if any(state.attrs[name].history.has_changes() for name in ('name', 'description', 'venue')):
+            _sync_event_fts(connection, target)
+
+
+@sa_event.listens_for(Event, 'after_delete')
+def _unindex_event(mapper, connection, target):
+    if EVENT_SEARCH_BACKEND == 'fts5':
+        _sync_event_fts(connection, target, delete=True)
+
+
+def search_events(q=None, start=None, end=None, organizer_id=None, page=1, per_page=SEARCH_PER_PAGE):
+    """Return (events, has_more) matching q and the filters, best matches first.
+
+    Without q, matching events are listed soonest first. Fetches one extra row
+    instead of counting, so deep result sets cost no more than a page.
+    """
+    terms = re.findall(r'\w+', (q or '').lower())[:SEARCH_MAX_TERMS]
+    query = Event.query
+    if terms and EVENT_SEARCH_BACKEND == 'fts5':
+        # Only the last term is a prefix, so results narrow as the user types
+        match = ' '.join(f'"{term}"' for term in terms[:-1]) + f' "{terms[-1]}"*'
+        query = query.join(_event_fts, _event_fts.c.rowid == Event.id).filter(
+            text('event_fts MATCH :match')).params(match=match).order_by(
+            text('bm25(event_fts, 10.0, 1.0, 4.0)'))
+    elif terms and EVENT_SEARCH_BACKEND == 'postgres':
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        query = query.filter(text("event.search_vector @@ to_tsquery('english', :tsquery)")).params(
+            tsquery=tsquery).order_by(text("ts_rank_cd(event.search_vector, to_tsquery('english', :tsquery)) DESC"))
+    elif terms:
+        for term in terms:
+            pattern = f'%{term}%'
+            query = query.filter(db.or_(Event.name.ilike(pattern), Event.description.ilike(pattern),
+                                        Event.venue.ilike(pattern)))
+    if start:
+        query = query.filter(Event.datetime >= start)
+    if end:
+        query = query.filter(Event.datetime < end)
+    if organizer_id:
+        query = query.filter(Event.creator_id == organizer_id)
+    query = query.order_by(Event.datetime.is_(None), Event.datetime.asc(), Event.id)
+
+    rows = query.offset((page - 1) * per_page).limit(per_page + 1).all()
+    return rows[:per_page], len(rows) > per_page
+
+
+@app.route('/api/events/search')
+def api_event_search():
+    """Ranked, paginated event search.
+
+    Query params: q, from, to (ISO dates), organizer (user id), page, per_page.
+    """
+    try:
+        start = datetime.fromisoformat(request.args['from']) if request.args.get('from') else None
+        end = datetime.fromisoformat(request.args['to']) if request.args.get('to') else None
+    except ValueError:
+        return jsonify({'error': 'from/to must be ISO dates'}), 400
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', SEARCH_PER_PAGE, type=int), 1), SEARCH_MAX_PER_PAGE)
+
+    events, has_more = search_events(request.args.get('q'), start, end,
+                                     request.args.get('organizer', type=int), page, per_page)
+    return jsonify({
+        'events': [event_api_dict(e) for e in events],
+        'page': page,
+        'per_page': per_page,
+        'has_more': has_more,
+    })
+
+
+@app.cli.command('rebuild-search-index')
+def rebuild_search_index_command():
+    """Rebuild the SQLite FTS5 event index from scratch."""
+    if EVENT_SEARCH_BACKEND != 'fts5':
+        raise click.ClickException(f'Nothing to rebuild for the {EVENT_SEARCH_BACKEND} search backend')
+    rebuild_event_search_index()
+    db.session.commit()
+    click.echo(f"Indexed {db.session.execute(text('SELECT count(*) FROM event_fts')).scalar()} events")
 
 
 @app.route('/api/rsvp', methods=['POST'])
@@ -1947,9 +4693,12 @@ def api_rsvp():
         
         # Create attendance record
         attendance = Attendance(event_id=event.id, attendee_id=attendee.id)
-        attendance.generate_token()  # Generate unique QR token
         db.session.add(attendance)
+        db.session.flush()
+        attendance.generate_token()  # Signed QR token, needs the new id
+        record_analytics_delta(event.id, 'rsvp', when=attendance.timestamp)
         db.session.commit()
+        publish_live_update(event.id, 'rsvp', attendance)
         
         try:
             send_confirmation_email(attendee, event, attendance)
@@ -2000,9 +4749,43 @@ try:
             if 'creator_id' not in event_columns:
                 db.session.execute(text('ALTER TABLE event ADD COLUMN creator_id INTEGER'))
                 print('Added creator_id column to event')
-            if 'passcode' not in event_columns:
-                db.session.execute(text('ALTER TABLE event ADD COLUMN passcode VARCHAR(64)'))
-                print('Added passcode column to event')
+            if 'passcode_hash' not in event_columns:
+                db.session.execute(text('ALTER TABLE event ADD COLUMN passcode_hash VARCHAR(64)'))
+                print('Added passcode_hash column to event')
+            if 'passcode_cleared_at' not in event_columns:
+                db.session.execute(text('ALTER TABLE event ADD COLUMN passcode_cleared_at TIMESTAMP'))
+                print('Added passcode_cleared_at column to event')
+            if 'passcode' in event_columns:
+                # Hash legacy plaintext passcodes and clear them. Only the newest
+                # event keeps a passcode shared by several; the others are flagged
+                # on My Events and their organizers are emailed to set a new one.
+                legacy = db.session.execute(text(
+                    "SELECT id, passcode FROM event WHERE passcode IS NOT NULL AND passcode != '' ORDER BY id DESC")).all()
+                seen = set(db.session.execute(text(
+                    'SELECT passcode_hash FROM event WHERE passcode_hash IS NOT NULL')).scalars())
+                dropped = []
+                cleared_at = datetime.now(timezone.utc).replace(tzinfo=None)
+                for event_id, passcode in legacy:
+                    digest = hash_passcode(passcode)
+                    if digest in seen:
+                        dropped.append(event_id)
+                        digest = None
+                    seen.add(digest)
+                    db.session.execute(text(
+                        'UPDATE event SET passcode_hash = :digest, passcode = NULL, passcode_cleared_at = :cleared_at '
+                        'WHERE id = :id'), {'digest': digest, 'cleared_at': cleared_at if digest is None else None,
+                                            'id': event_id})
+                if legacy:
+                    print(f'Hashed {len(legacy)} event passcodes')
+                if dropped:
+                    print(f'Cleared duplicate passcodes on events {dropped}; notifying their organizers')
+                    db.session.commit()
+                    notify_cleared_passcodes(dropped)
+            db.session.execute(text('CREATE UNIQUE INDEX IF NOT EXISTS ix_event_passcode_hash ON event (passcode_hash)'))
+            if 'deleted_at' not in event_columns:
+                db.session.execute(text('ALTER TABLE event ADD COLUMN deleted_at TIMESTAMP'))
+                db.session.execute(text('CREATE INDEX IF NOT EXISTS ix_event_deleted_at ON event (deleted_at)'))
+                print('Added deleted_at column to event')
         
         # Check and add columns to attendance table
         if 'attendance' in inspector.get_table_names():
@@ -2019,6 +4802,7 @@ try:
                 print('Added user_id column to attendee')
         
         db.session.commit()
+        ensure_event_search_index()
 except Exception as e:
     print(f"Database init error: {e}")
     import traceback
@@ -0,0 +1,343 @@
+"""Micro-benchmarks for hot request paths.
+
+Runs against a throwaway SQLite database using Flask's test client, so it
+needs no server. Usage:
+
+    python benchmark.py checkin [-n 2000]
+    python benchmark.py import [-n 50000]
+    python benchmark.py badges [-n 4000]
+    python benchmark.py emails [-n 2000]
+    python benchmark.py search [-n 100000]
+    python benchmark.py memory [-n 10000]
+    python benchmark.py servers [-n 2000]
+"""
+import argparse
+import http.client
+import json
+import io
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+# Point the app at a scratch database before it is imported
+_db_dir = tempfile.mkdtemp(prefix='attendeez-bench-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_db_dir, 'bench.db')
+
+from concurrent.futures import ProcessPoolExecutor  # noqa: E402
+
+from app import (app, db, User, Event, Attendee, Attendance, import_attendees_csv,  # noqa: E402
+                 render_badges_pdf, render_confirmation_email, build_confirmation_message,
+                 rebuild_event_search_index, ServerSession, ServerSessionRecord, SqlSessionInterface)
+
+app.config['WTF_CSRF_ENABLED'] = False
+
+
+def _seed_event(n_attendances):
+    """Create an organizer, one event and n attendances; return (user_id, event_id, tokens)."""
+    db.session.query(Attendance).delete()
+    db.session.query(Attendee).delete()
+    db.session.query(Event).delete()
+    db.session.query(User).delete()
+    db.session.commit()
+
+    user = User(name='Bench Organizer', email='bench@example.com')
+    user.set_password('bench')
+    db.session.add(user)
+    db.session.flush()
+    event = Event(name='Bench Event', description='Benchmark event', venue='Bench Hall',
+                  creator_id=user.id, datetime=datetime.now() + timedelta(days=1))
+    db.session.add(event)
+    db.session.flush()
+
+    tokens = []
+    for i in range(n_attendances):
+        attendee = Attendee(name=f'Guest {i}', email=f'guest{i}@example.com', status='Other')
+        db.session.add(attendee)
+        db.session.flush()
+        attendance = Attendance(event_id=event.id, attendee_id=attendee.id)
+        db.session.add(attendance)
+        db.session.flush()
+        tokens.append(attendance.generate_token())
+    db.session.commit()
+    return user.id, event.id, tokens
+
+
+def _timed(label, n, fn):
+    """Run fn, printing wall time, throughput and SQL statements per iteration."""
+    statements = []
+
+    def count(*args):
+        statements.append(1)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', count)
+    start = time.perf_counter()
+    try:
+        fn()
+    finally:
+        elapsed = time.perf_counter() - start
+        event.remove(engine, 'before_cursor_execute', count)
+    print(f"{label:<32} {n:>6} ops  {elapsed:7.3f}s  {n / elapsed:9.1f} ops/s  "
+          f"{len(statements) / n:5.1f} queries/op")
+    return elapsed
+
+
+def bench_checkin(n):
+    """QR check-in throughput with and without the user identity cache."""
+    def run(ttl):
+        app.config['USER_CACHE_TTL'] = ttl
+        with app.app_context():
+            user_id, event_id, tokens = _seed_event(n)
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['_user_id'] = str(user_id)
+            sess['_fresh'] = True
+
+        def scan_all():
+            for token in tokens:
+                resp = client.post('/api/checkin/qr', json={'token': token, 'event_id': event_id})
+                assert resp.status_code == 200, resp.get_data(as_text=True)
+        return _timed(f'qr_checkin (USER_CACHE_TTL={ttl})', n, scan_all)
+
+    baseline = run(0)
+    cached = run(30)
+    print(f"speedup: {baseline / cached:.2f}x")
+
+
+def bench_import(n):
+    """Bulk CSV import of n attendees, half of whom already exist."""
+    with app.app_context():
+        _, event_id, _ = _seed_event(0)
+        db.session.execute(Attendee.__table__.insert(), [
+            {'name': f'Existing {i}', 'email': f'person{i}@example.com', 'status': 'Other'}
+            for i in range(0, n, 2)
+        ])
+        db.session.commit()
+
+    lines = ['name,email,contact,status']
+    lines += [f'Person {i},person{i}@example.com,555-{i:05d},Student' for i in range(n)]
+    data = '\n'.join(lines)
+
+    def run():
+        with app.app_context():
+            summary = import_attendees_csv(db.session.get(Event, event_id), io.StringIO(data))
+        assert summary['created_rsvps'] == n, summary
+    _timed('import_attendees_csv', n, run)
+
+
+def bench_badges(n):
+    """Badge sheet rendering on one worker process versus one per core."""
+    badges = [(f'Guest {i}', 'Student', f'TOKEN{i:027d}') for i in range(n)]
+    out_path = os.path.join(_db_dir, 'badges.pdf')
+    results = {}
+    for workers in sorted({1, os.cpu_count() or 1}):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results[workers] = _timed(f'render_badges_pdf (workers={workers})', n,
+                                      lambda: render_badges_pdf('Bench Event', 'Bench Hall', badges,
+                                                                out_path, executor=pool))
+    if len(results) > 1:
+        print(f"speedup: {results[1] / results[max(results)]:.2f}x")
+
+
+def bench_emails(n):
+    """Confirmation emails rendered per second, with and without the QR attachment."""
+    with app.app_context():
+        _, event_id, _ = _seed_event(n)
+        event = db.session.get(Event, event_id)
+        attendances = Attendance.query.options(db.joinedload(Attendance.attendee)).filter_by(
+            event_id=event_id).all()
+
+        def render():
+            for attendance in attendances:
+                render_confirmation_email(attendance.attendee, event)
+
+        def build():
+            for attendance in attendances:
+                build_confirmation_message(attendance.attendee, event, attendance).as_bytes()
+
+        _timed('render_confirmation_email', n, render)
+        _timed('build_confirmation_message (QR)', n, build)
+
+
+def bench_search(n):
+    """/api/events/search latency over a catalog of n events."""
+    words = ['python', 'jazz', 'summit', 'workshop', 'marathon', 'gala', 'hackathon', 'festival',
+             'startup', 'poetry', 'robotics', 'charity', 'film', 'design', 'yoga', 'chess']
+    venues = ['Nairobi Garage', 'Alliance Hall', 'Karura Forest', 'KICC', 'iHub', 'Sarit Centre']
+    start = datetime(2025, 1, 1)
+    with app.app_context():
+        _seed_event(0)
+        db.session.execute(Event.__table__.insert(), [{
+            'name': f'{words[i % 16].title()} {words[(i * 7) % 16].title()} #{i}',
+            'description': f'A {words[(i * 3) % 16]} event about {words[(i * 5) % 16]} and community {i % 997}',
+            'venue': venues[i % len(venues)],
+            'datetime': start + timedelta(hours=i),
+        } for i in range(n)])
+        rebuild_event_search_index()
+        db.session.commit()
+
+    client = app.test_client()
+    queries = ['python', 'jazz festival', 'hack', 'karura yoga', 'community 42',
+               'python&from=2030-01-01', 'gala&page=50', 'nomatchatall']
+    rounds = 50
+
+    def run():
+        for _ in range(rounds):
+            for q in queries:
+                resp = client.get(f'/api/events/search?q={q}')
+                assert resp.status_code == 200, resp.get_data(as_text=True)
+    elapsed = _timed('/api/events/search', rounds * len(queries), run)
+    print(f"mean latency: {elapsed / (rounds * len(queries)) * 1000:.1f} ms over {n} events")
+
+
+def bench_memory(n):
+    """Peak Python allocation per request for list views over an n-attendee event."""
+    with app.app_context():
+        user_id, event_id, _ = _seed_event(n)
+        db.session.execute(Event.__table__.insert(), [
+            {'name': f'Side Event {i}', 'description': 'Side event', 'venue': 'Annex', 'creator_id': user_id,
+             'datetime': datetime.now() + timedelta(days=i + 1)} for i in range(50)
+        ])
+        db.session.commit()
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(user_id)
+        sess['_fresh'] = True
+        sess['is_admin'] = True
+
+    paths = ['/', '/my-events', f'/event/{event_id}/attendees', '/api/events', '/organizer/analytics']
+    for path in paths:
+        client.get(path)  # Warm up template and statement caches
+        tracemalloc.start()
+        start = time.perf_counter()
+        resp = client.get(path)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert resp.status_code == 200, (path, resp.status_code)
+        print(f"{path:<32} peak {peak / 1024 / 1024:7.2f} MiB  {elapsed * 1000:8.1f} ms")
+
+
+def _start_gunicorn(worker_class, port):
+    env = dict(os.environ, GUNICORN_WORKER_CLASS=worker_class, PORT=str(port))
+    proc = subprocess.Popen(['gunicorn', 'app:app', '--access-logfile', '/dev/null'],
+                            cwd=os.path.dirname(os.path.abspath(__file__)), env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f'gunicorn ({worker_class}) did not start')
+
+
+def _post_json(conn, path, payload, cookie):
+    start = time.perf_counter()
+    conn.request('POST', path, body=json.dumps(payload),
+                 headers={'Content-Type': 'application/json', 'Cookie': cookie})
+    resp = conn.getresponse()
+    resp.read()
+    return resp.status, time.perf_counter() - start
+
+
+def _session_cookie(data):
+    """Cookie header for a logged-in session, stored the way the configured backend expects."""
+    interface = app.session_interface
+    cookie_name = app.config['SESSION_COOKIE_NAME']
+    if not isinstance(interface, SqlSessionInterface):
+        return f"{cookie_name}={interface.get_signing_serializer(app).dumps(data)}"
+    session = ServerSession(data)
+    with app.app_context(), db.engine.begin() as conn:
+        conn.execute(ServerSessionRecord.__table__.insert().values(
+            id=session.sid, data=interface.serializer.dumps(data),
+            expires_at=datetime.utcnow() + app.permanent_session_lifetime))
+    return f"{cookie_name}={interface.get_signer(app).sign(session.sid).decode()}"
+
+
+def bench_servers(n, concurrency=16):
+    """RSVP and QR check-in throughput through gunicorn with each worker class."""
+    classes = ['sync', 'gthread']
+    try:
+        import gevent  # noqa: F401
+        classes.append('gevent')
+    except ImportError:
+        print('gevent not installed - skipping gevent workers')
+
+    for port, worker_class in enumerate(classes, start=8700):
+        with app.app_context():
+            organizer_id, event_id, tokens = _seed_event(n)
+            users = []
+            for i in range(concurrency):
+                user = User(name=f'Client {i}', email=f'client{i}@example.com')
+                user.set_password('bench')
+                db.session.add(user)
+                db.session.flush()
+                users.append(user.id)
+            events = [Event(name=f'RSVP Event {i}', creator_id=organizer_id) for i in range(n // concurrency + 1)]
+            db.session.add_all(events)
+            db.session.commit()
+            event_ids = [e.id for e in events]
+
+        organizer_cookie = _session_cookie({'_user_id': str(organizer_id), '_fresh': True})
+        user_cookies = [_session_cookie({'_user_id': str(user_id), '_fresh': True}) for user_id in users]
+        proc = _start_gunicorn(worker_class, port)
+        try:
+            def rsvp_client(i):
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+                return [_post_json(conn, '/api/rsvp', {'event_id': eid}, user_cookies[i])
+                        for eid in event_ids[:n // concurrency]]
+
+            def checkin_client(i):
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+                return [_post_json(conn, '/api/checkin/qr', {'token': token, 'event_id': event_id}, organizer_cookie)
+                        for token in tokens[i::concurrency]]
+
+            for flow, client in (('rsvp', rsvp_client), ('checkin', checkin_client)):
+                start = time.perf_counter()
+                with ThreadPoolExecutor(concurrency) as pool:
+                    results = [r for batch in pool.map(client, range(concurrency)) for r in batch]
+                elapsed = time.perf_counter() - start
+                latencies = sorted(latency for _, latency in results)
+                errors = sum(1 for status, _ in results if status >= 400)
+                print(f"{worker_class:<8} {flow:<8} {len(results):>6} reqs  {len(results) / elapsed:8.1f} req/s  "
+                      f"p50 {latencies[len(latencies) // 2] * 1000:6.1f} ms  "
+                      f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:6.1f} ms  errors {errors}")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+BENCHMARKS = {
+    'badges': bench_badges,
+    'checkin': bench_checkin,
+    'emails': bench_emails,
+    'import': bench_import,
+    'memory': bench_memory,
+    'search': bench_search,
+    'servers': bench_servers,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('-n', type=int, default=2000, help='number of iterations/rows')
+    args = parser.parse_args(argv)
+    with app.app_context():
+        db.create_all()
+    BENCHMARKS[args.benchmark](args.n)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Gunicorn settings for production.
+
+Gunicorn reads this file automatically when started from the project root:
+
+    gunicorn app:app
+
+Every setting can be tuned with environment variables:
+
+    GUNICORN_WORKER_CLASS   gthread (default), gevent or sync
+    WEB_CONCURRENCY         worker processes (default: one per core, 2n+1 for sync)
+    GUNICORN_THREADS        threads per gthread worker (default 16)
+    GUNICORN_TIMEOUT        seconds before a silent worker is restarted (default 120)
+    GUNICORN_KEEPALIVE      seconds to hold idle keep-alive connections (default 75)
+    PORT                    port to bind (default 8000)
+    BADGE_WORKERS           badge renderer processes per worker (default: cores / workers)
+"""
+import multiprocessing
+import os
+
+# Worker model. gthread serves each request on a thread, so live-feed (SSE)
+# streams and slow SMTP, Supabase and OAuth calls only hold one thread, not a
+# whole process. gevent does the same with greenlets and scales to more open
+# streams, but needs `pip install gevent` (and psycogreen for Postgres).
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+if worker_class == 'gevent':
+    try:
+        # Patch before the app is preloaded so its sockets and locks cooperate
+        from gevent import monkey
+        monkey.patch_all()
+        try:
+            from psycogreen.gevent import patch_psycopg
+            patch_psycopg()
+        except ImportError:
+            print('psycogreen not installed - Postgres queries will block gevent workers')
+    except ImportError:
+        print('gevent not installed - falling back to gthread workers')
+        worker_class = 'gthread'
+
+_cores = multiprocessing.cpu_count()
+workers = int(os.environ.get('WEB_CONCURRENCY', 2 * _cores + 1 if worker_class == 'sync' else _cores))
+threads = int(os.environ.get('GUNICORN_THREADS', 16))  # gthread only; each open SSE stream holds one
+# Every worker gets its own badge renderer pool; share the cores instead of
+# starting cores x cores renderers (read by the app when it is preloaded)
+os.environ.setdefault('BADGE_WORKERS', str(max(1, _cores // workers)))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))  # gevent only
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Import the app once in the master so workers fork with it already loaded
+# (faster boot, shared memory pages). See post_fork for the database pool.
+preload_app = True
+
+# A sync worker is busy for the whole life of an SSE stream, so give it
+# longer than LIVE_FEED_MAX_SECONDS. Async workers heartbeat independently
+# of requests, and this only has to cover slow synchronous PDF exports.
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+if worker_class == 'sync':
+    timeout = max(timeout, int(os.environ.get('LIVE_FEED_MAX_SECONDS', 300)) + 30)
+graceful_timeout = 30
+# Longer than typical load balancer idle timeouts (60s) so the balancer closes first
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 75))
+
+# Recycle workers periodically to bound memory growth
+max_requests = 2000
+max_requests_jitter = 200
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    # Connections opened while preloading (startup migrations) must not be
+    # shared across processes; drop them without closing the parent's sockets
+    from app import app, db
+    with app.app_context():
+        for engine in db.engines.values():  # primary and DATABASE_REPLICA_URL
+            engine.dispose(close=False)
@@ -77,18 +77,14 @@ else:
     else:
         print('creator_id column already exists in event')
     
-    # Add passcode to event table
-    if 'passcode' not in event_columns:
-        cursor.execute('ALTER TABLE event ADD COLUMN passcode VARCHAR(50)')
-        # Generate passcodes for existing events
-        cursor.execute('SELECT id FROM event WHERE passcode IS NULL')
-        events = cursor.fetchall()
-        for event in events:
-            passcode = uuid.uuid4().hex[:8].upper()
-            cursor.execute('UPDATE event SET passcode = ? WHERE id = ?', (passcode, event[0]))
-        print(f'Added passcode column and generated passcodes for {len(events)} existing events')
+    # Add passcode_hash to event table. Events start without a passcode; any
+    # legacy plaintext passcode column is hashed and cleared by the app on startup,
+    # which needs PASSCODE_HASH_KEY/SECRET_KEY.
+    if 'passcode_hash' not in event_columns:
+        cursor.execute('ALTER TABLE event ADD COLUMN passcode_hash VARCHAR(64)')
+        print('Added passcode_hash column to event')
     else:
-        print('passcode column already exists in event')
+        print('passcode_hash column already exists in event')
     
     # Get existing columns for attendance table
     cursor.execute('PRAGMA table_info(attendance)')
@@ -0,0 +1,201 @@
+(function() {
+    const mobileToggle = document.getElementById('mobile-nav-toggle');
+    const mobileNav = document.getElementById('mobile-nav');
+
+    if (!mobileToggle || !mobileNav) return;
+
+    // Add smooth transition styles
+    mobileNav.style.cssText += 'transition: opacity 0.25s ease, transform 0.25s ease; transform-origin: top center;';
+
+    function openMenu() {
+        mobileNav.classList.remove('d-none');
+        mobileNav.style.opacity = '0';
+        mobileNav.style.transform = 'translateY(-10px)';
+        // Trigger reflow for animation
+        mobileNav.offsetHeight;
+        mobileNav.style.opacity = '1';
+        mobileNav.style.transform = 'translateY(0)';
+    }
+
+    function closeMenu() {
+        mobileNav.style.opacity = '0';
+        mobileNav.style.transform = 'translateY(-10px)';
+        setTimeout(() => {
+            mobileNav.classList.add('d-none');
+            mobileNav.style.opacity = '';
+            mobileNav.style.transform = '';
+        }, 250);
+    }
+
+    function isMenuOpen() {
+        return !mobileNav.classList.contains('d-none');
+    }
+
+    // Toggle on button click
+    mobileToggle.addEventListener('click', function(e) {
+        e.stopPropagation();
+        if (isMenuOpen()) {
+            closeMenu();
+        } else {
+            openMenu();
+        }
+    });
+
+    // Close on click anywhere outside
+    document.addEventListener('click', function(e) {
+        if (isMenuOpen() && !mobileNav.contains(e.target) && e.target !== mobileToggle) {
+            closeMenu();
+        }
+    });
+
+    // Close on scroll
+    let lastScrollY = window.scrollY;
+    window.addEventListener('scroll', function() {
+        if (isMenuOpen() && Math.abs(window.scrollY - lastScrollY) > 10) {
+            closeMenu();
+        }
+        lastScrollY = window.scrollY;
+    }, { passive: true });
+
+    // Close on escape key
+    document.addEventListener('keydown', function(e) {
+        if (e.key === 'Escape' && isMenuOpen()) {
+            closeMenu();
+        }
+    });
+
+    // Close when clicking a link inside the menu
+    mobileNav.querySelectorAll('a').forEach(link => {
+        link.addEventListener('click', closeMenu);
+    });
+})();
+
+// Auto-dismiss alerts after 5 seconds
+(function() {
+    const alerts = document.querySelectorAll('.alert-dismissible');
+    alerts.forEach(function(alert) {
+        // Add transition for smooth fade out
+        alert.style.transition = 'opacity 0.4s ease, transform 0.4s ease';
+
+        setTimeout(function() {
+            alert.style.opacity = '0';
+            alert.style.transform = 'translateY(-10px)';
+            setTimeout(function() {
+                alert.remove();
+            }, 400);
+        }, 5000);
+    });
+})();
+
+// Service Worker Registration
+if ('serviceWorker' in navigator) {
+    window.addEventListener('load', function() {
+        // Workers registered from /static/ could only ever control /static/ URLs
+        navigator.serviceWorker.getRegistrations().then(function(registrations) {
+            registrations.forEach(function(registration) {
+                if (registration.scope.endsWith('/static/')) registration.unregister();
+            });
+        });
+        navigator.serviceWorker.register('/sw.js')
+            .then(function(registration) {
+                console.log('ServiceWorker registered:', registration.scope);
+            })
+            .catch(function(err) {
+                console.log('ServiceWorker registration failed:', err);
+            });
+    });
+}
+
+// PWA Install Prompt (iOS + Android)
+(function() {
+    const banner = document.getElementById('pwaInstallBanner');
+    const installBtn = document.getElementById('pwaInstallBtn');
+    const closeBtn = document.getElementById('pwaCloseBtn');
+    const instructions = document.getElementById('installInstructions');
+
+    // Check if already installed or dismissed
+    const isStandalone = window.matchMedia('(display-mode: standalone)').matches || window.navigator.standalone;
+    const isDismissed = localStorage.getItem('pwaInstallDismissed');
+
+    if (isStandalone || isDismissed) return;
+
+    // Detect iOS
+    const isIOS = /iPad|iPhone|iPod/.test(navigator.userAgent) || 
+                  (navigator.platform === 'MacIntel' && navigator.maxTouchPoints > 1);
+    const isSafari = /^((?!chrome|android).)*safari/i.test(navigator.userAgent);
+
+    // Detect Android/Chrome
+    let deferredPrompt = null;
+
+    if (isIOS && isSafari) {
+        // iOS Safari - show manual instructions
+        instructions.innerHTML = 'Tap <svg xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" stroke="currentColor" style="color:#06b6d4"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M8.684 13.342C8.886 12.938 9 12.482 9 12c0-.482-.114-.938-.316-1.342m0 2.684a3 3 0 110-2.684m0 2.684l6.632 3.316m-6.632-6l6.632-3.316m0 0a3 3 0 105.367-2.684 3 3 0 00-5.367 2.684zm0 9.316a3 3 0 105.368 2.684 3 3 0 00-5.368-2.684z" /></svg> Share then "Add to Home Screen"';
+        installBtn.textContent = 'Got it';
+        installBtn.addEventListener('click', function() {
+            banner.classList.remove('show');
+            localStorage.setItem('pwaInstallDismissed', 'true');
+        });
+
+        // Show after a short delay
+        setTimeout(function() {
+            banner.classList.add('show');
+        }, 2000);
+    } else {
+        // Android/Chrome - use beforeinstallprompt
+        window.addEventListener('beforeinstallprompt', function(e) {
+            e.preventDefault();
+            deferredPrompt = e;
+            instructions.textContent = 'Add to your home screen for quick access';
+
+            setTimeout(function() {
+                banner.classList.add('show');
+            }, 2000);
+        });
+
+        installBtn.addEventListener('click', function() {
+            if (deferredPrompt) {
+                deferredPrompt.prompt();
+                deferredPrompt.userChoice.then(function(choiceResult) {
+                    banner.classList.remove('show');
+                    deferredPrompt = null;
+                    if (choiceResult.outcome === 'accepted') {
+                        localStorage.setItem('pwaInstallDismissed', 'true');
+                    }
+                });
+            }
+        });
+    }
+
+    closeBtn.addEventListener('click', function() {
+        banner.classList.remove('show');
+        localStorage.setItem('pwaInstallDismissed', 'true');
+    });
+
+    // Listen for successful install
+    window.addEventListener('appinstalled', function() {
+        banner.classList.remove('show');
+        localStorage.setItem('pwaInstallDismissed', 'true');
+    });
+})();
+
+// Hide Page Loader
+(function() {
+    // Hide loader immediately when DOM is ready
+    function hideLoader() {
+        var loader = document.getElementById('pageLoader');
+        if (loader) {
+            loader.classList.add('hidden');
+            setTimeout(function() { loader.remove(); }, 300);
+        }
+    }
+
+    // Hide on DOM ready or immediately if already loaded
+    if (document.readyState === 'complete' || document.readyState === 'interactive') {
+        hideLoader();
+    } else {
+        document.addEventListener('DOMContentLoaded', hideLoader);
+    }
+
+    // Fallback - hide after 3 seconds max
+    setTimeout(hideLoader, 3000);
+})();
@@ -0,0 +1,176 @@
+// Live search functionality
+const searchInput = document.getElementById('attendeeSearch');
+const tableBody = document.querySelector('.attendees-table tbody');
+const resultsCount = document.querySelector('.results-count');
+const rows = tableBody ? Array.from(tableBody.querySelectorAll('tr')) : [];
+
+function filterTable() {
+    const query = searchInput.value.toLowerCase().trim();
+    let visibleCount = 0;
+
+    rows.forEach(row => {
+        const name = row.cells[1]?.textContent.toLowerCase() || '';
+        const email = row.cells[2]?.textContent.toLowerCase() || '';
+        const contact = row.cells[3]?.textContent.toLowerCase() || '';
+
+        if (name.includes(query) || email.includes(query) || contact.includes(query)) {
+            row.style.display = '';
+            visibleCount++;
+        } else {
+            row.style.display = 'none';
+        }
+    });
+
+    if (resultsCount) {
+        resultsCount.textContent = `Showing ${visibleCount} attendee${visibleCount !== 1 ? 's' : ''}`;
+    }
+}
+
+if (searchInput) {
+    searchInput.addEventListener('input', filterTable);
+}
+
+// Row helpers shared by live updates and bulk actions
+const checkInUrl = pageConfig.checkInUrl.replace(/0$/, '');
+const checkOutUrl = pageConfig.checkOutUrl.replace(/0$/, '');
+
+function esc(value) {
+    const div = document.createElement('div');
+    div.textContent = value == null ? '' : value;
+    return div.innerHTML;
+}
+
+function checkinCell(a) {
+    if (a.checked_in) {
+        return `<div class="checkin-status checked-in">
+            <span class="checkin-badge">
+                <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5"><polyline points="20 6 9 17 4 12"></polyline></svg>
+                Checked In
+            </span>
+            <form method="POST" action="${checkOutUrl}${a.attendance_id}" class="checkin-form">
+                <button type="submit" class="btn-checkout" title="Undo check-in">
+                    <svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M3 12a9 9 0 1 0 9-9 9.75 9.75 0 0 0-6.74 2.74L3 8"></path><path d="M3 3v5h5"></path></svg>
+                </button>
+            </form>
+        </div>`;
+    }
+    return `<form method="POST" action="${checkInUrl}${a.attendance_id}" class="checkin-form">
+        <button type="submit" class="btn-checkin">Check In</button>
+    </form>`;
+}
+
+function recount() {
+    const all = tableBody.querySelectorAll('tr');
+    const checked = tableBody.querySelectorAll('.checkin-badge').length;
+    document.getElementById('statTotal').textContent = all.length;
+    document.getElementById('statCheckedIn').textContent = checked;
+    document.getElementById('statPending').textContent = all.length - checked;
+}
+
+function applyRowState(a) {
+    const row = tableBody.querySelector(`tr[data-attendance-id="${a.attendance_id}"]`);
+    if (!row) return;
+    row.querySelector('.checkin-cell').innerHTML = checkinCell(a);
+}
+
+// Bulk check-in / check-out of selected rows
+(function() {
+    if (!tableBody) return;
+    const bulkBar = document.getElementById('bulkBar');
+    const bulkCount = document.getElementById('bulkCount');
+    const selectAll = document.getElementById('selectAll');
+    const bulkUrl = pageConfig.bulkUrl;
+
+    function selected() {
+        return Array.from(tableBody.querySelectorAll('.row-select:checked'))
+            .filter(box => box.closest('tr').style.display !== 'none');
+    }
+
+    function refreshBar() {
+        const count = selected().length;
+        bulkCount.textContent = count;
+        bulkBar.classList.toggle('active', count > 0);
+    }
+
+    selectAll.addEventListener('change', () => {
+        tableBody.querySelectorAll('tr').forEach(row => {
+            if (row.style.display !== 'none') row.querySelector('.row-select').checked = selectAll.checked;
+        });
+        refreshBar();
+    });
+    tableBody.addEventListener('change', e => {
+        if (e.target.classList.contains('row-select')) refreshBar();
+    });
+
+    document.querySelectorAll('[data-bulk-action]').forEach(button => {
+        button.addEventListener('click', async () => {
+            const ids = selected().map(box => parseInt(box.value, 10));
+            if (!ids.length) return;
+            button.disabled = true;
+            try {
+                const resp = await fetch(bulkUrl, {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json', 'Accept': 'application/json'},
+                    body: JSON.stringify({action: button.dataset.bulkAction, ids: ids})
+                });
+                const data = await resp.json();
+                if (!resp.ok) throw new Error(data.error || 'Bulk update failed');
+                data.results.filter(r => r.result !== 'not_found').forEach(applyRowState);
+                tableBody.querySelectorAll('.row-select:checked').forEach(box => { box.checked = false; });
+                selectAll.checked = false;
+                recount();
+                refreshBar();
+            } catch (err) {
+                alert(err.message);
+            } finally {
+                button.disabled = false;
+            }
+        });
+    });
+})();
+
+// Live updates: patch rows and counters as check-ins and RSVPs arrive
+(function() {
+    if (!window.EventSource || !tableBody) return;
+    const filtered = pageConfig.filtered;
+
+    function updateRow(e) {
+        applyRowState(JSON.parse(e.data));
+        recount();
+    }
+
+    const source = new EventSource(pageConfig.liveUrl);
+    source.addEventListener('check_in', updateRow);
+    source.addEventListener('check_out', updateRow);
+    // Bulk changes arrive as fresh totals rather than per-row updates. Give our
+    // own bulk response a moment to apply, then reload if the table is behind.
+    let connected = false;
+    source.addEventListener('snapshot', e => {
+        if (!connected) { connected = true; return; }
+        if (filtered) return;
+        const totals = JSON.parse(e.data);
+        setTimeout(() => {
+            const checked = tableBody.querySelectorAll('.checkin-badge').length;
+            const behind = totals.total !== tableBody.querySelectorAll('tr').length || totals.checked_in !== checked;
+            if (behind && !tableBody.querySelector('.row-select:checked')) window.location.reload();
+        }, 1000);
+    });
+    source.addEventListener('rsvp', e => {
+        if (filtered) return;
+        const a = JSON.parse(e.data);
+        if (tableBody.querySelector(`tr[data-attendance-id="${a.attendance_id}"]`)) return;
+        const row = document.createElement('tr');
+        row.dataset.attendanceId = a.attendance_id;
+        row.innerHTML = `<td class="select-cell"><input type="checkbox" class="row-select" value="${a.attendance_id}"></td>
+            <td class="attendee-name">${esc(a.name)}</td>
+            <td class="attendee-email">${esc(a.email)}</td>
+            <td>${esc(a.contact) || '—'}</td>
+            <td><span class="status-badge status-${esc((a.status || '').toLowerCase())}">${esc(a.status)}</span></td>
+            <td>${esc((a.timestamp || '').slice(0, 16).replace('T', ' '))}</td>
+            <td class="checkin-cell">${checkinCell(a)}</td>`;
+        tableBody.appendChild(row);
+        rows.push(row);
+        recount();
+        filterTable();
+    });
+})();
@@ -0,0 +1,13 @@
+function handleFileSelect(input) {
+    const label = document.getElementById('uploadLabel');
+    const fileNameEl = document.getElementById('fileName');
+
+    if (input.files && input.files[0]) {
+        const fileName = input.files[0].name;
+        fileNameEl.textContent = fileName;
+        label.classList.add('has-file');
+    } else {
+        fileNameEl.textContent = '';
+        label.classList.remove('has-file');
+    }
+}
@@ -0,0 +1,35 @@
+function handleFileSelect(input) {
+    const label = document.getElementById('uploadLabel');
+    const fileNameEl = document.getElementById('fileName');
+
+    if (input.files && input.files[0]) {
+        const fileName = input.files[0].name;
+        fileNameEl.textContent = fileName;
+        label.classList.add('has-file');
+    } else {
+        fileNameEl.textContent = '';
+        label.classList.remove('has-file');
+    }
+}
+
+function showDeleteModal() {
+    document.getElementById('deleteModal').classList.add('active');
+}
+
+function hideDeleteModal() {
+    document.getElementById('deleteModal').classList.remove('active');
+}
+
+// Close modal on escape key
+document.addEventListener('keydown', function(e) {
+    if (e.key === 'Escape') {
+        hideDeleteModal();
+    }
+});
+
+// Close modal on outside click
+document.getElementById('deleteModal').addEventListener('click', function(e) {
+    if (e.target === this) {
+        hideDeleteModal();
+    }
+});
@@ -0,0 +1,65 @@
+// Live counters: apply check-in/RSVP deltas pushed by the server
+(function() {
+    if (!window.EventSource) return;
+    const totalEl = document.getElementById('liveTotal');
+    const checkedEl = document.getElementById('liveCheckedIn');
+    const rateEl = document.getElementById('liveRate');
+    let total = 0, checked = 0;
+
+    function render() {
+        totalEl.textContent = total;
+        checkedEl.textContent = checked;
+        rateEl.textContent = (total > 0 ? Math.round(checked / total * 100) : 0) + '%';
+    }
+
+    const source = new EventSource(pageConfig.liveUrl);
+    source.addEventListener('snapshot', e => {
+        const data = JSON.parse(e.data);
+        total = data.total;
+        checked = data.checked_in;
+        render();
+    });
+    source.addEventListener('rsvp', () => { total++; render(); });
+    source.addEventListener('check_in', () => { checked++; render(); });
+    source.addEventListener('check_out', () => { checked = Math.max(0, checked - 1); render(); });
+})();
+// Badge sheets are rendered in the background; poll until the PDF is ready
+(function() {
+    const card = document.getElementById('badgeCard');
+    const statusEl = document.getElementById('badgeStatus');
+    let running = false;
+
+    function poll(url) {
+        fetch(url).then(r => r.json()).then(job => {
+            if (job.status === 'done') {
+                running = false;
+                statusEl.textContent = `Badges ready for ${job.total} attendees.`;
+                window.location = job.download_url;
+            } else if (job.status === 'failed' || job.error) {
+                running = false;
+                statusEl.textContent = 'Badge generation failed: ' + (job.error || 'unknown error');
+            } else {
+                const pct = job.chunks_total ? Math.round(job.chunks_done / job.chunks_total * 100) : 0;
+                statusEl.textContent = `Generating badges for ${job.total} attendees… ${pct}%`;
+                setTimeout(() => poll(url), 1000);
+            }
+        });
+    }
+
+    card.addEventListener('click', e => {
+        e.preventDefault();
+        if (running) return;
+        running = true;
+        statusEl.textContent = 'Starting…';
+        fetch(pageConfig.badgesUrl, {method: 'POST'})
+            .then(r => r.json())
+            .then(data => {
+                if (data.error) {
+                    running = false;
+                    statusEl.textContent = data.error;
+                } else {
+                    poll(data.status_url);
+                }
+            });
+    });
+})();
@@ -0,0 +1,150 @@
+let currentShareData = { title: '', url: '' };
+
+function openShareModal(eventName, eventUrl) {
+    currentShareData = { title: eventName, url: eventUrl };
+    const modal = document.getElementById('shareModal');
+    const shareLink = document.getElementById('shareLink');
+    const copyBtn = document.getElementById('copyBtn');
+
+    shareLink.value = eventUrl;
+    copyBtn.textContent = 'Copy';
+    copyBtn.classList.remove('copied');
+
+    // Update share links
+    const encodedUrl = encodeURIComponent(eventUrl);
+    const encodedText = encodeURIComponent(`Check out this event: ${eventName}`);
+
+    document.getElementById('shareWhatsApp').href = `https://wa.me/?text=${encodedText}%20${encodedUrl}`;
+    document.getElementById('shareTwitter').href = `https://twitter.com/intent/tweet?text=${encodedText}&url=${encodedUrl}`;
+    document.getElementById('shareFacebook').href = `https://www.facebook.com/sharer/sharer.php?u=${encodedUrl}`;
+    document.getElementById('shareTelegram').href = `https://t.me/share/url?url=${encodedUrl}&text=${encodedText}`;
+    document.getElementById('shareEmail').href = `mailto:?subject=${encodeURIComponent(eventName)}&body=${encodedText}%20${encodedUrl}`;
+
+    // Show/hide native share button based on support
+    const nativeBtn = document.getElementById('shareNative');
+    if (navigator.share) {
+        nativeBtn.style.display = 'flex';
+    } else {
+        nativeBtn.style.display = 'none';
+    }
+
+    modal.classList.add('active');
+    document.body.style.overflow = 'hidden';
+}
+
+function closeShareModal(event) {
+    if (event && event.target !== event.currentTarget) return;
+    const modal = document.getElementById('shareModal');
+    modal.classList.remove('active');
+    document.body.style.overflow = '';
+}
+
+function copyShareLink() {
+    const shareLink = document.getElementById('shareLink');
+    const copyBtn = document.getElementById('copyBtn');
+
+    navigator.clipboard.writeText(shareLink.value).then(() => {
+        copyBtn.textContent = 'Copied!';
+        copyBtn.classList.add('copied');
+        setTimeout(() => {
+            copyBtn.textContent = 'Copy';
+            copyBtn.classList.remove('copied');
+        }, 2000);
+    }).catch(() => {
+        // Fallback for older browsers
+        shareLink.select();
+        document.execCommand('copy');
+        copyBtn.textContent = 'Copied!';
+        copyBtn.classList.add('copied');
+        setTimeout(() => {
+            copyBtn.textContent = 'Copy';
+            copyBtn.classList.remove('copied');
+        }, 2000);
+    });
+}
+
+function nativeShare() {
+    if (navigator.share) {
+        navigator.share({
+            title: currentShareData.title,
+            text: `Check out this event: ${currentShareData.title}`,
+            url: currentShareData.url
+        }).then(() => {
+            closeShareModal();
+        }).catch((err) => {
+            console.log('Share cancelled');
+        });
+    }
+}
+
+// Close modal on Escape key
+document.addEventListener('keydown', function(e) {
+    if (e.key === 'Escape') {
+        closeShareModal();
+    }
+});
+
+// Search functionality
+const searchInput = document.getElementById('eventSearch');
+const searchClear = document.getElementById('searchClear');
+const eventsGrid = document.getElementById('eventsGrid');
+const noResults = document.getElementById('noResults');
+
+if (searchInput) {
+    searchInput.addEventListener('input', function() {
+        const query = this.value.toLowerCase().trim();
+        filterEvents(query);
+
+        // Show/hide clear button
+        if (query.length > 0) {
+            searchClear.classList.add('visible');
+        } else {
+            searchClear.classList.remove('visible');
+        }
+    });
+}
+
+function filterEvents(query) {
+    if (!eventsGrid) return;
+
+    const cards = eventsGrid.querySelectorAll('.event-card');
+    let visibleCount = 0;
+
+    cards.forEach(card => {
+        const name = card.dataset.name || '';
+        const venue = card.dataset.venue || '';
+        const description = card.dataset.description || '';
+        const organizer = card.dataset.organizer || '';
+        const organizerUsername = card.dataset.organizerUsername || '';
+
+        const matches = name.includes(query) || 
+                       venue.includes(query) || 
+                       description.includes(query) ||
+                       organizer.includes(query) ||
+                       organizerUsername.includes(query);
+
+        if (query === '' || matches) {
+            card.classList.remove('hidden');
+            visibleCount++;
+        } else {
+            card.classList.add('hidden');
+        }
+    });
+
+    // Show/hide no results message
+    if (noResults) {
+        if (visibleCount === 0 && query !== '') {
+            noResults.classList.add('visible');
+        } else {
+            noResults.classList.remove('visible');
+        }
+    }
+}
+
+function clearSearch() {
+    if (searchInput) {
+        searchInput.value = '';
+        searchInput.dispatchEvent(new Event('input'));
+        searchInput.focus();
+    }
+}
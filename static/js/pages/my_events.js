@@ -0,0 +1,80 @@
+// Search functionality
+const searchInput = document.getElementById('eventSearch');
+const searchClear = document.getElementById('searchClear');
+const currentEventsGrid = document.getElementById('currentEventsGrid');
+const pastEventsGrid = document.getElementById('pastEventsGrid');
+const currentEventsTitle = document.getElementById('currentEventsTitle');
+const pastEventsTitle = document.getElementById('pastEventsTitle');
+
+if (searchInput) {
+    searchInput.addEventListener('input', function() {
+        const query = this.value.toLowerCase().trim();
+        filterEvents(query);
+
+        if (query.length > 0) {
+            searchClear.classList.add('visible');
+        } else {
+            searchClear.classList.remove('visible');
+        }
+    });
+}
+
+function filterEvents(query) {
+    let currentVisible = 0;
+    let pastVisible = 0;
+
+    // Filter current events
+    if (currentEventsGrid) {
+        const cards = currentEventsGrid.querySelectorAll('.event-card');
+        cards.forEach(card => {
+            const name = card.dataset.name || '';
+            const venue = card.dataset.venue || '';
+            const matches = name.includes(query) || venue.includes(query);
+
+            if (query === '' || matches) {
+                card.classList.remove('hidden');
+                currentVisible++;
+            } else {
+                card.classList.add('hidden');
+            }
+        });
+    }
+
+    // Filter past events
+    if (pastEventsGrid) {
+        const cards = pastEventsGrid.querySelectorAll('.event-card');
+        cards.forEach(card => {
+            const name = card.dataset.name || '';
+            const venue = card.dataset.venue || '';
+            const matches = name.includes(query) || venue.includes(query);
+
+            if (query === '' || matches) {
+                card.classList.remove('hidden');
+                pastVisible++;
+            } else {
+                card.classList.add('hidden');
+            }
+        });
+    }
+
+    // Show/hide section titles based on visible cards
+    if (currentEventsTitle) {
+        currentEventsTitle.classList.toggle('section-hidden', currentVisible === 0 && query !== '');
+    }
+    if (pastEventsTitle) {
+        pastEventsTitle.classList.toggle('section-hidden', pastVisible === 0 && query !== '');
+    }
+}
+
+function clearSearch() {
+    // A server-side search is active: reload the unfiltered list
+    if (new URLSearchParams(window.location.search).get('q')) {
+        window.location = window.location.pathname;
+        return;
+    }
+    if (searchInput) {
+        searchInput.value = '';
+        searchInput.dispatchEvent(new Event('input'));
+        searchInput.focus();
+    }
+}
@@ -0,0 +1,80 @@
+// Search functionality
+const searchInput = document.getElementById('rsvpSearch');
+const searchClear = document.getElementById('searchClear');
+const currentRsvpsGrid = document.getElementById('currentRsvpsGrid');
+const pastRsvpsGrid = document.getElementById('pastRsvpsGrid');
+const currentRsvpsTitle = document.getElementById('currentRsvpsTitle');
+const pastRsvpsTitle = document.getElementById('pastRsvpsTitle');
+
+if (searchInput) {
+    searchInput.addEventListener('input', function() {
+        const query = this.value.toLowerCase().trim();
+        filterRsvps(query);
+
+        if (query.length > 0) {
+            searchClear.classList.add('visible');
+        } else {
+            searchClear.classList.remove('visible');
+        }
+    });
+}
+
+function filterRsvps(query) {
+    let currentVisible = 0;
+    let pastVisible = 0;
+
+    // Filter current RSVPs
+    if (currentRsvpsGrid) {
+        const cards = currentRsvpsGrid.querySelectorAll('.rsvp-card');
+        cards.forEach(card => {
+            const name = card.dataset.name || '';
+            const venue = card.dataset.venue || '';
+            const matches = name.includes(query) || venue.includes(query);
+
+            if (query === '' || matches) {
+                card.classList.remove('hidden');
+                currentVisible++;
+            } else {
+                card.classList.add('hidden');
+            }
+        });
+    }
+
+    // Filter past RSVPs
+    if (pastRsvpsGrid) {
+        const cards = pastRsvpsGrid.querySelectorAll('.rsvp-card');
+        cards.forEach(card => {
+            const name = card.dataset.name || '';
+            const venue = card.dataset.venue || '';
+            const matches = name.includes(query) || venue.includes(query);
+
+            if (query === '' || matches) {
+                card.classList.remove('hidden');
+                pastVisible++;
+            } else {
+                card.classList.add('hidden');
+            }
+        });
+    }
+
+    // Show/hide section titles based on visible cards
+    if (currentRsvpsTitle) {
+        currentRsvpsTitle.classList.toggle('section-hidden', currentVisible === 0 && query !== '');
+    }
+    if (pastRsvpsTitle) {
+        pastRsvpsTitle.classList.toggle('section-hidden', pastVisible === 0 && query !== '');
+    }
+}
+
+function clearSearch() {
+    // A server-side search is active: reload the unfiltered list
+    if (new URLSearchParams(window.location.search).get('q')) {
+        window.location = window.location.pathname;
+        return;
+    }
+    if (searchInput) {
+        searchInput.value = '';
+        searchInput.dispatchEvent(new Event('input'));
+        searchInput.focus();
+    }
+}
@@ -0,0 +1,71 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const searchInput = document.getElementById('peopleSearch');
+    const searchClear = document.getElementById('searchClear');
+    const peopleGrid = document.getElementById('peopleGrid');
+    const noResults = document.getElementById('noResults');
+
+    if (searchInput && peopleGrid) {
+        searchInput.addEventListener('input', function() {
+            const query = this.value.toLowerCase().trim();
+            filterPeople(query);
+
+            if (searchClear) {
+                searchClear.classList.toggle('visible', query.length > 0);
+            }
+        });
+    }
+
+    function filterPeople(query) {
+        const cards = peopleGrid.querySelectorAll('.person-card');
+        let visibleCount = 0;
+
+        cards.forEach(card => {
+            const name = card.dataset.name || '';
+            const username = card.dataset.username || '';
+            const bio = card.dataset.bio || '';
+
+            const matches = query === '' || 
+                           name.includes(query) || 
+                           username.includes(query) || 
+                           bio.includes(query);
+
+            card.classList.toggle('hidden', !matches);
+            if (matches) visibleCount++;
+        });
+
+        if (noResults) {
+            noResults.classList.toggle('visible', visibleCount === 0 && query !== '');
+        }
+    }
+});
+
+function clearSearch() {
+    // A server-side search is active: reload the unfiltered directory
+    if (new URLSearchParams(window.location.search).get('q')) {
+        window.location = window.location.pathname;
+        return;
+    }
+    const searchInput = document.getElementById('peopleSearch');
+    const searchClear = document.getElementById('searchClear');
+    const peopleGrid = document.getElementById('peopleGrid');
+    const noResults = document.getElementById('noResults');
+
+    if (searchInput) {
+        searchInput.value = '';
+        searchInput.focus();
+    }
+
+    if (searchClear) {
+        searchClear.classList.remove('visible');
+    }
+
+    if (peopleGrid) {
+        peopleGrid.querySelectorAll('.person-card').forEach(card => {
+            card.classList.remove('hidden');
+        });
+    }
+
+    if (noResults) {
+        noResults.classList.remove('visible');
+    }
+}
@@ -0,0 +1,259 @@
+let scanCount = 0;
+let successCount = 0;
+let html5QrCode;
+let isProcessing = false;
+
+// Initialize scanner
+document.addEventListener('DOMContentLoaded', function() {
+    html5QrCode = new Html5Qrcode("qr-reader");
+
+    const config = {
+        fps: 10,
+        qrbox: { width: 250, height: 250 },
+        aspectRatio: 1.0
+    };
+
+    Html5Qrcode.getCameras().then(devices => {
+        if (devices && devices.length) {
+            // Prefer back camera on mobile
+            const backCamera = devices.find(d => d.label.toLowerCase().includes('back')) || devices[0];
+            startScanner(backCamera.id, config);
+        }
+    }).catch(err => {
+        console.log("Error getting cameras:", err);
+        // Show file upload option instead
+        html5QrCode.start(
+            { facingMode: "environment" },
+            config,
+            onScanSuccess,
+            onScanFailure
+        ).catch(err => {
+            document.getElementById('qr-reader').innerHTML = `
+                <div style="text-align: center; padding: 2rem; color: #9ca3af;">
+                    <p>Camera not available. Please use manual input below.</p>
+                </div>
+            `;
+        });
+    });
+});
+
+function startScanner(cameraId, config) {
+    html5QrCode.start(
+        cameraId,
+        config,
+        onScanSuccess,
+        onScanFailure
+    ).catch(err => {
+        console.log("Error starting scanner:", err);
+    });
+}
+
+async function onScanSuccess(decodedText, decodedResult) {
+    if (isProcessing) return;
+    isProcessing = true;
+
+    await processCheckIn(decodedText);
+
+    // Add delay before allowing next scan
+    setTimeout(() => {
+        isProcessing = false;
+    }, 2000);
+}
+
+function onScanFailure(error) {
+    // Silently ignore scan failures (no QR in view)
+}
+
+// Offline ticket validation for signed tokens (base32: version, attendance id,
+// event id, key id, truncated HMAC). Legacy UUID tokens go straight to the server.
+const scannerEventId = pageConfig.eventId;
+const scannerKeys = {};
+let scannerMacBytes = 10;
+
+if (scannerEventId && window.crypto && crypto.subtle) {
+    fetch(pageConfig.keysUrl)
+        .then(r => r.ok ? r.json() : null)
+        .then(async data => {
+            if (!data) return;
+            scannerMacBytes = data.mac_bytes;
+            for (const [kid, hex] of Object.entries(data.keys)) {
+                const raw = new Uint8Array(hex.match(/../g).map(h => parseInt(h, 16)));
+                scannerKeys[kid] = await crypto.subtle.importKey('raw', raw, {name: 'HMAC', hash: 'SHA-256'}, false, ['sign']);
+            }
+        })
+        .catch(() => {});
+}
+
+function base32Decode(text) {
+    const alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567';
+    let bits = 0, value = 0;
+    const out = [];
+    for (const ch of text) {
+        value = (value << 5) | alphabet.indexOf(ch);
+        bits += 5;
+        if (bits >= 8) {
+            out.push((value >>> (bits - 8)) & 0xff);
+            bits -= 8;
+        }
+    }
+    return new Uint8Array(out);
+}
+
+// Returns an error message for a ticket that is provably bad, or null
+async function precheckToken(token) {
+    if (!/^[A-Z2-7]{32}$/.test(token) || !Object.keys(scannerKeys).length) return null;
+    const raw = base32Decode(token);
+    const payload = raw.slice(0, 10);
+    const mac = raw.slice(10);
+    const view = new DataView(payload.buffer);
+    if (view.getUint32(5) !== scannerEventId) return 'This ticket is for a different event';
+    const key = scannerKeys[String(payload[9])];
+    if (!key) return null;  // Unknown key id: let the server decide
+    const expected = new Uint8Array(await crypto.subtle.sign('HMAC', key, payload)).slice(0, scannerMacBytes);
+    const valid = expected.length === mac.length && expected.every((b, i) => b === mac[i]);
+    return valid ? null : 'Invalid QR code - ticket not found';
+}
+
+async function processCheckIn(token) {
+    scanCount++;
+    document.getElementById('scanCount').textContent = scanCount;
+
+    const offlineError = await precheckToken(token);
+    if (offlineError) {
+        showResult('error', offlineError);
+        playSound('error');
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/checkin/qr', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(scannerEventId ? { token: token, event_id: scannerEventId } : { token: token })
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            successCount++;
+            document.getElementById('successCount').textContent = successCount;
+            showResult('success', data.message, data.attendee);
+            playSound('success');
+            addToHistory(data.attendee, true);
+        } else {
+            showResult(data.error.includes('Already') ? 'warning' : 'error', data.error, data.attendee);
+            playSound('error');
+            if (data.attendee) {
+                addToHistory(data.attendee, false, data.error);
+            }
+        }
+    } catch (error) {
+        showResult('error', 'Network error. Please try again.');
+        playSound('error');
+    }
+}
+
+function showResult(type, message, attendee) {
+    const card = document.getElementById('resultCard');
+    const icon = document.getElementById('resultIcon');
+    const msg = document.getElementById('resultMessage');
+    const details = document.getElementById('resultDetails');
+    const info = document.getElementById('attendeeInfo');
+
+    card.className = `result-card show ${type}`;
+
+    if (type === 'success') {
+        icon.textContent = '✓';
+    } else if (type === 'warning') {
+        icon.textContent = '⚠';
+    } else {
+        icon.textContent = '✕';
+    }
+
+    msg.textContent = message;
+
+    if (attendee) {
+        details.innerHTML = `<strong>${attendee.name}</strong>`;
+        info.innerHTML = `
+            <div class="attendee-row">
+                <span class="label">Email</span>
+                <span class="value">${attendee.email}</span>
+            </div>
+            <div class="attendee-row">
+                <span class="label">Event</span>
+                <span class="value">${attendee.event}</span>
+            </div>
+            ${attendee.check_in_time ? `
+            <div class="attendee-row">
+                <span class="label">Time</span>
+                <span class="value">${attendee.check_in_time}</span>
+            </div>
+            ` : ''}
+        `;
+    } else {
+        details.innerHTML = '';
+        info.innerHTML = '';
+    }
+
+    // Auto-hide after 5 seconds
+    setTimeout(() => {
+        card.classList.remove('show');
+    }, 5000);
+}
+
+function playSound(type) {
+    if (!document.getElementById('soundEnabled').checked) return;
+
+    const sound = document.getElementById(type === 'success' ? 'successSound' : 'errorSound');
+    sound.currentTime = 0;
+    sound.play().catch(() => {});
+}
+
+function addToHistory(attendee, success, error) {
+    const list = document.getElementById('historyList');
+
+    // Clear placeholder if exists
+    if (list.children.length === 1 && list.children[0].style.textAlign === 'center') {
+        list.innerHTML = '';
+    }
+
+    const item = document.createElement('div');
+    item.className = `history-item ${success ? '' : 'failed'}`;
+    item.innerHTML = `
+        <div class="history-avatar">${attendee.name ? attendee.name[0].toUpperCase() : '?'}</div>
+        <div class="history-info">
+            <div class="history-name">${attendee.name || 'Unknown'} ${success ? '' : `<span style="color: #ef4444;">(${error || 'Failed'})</span>`}</div>
+            <div class="history-event">${attendee.event || 'Unknown event'}</div>
+        </div>
+        <div class="history-time">${new Date().toLocaleTimeString()}</div>
+    `;
+
+    list.insertBefore(item, list.firstChild);
+
+    // Keep only last 20 items
+    while (list.children.length > 20) {
+        list.removeChild(list.lastChild);
+    }
+}
+
+function manualCheckIn() {
+    const input = document.getElementById('manualCode');
+    const token = input.value.trim();
+
+    if (!token) {
+        showResult('error', 'Please enter a ticket code');
+        return;
+    }
+
+    processCheckIn(token);
+    input.value = '';
+}
+
+// Enter key for manual input
+document.getElementById('manualCode').addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        manualCheckIn();
+    }
+});
@@ -0,0 +1,96 @@
+// Service Worker for ATTENDEEZ PWA, generated from the asset manifest by /sw.js
+const VERSION = {{ version|tojson }};
+const PRECACHE = 'attendeez-precache-' + VERSION;
+const RUNTIME = 'attendeez-runtime';
+const PRECACHE_URLS = {{ precache_urls|tojson }};
+const RUNTIME_MAX_ENTRIES = {{ runtime_max_entries }};
+
+// Fingerprinted builds never change, so they are served cache-first
+const FINGERPRINTED = /^\/static\/dist\/.+\.[0-9a-f]{12}\.\w+$/;
+// Public pages and APIs that are shown from cache while a fresh copy loads
+const REVALIDATED = [/^\/api\/events$/, /^\/api\/events\/\d+$/, /^\/event\/\d+$/];
+// Signing in, out or switching accounts (any method) drops anything cached for the previous user
+const SIGN_OUT = ['/logout', '/login', '/signup', '/login/google/callback',
+                  '/organizer/login', '/organizer/logout', '/admin/logout'];
+
+self.addEventListener('install', event => {
+  event.waitUntil(
+    caches.open(PRECACHE)
+      .then(cache => cache.addAll(PRECACHE_URLS))
+      .then(() => self.skipWaiting())
+  );
+});
+
+// Drop precaches from older versions (and the old attendeez-v1 cache)
+self.addEventListener('activate', event => {
+  event.waitUntil(
+    caches.keys()
+      .then(names => Promise.all(
+        names
+          .filter(name => name.startsWith('attendeez-') && name !== PRECACHE && name !== RUNTIME)
+          .map(name => caches.delete(name))
+      ))
+      .then(() => self.clients.claim())
+  );
+});
+
+function isCacheable(response) {
+  // Only store what the server marked shareable (edge_cached anonymous pages and
+  // static files); pages without Cache-Control may be personalized
+  const cacheControl = response.headers.get('Cache-Control') || '';
+  return response.status === 200 && response.type === 'basic' &&
+    /public|s-maxage/.test(cacheControl) && !/private|no-store/.test(cacheControl);
+}
+
+async function trimCache(cache) {
+  // keys() is in insertion order, so the oldest entries go first
+  const keys = await cache.keys();
+  await Promise.all(keys.slice(0, Math.max(0, keys.length - RUNTIME_MAX_ENTRIES)).map(key => cache.delete(key)));
+}
+
+async function cacheFirst(request) {
+  const cached = await caches.match(request);
+  if (cached) return cached;
+  const response = await fetch(request);
+  if (isCacheable(response)) {
+    const cache = await caches.open(RUNTIME);
+    await cache.put(request, response.clone());
+    trimCache(cache);
+  }
+  return response;
+}
+
+async function staleWhileRevalidate(event) {
+  const cache = await caches.open(RUNTIME);
+  const cached = await cache.match(event.request);
+  const network = fetch(event.request).then(async response => {
+    if (isCacheable(response)) {
+      await cache.put(event.request, response.clone());
+      await trimCache(cache);
+    }
+    return response;
+  });
+  if (cached) {
+    event.waitUntil(network.catch(() => {}));
+    return cached;
+  }
+  return network;
+}
+
+self.addEventListener('fetch', event => {
+  const request = event.request;
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) return;
+
+  if (SIGN_OUT.includes(url.pathname)) {
+    event.waitUntil(caches.delete(RUNTIME));
+    return;
+  }
+  if (request.method !== 'GET') return;
+  if (FINGERPRINTED.test(url.pathname)) {
+    event.respondWith(cacheFirst(request));
+  } else if (!url.search && REVALIDATED.some(pattern => pattern.test(url.pathname))) {
+    event.respondWith(staleWhileRevalidate(event));
+  }
+  // Everything else, including authenticated pages, goes straight to the network
+});